@@ -23,6 +23,8 @@ from evohomeasync2.auth import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from evohomeasync.auth import SessionIdEntryT
     from evohomeasync2.auth import AccessTokenEntryT
 
@@ -59,12 +61,21 @@ class CredentialsManager(AbstractTokenManager, AbstractSessionManager):
     """A credentials manager that uses a file to cache the tokens."""
 
     def __init__(
-        self, *args: Any, cache_file: Path | None = None, **kwargs: Any
+        self,
+        *args: Any,
+        cache_file: Path | None = None,
+        autosave: bool = True,
+        **kwargs: Any,
     ) -> None:
-        """Initialise the credentials manager (for access_token & session_id)."""
+        """Initialise the credentials manager (for access_token & session_id).
+
+        If autosave is False, the credentials are not saved to the cache as they are
+        fetched (e.g. so that many managers can be saved at once, via save_all()).
+        """
         super().__init__(*args, **kwargs)
 
         self._cache_file: Final = cache_file
+        self._autosave: Final = autosave
 
     @property
     def cache_file(self) -> str:
@@ -170,6 +181,9 @@ class CredentialsManager(AbstractTokenManager, AbstractSessionManager):
         Includes the access token expiry datetime, and the refresh token.
         """
 
+        if not self._autosave:
+            return
+
         cache: CacheDataT = await self._read_cache_from_file()
 
         if self.client_id not in cache:
@@ -185,6 +199,9 @@ class CredentialsManager(AbstractTokenManager, AbstractSessionManager):
         Includes the session id expiry datetime.
         """
 
+        if not self._autosave:
+            return
+
         cache: CacheDataT = await self._read_cache_from_file()
 
         if self.client_id not in cache:
@@ -193,3 +210,41 @@ class CredentialsManager(AbstractTokenManager, AbstractSessionManager):
         cache[self.client_id][SZ_SESSION_ID] = self._export_session_id()
 
         await self._write_cache_to_file(self._clean_cache(cache))
+
+    @staticmethod
+    async def load_all(managers: Sequence[CredentialsManager]) -> None:
+        """Load the user entries of many managers from their cache, in one read.
+
+        The managers are expected to share a cache file.
+        """
+
+        if not managers:
+            return
+
+        cache: CacheDataT = await managers[0]._read_cache_from_file()
+
+        for manager in managers:
+            await manager._load_access_token(cache=cache)
+            await manager._load_session_id(cache=cache)
+
+    @staticmethod
+    async def save_all(managers: Sequence[CredentialsManager]) -> None:
+        """Save the user entries of many managers to their cache, in one write.
+
+        The managers are expected to share a cache file. Only valid credentials are
+        saved (e.g. not those of an account that failed to authenticate).
+        """
+
+        if not managers:
+            return
+
+        cache: CacheDataT = await managers[0]._read_cache_from_file()
+
+        for manager in managers:
+            entry = cache.setdefault(manager.client_id, {})
+            if manager.is_token_valid():
+                entry[SZ_ACCESS_TOKEN] = manager._export_access_token()
+            if manager.is_session_valid():
+                entry[SZ_SESSION_ID] = manager._export_session_id()
+
+        await managers[0]._write_cache_to_file(managers[0]._clean_cache(cache))
@@ -7,6 +7,7 @@ import asyncio
 import json
 import logging
 import sys
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
 
 import aiofiles
@@ -15,18 +16,22 @@ import aiohttp
 import asyncclick as click
 import debugpy  # type: ignore[import-untyped]
 
+from evohome.rate_limit import RateLimiter
 from evohomeasync2 import (
+    BackupStatus,
     ControlSystem,
     EvohomeClient,
+    FleetManager,
     HotWater,
     Zone,
     exceptions as exc,
 )
-from evohomeasync2.const import SZ_NAME, SZ_SCHEDULE
+from evohomeasync2.const import SZ_LOCATION_ID, SZ_NAME, SZ_SCHEDULE, SZ_SYSTEM_ID
 
 from .auth import CACHE_FILE, CredentialsManager
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
     from io import TextIOWrapper
 
 # all _DBG_* flags should be False for published code
@@ -36,9 +41,15 @@ DEBUG_ADDR = "0.0.0.0"  # noqa: S104
 DEBUG_PORT = 5679
 
 SZ_CLEANUP: Final = "cleanup"
+SZ_DEBUG: Final = "debug"
 SZ_EVO: Final = "evo"
+SZ_NO_TOKENS: Final = "no_tokens"
+SZ_PASSWORD: Final = "password"  # noqa: S105
+SZ_SCHEDULES: Final = "schedules"
 SZ_USERNAME: Final = "username"
 
+CMD_BACKUP_ALL: Final = "backup-all"  # authenticates its own accounts
+
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -104,19 +115,22 @@ async def _write(output_file: TextIOWrapper | Any, content: str) -> None:
 
 
 @click.group()
-@click.option("--username", "-u", required=True, help="The TCC account username.")
-@click.option("--password", "-p", required=True, help="The TCC account password.")
+@click.option("--username", "-u", help="The TCC account username.")
+@click.option("--password", "-p", help="The TCC account password.")
 @click.option("--no-tokens", "-c", is_flag=True, help="Dont load the token cache.")
 @click.option("--debug", "-d", is_flag=True, help="Enable debug logging.")
 @click.pass_context
 async def cli(
     ctx: click.Context,
-    username: str,
-    password: str,
+    username: str | None,
+    password: str | None,
     no_tokens: bool | None = None,
     debug: bool | None = None,
 ) -> None:
-    """A demonstration CLI for the evohomeasync2 client library."""
+    """A demonstration CLI for the evohomeasync2 client library.
+
+    The username and password are required, except by backup-all.
+    """
 
     if debug:  # Do first
         _start_debugging(wait_for_client=True)
@@ -127,6 +141,7 @@ async def cli(
     ) -> None:
         """Close the web session and save the access token to the cache."""
 
+        token_manager.close()
         await websession.close()
         await token_manager.save_access_token()
 
@@ -137,13 +152,21 @@ async def cli(
         stream=sys.stdout,
     )
 
+    if ctx.invoked_subcommand == CMD_BACKUP_ALL:
+        ctx.obj[SZ_DEBUG] = bool(debug)
+        ctx.obj[SZ_NO_TOKENS] = bool(no_tokens)
+        return
+
+    if not username or not password:
+        raise click.UsageError("Missing option '--username' and/or '--password'.")
+
     websession = aiohttp.ClientSession()  # timeout=aiohttp.ClientTimeout(total=30))
     token_manager = CredentialsManager(
         username, password, websession, cache_file=CACHE_FILE
     )
 
     if not no_tokens:  # then restore cached tokens, if any
-        await token_manager._load_access_token()
+        await token_manager.load_from_cache()
 
     evo = EvohomeClient(token_manager, debug=bool(debug))
 
@@ -277,6 +300,7 @@ async def get_schedules(
 
     print("\r\nclient.py: Starting backup of schedules...")
     evo: EvohomeClient = ctx.obj[SZ_EVO]
+    status: dict[str, BackupStatus] = {}
 
     try:
         tcs = _get_tcs(evo, loc_idx)
@@ -285,14 +309,17 @@ async def get_schedules(
         print("Aborted: No TCS found at location idx: %s", loc_idx)
 
     else:
-        schedules = await tcs.get_schedules()
+        schedules, status = await tcs.backup_schedules()
 
         await _write(output_file, json.dumps(schedules, indent=4) + "\r\n\r\n")
 
+        for zone_id in _failed_backups(status):
+            print(f" - {zone_id}: failed to backup (omitted from the output)")
+
     finally:
         await ctx.obj[SZ_CLEANUP]
 
-    print(" - finished.\r\n")
+    print(f" - finished{' (with errors)' if _failed_backups(status) else ''}.\r\n")
 
 
 @cli.command()
@@ -310,9 +337,18 @@ async def get_schedules(
     type=click.File(),
     help="The input file.",
 )
+@click.option(  # --only-changed
+    "--only-changed",
+    is_flag=True,
+    help="Only upload the schedules that differ from the current schedules.",
+)
 @click.pass_context
 async def set_schedules(
-    ctx: click.Context, loc_idx: int, input_file: TextIOWrapper
+    ctx: click.Context,
+    loc_idx: int,
+    input_file: TextIOWrapper,
+    *,
+    only_changed: bool,
 ) -> None:
     """Upload schedules to a TCS."""
 
@@ -330,7 +366,9 @@ async def set_schedules(
         async with aiofiles.open(input_file.name) as fp:
             content = await fp.read()
 
-        success = await tcs.set_schedules(json.loads(content))
+        success = await tcs.set_schedules(
+            json.loads(content), only_changed=only_changed
+        )
 
     finally:
         await ctx.obj[SZ_CLEANUP]
@@ -338,6 +376,204 @@ async def set_schedules(
     print(f" - finished{'' if success else ' (with errors)'}.\r\n")
 
 
+async def _load_accounts(
+    credentials_file: TextIOWrapper,
+    websession: aiohttp.ClientSession,
+    /,
+    *,
+    no_tokens: bool = False,
+) -> list[CredentialsManager]:
+    """Return a credentials manager for each account of a credentials file.
+
+    The file is a JSON list of {"username": ..., "password": ...}. The token cache is
+    read only once, for all the accounts. The managers don't save their tokens as they
+    are fetched (see CredentialsManager.save_all()).
+    """
+
+    # will TypeError if credentials_file is sys.stdin
+    async with aiofiles.open(credentials_file.name) as fp:
+        accounts: list[dict[str, str]] = json.loads(await fp.read())
+
+    managers = [
+        CredentialsManager(
+            a[SZ_USERNAME],
+            a[SZ_PASSWORD],
+            websession,
+            cache_file=CACHE_FILE,
+            autosave=False,  # else, their concurrent writes to the cache may clash
+        )
+        for a in accounts
+    ]
+
+    if not no_tokens:  # then restore cached tokens, if any
+        await CredentialsManager.load_all(managers)
+
+    return managers
+
+
+def _failed_backups(status: dict[str, BackupStatus]) -> list[str]:
+    """Return the ids of the zones/DHW whose schedules failed to backup."""
+    return [k for k, v in status.items() if v == BackupStatus.FAILED]
+
+
+async def _backup_account(
+    account_id: str,
+    evo: EvohomeClient,
+    write: Callable[[str, ControlSystem, list[Any]], Awaitable[None]],
+) -> tuple[int, int]:
+    """Download the schedules of every TCS of an account.
+
+    Return the number of TCS backed up, and the number of zones/DHW that failed.
+    """
+
+    try:
+        await evo.update(dont_update_status=True)
+    except exc.EvohomeError as err:
+        print(f" - {account_id}: failed to authenticate/get config: {err}")
+        return 0, 0
+
+    count = failed = 0
+
+    for loc in evo.locations:
+        for gwy in loc.gateways:
+            for tcs in gwy.systems:
+                schedules, status = await tcs.backup_schedules()
+
+                for zone_id in _failed_backups(status):
+                    print(f" - {account_id}: {tcs.id}: {zone_id}: failed to backup")
+                    failed += 1
+
+                await write(account_id, tcs, schedules)
+                count += 1
+
+    return count, failed
+
+
+@cli.command(name=CMD_BACKUP_ALL)
+@click.option(  # --credentials-file
+    "--credentials-file",
+    "-f",
+    type=click.File(),
+    required=True,
+    help="A JSON list of accounts, each with a username and a password.",
+)
+@click.option(  # --output-file
+    "--output-file",
+    "-o",
+    type=click.File("w"),
+    default="-",
+    help="The output file (newline-delimited JSON, a line per TCS).",
+)
+@click.option(  # --output-dir
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="The output directory (a file per TCS), instead of the output file.",
+)
+@click.option(  # --concurrency
+    "--concurrency",
+    "-n",
+    callback=_check_positive_int,
+    default=4,
+    type=int,
+    help="The number of accounts to backup at a time (a schedule at a time each).",
+)
+@click.option(  # --rate
+    "--rate",
+    "-r",
+    default=2.0,
+    type=float,
+    help="The maximum number of API requests per second (for all accounts).",
+)
+@click.pass_context
+async def backup_all(
+    ctx: click.Context,
+    *,
+    credentials_file: TextIOWrapper,
+    output_file: TextIOWrapper,
+    output_dir: str | None,
+    concurrency: int,
+    rate: float,
+) -> None:
+    """Download all the schedules of every TCS of many accounts."""
+
+    print("\r\nclient.py: Starting backup of schedules (all accounts)...")
+
+    websession = aiohttp.ClientSession()
+    managers = await _load_accounts(
+        credentials_file, websession, no_tokens=ctx.obj[SZ_NO_TOKENS]
+    )
+
+    fleet = FleetManager(websession)
+    limiter = RateLimiter(rate)
+
+    for manager in managers:
+        fleet.add_account(
+            manager.client_id,
+            manager,
+            max_concurrency=1,  # so at most --concurrency requests are in flight
+            rate_limiter=limiter,  # shared by all the accounts
+            debug=ctx.obj[SZ_DEBUG],
+        )
+
+    lock = asyncio.Lock()  # so that the lines of the output file aren't interleaved
+    fp = None
+    if not output_dir and output_file.name != "<stdout>":
+        fp = await aiofiles.open(output_file.name, "w")
+
+    async def write(account_id: str, tcs: ControlSystem, schedules: list[Any]) -> None:
+        """Write the schedules of a TCS as soon as they are downloaded."""
+
+        if output_dir:
+            path = Path(output_dir) / account_id / tcs.location.id / f"{tcs.id}.json"
+            await aiofiles.os.makedirs(path.parent, exist_ok=True)
+            async with aiofiles.open(path, "w") as out:
+                await out.write(json.dumps(schedules, indent=4) + "\r\n")
+            return
+
+        line = json.dumps(
+            {
+                SZ_USERNAME: account_id,
+                SZ_LOCATION_ID: tcs.location.id,
+                SZ_SYSTEM_ID: tcs.id,
+                SZ_SCHEDULES: schedules,
+            }
+        )
+        async with lock:
+            if fp is None:
+                output_file.write(line + "\n")
+            else:
+                await fp.write(line + "\n")
+                await fp.flush()
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def backup(account_id: str, evo: EvohomeClient) -> tuple[int, int]:
+        async with semaphore:
+            return await _backup_account(account_id, evo, write)
+
+    try:
+        counts = await asyncio.gather(*(backup(k, v) for k, v in fleet.clients.items()))
+
+    finally:
+        if fp is not None:
+            await fp.close()
+        for manager in managers:
+            manager.close()
+        await websession.close()
+
+        try:  # must not mask any exception raised above
+            await CredentialsManager.save_all(managers)
+        except (OSError, ValueError) as err:  # ValueError includes JSONDecodeError
+            print(f" - failed to save the token cache: {err}")
+
+    failed = sum(c[1] for c in counts)
+    print(
+        f" - finished ({sum(c[0] for c in counts)} TCS, {len(managers)} accounts"
+        f"{f', {failed} zones/DHW failed' if failed else ''}).\r\n"
+    )
+
+
 def main() -> None:
     """Run the CLI."""
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from functools import cached_property
 from http import HTTPMethod, HTTPStatus
 from typing import TYPE_CHECKING, Any, Final
@@ -13,16 +16,57 @@ import aiohttp
 import voluptuous as vol
 
 from . import exceptions as exc
-from .const import ERR_MSG_LOOKUP_BASE, HINT_CHECK_NETWORK, HOSTNAME
+from .const import ERR_MSG_LOOKUP_BASE, HINT_CHECK_NETWORK, HOSTNAME, ValidationPolicy
 from .helpers import (
     convert_keys_to_camel_case,
     convert_keys_to_snake_case,
     obscure_secrets,
 )
+from .rate_limit import Priority
+from .retry import retry_after
+from .schema_compiler import compile_schema
 
 if TYPE_CHECKING:
     from aiohttp.typedefs import StrOrURL
 
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
+
+
+# the default for ValidationPolicy.SAMPLED, i.e. validate 1 in every 10 responses
+DEFAULT_SAMPLE_RATE: Final = 10
+
+# the ids in a URL, e.g. location/1234567/status -> location/{id}/status
+_URL_IDS = re.compile(r"\d+")
+
+
+class _RedactedPayload:
+    """A payload to be logged, with its secrets obscured (and optionally truncated).
+
+    The (expensive) redaction is deferred until the log record is emitted, if ever,
+    and is done only once, however many handlers format the record.
+    """
+
+    __slots__ = ("_data", "_max_length", "_text")
+
+    def __init__(self, data: Any, max_length: int | None = None) -> None:
+        self._data = data
+        self._max_length = max_length
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is not None:
+            return self._text
+
+        text = str(obscure_secrets(self._data))
+
+        if self._max_length is not None and len(text) > self._max_length:
+            text = f"{text[: self._max_length]}... ({len(text)} chars)"
+
+        self._text = text
+        self._data = None  # no longer needed
+        return text
+
 
 async def _payload(r: aiohttp.ClientResponse | None) -> str | None:
     if r is None:
@@ -53,14 +97,45 @@ class AbstractAuth(ABC):
         *,
         _hostname: str | None = None,
         logger: logging.Logger | None = None,
+        validation: ValidationPolicy = ValidationPolicy.ALWAYS,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
-        """A class for interacting with the Resideo TCC API."""
+        """A class for interacting with the Resideo TCC API.
+
+        The validation policy determines which GET responses have their schema checked,
+        and sample_rate is the N of ValidationPolicy.SAMPLED (i.e. 1 in N).
+
+        If there is a rate limiter (which may be shared by many clients), requests wait
+        for their host's budget, and PUTs are sent before any waiting GETs.
+
+        If there is a retry policy, requests that fail for a transient reason (e.g. a
+        503) are retried as per the policy; otherwise, they are not retried.
+        """
 
         self.websession: Final = websession
+        self.rate_limiter: Final = rate_limiter
+        self.retry_policy: Final = retry_policy
 
         self._hostname: Final = _hostname or HOSTNAME
         self.logger: Final = logger or logging.getLogger(__name__)
 
+        self._validation: Final = ValidationPolicy(validation)
+        self._sample_rate: Final = max(sample_rate, 1)
+
+        self._response_counts: dict[str, int] = {}  # by URL template
+        self._validation_failures: dict[str, int] = {}  # by URL template
+        self._validated_urls: set[str] = set()  # URL templates with a valid response
+
+        # the GETs in flight, so that identical concurrent GETs can share a response
+        self._pending_gets: dict[
+            tuple[str, bool, int], asyncio.Task[dict[str, Any] | list[dict[str, Any]]]
+        ] = {}
+
+        # the maximum length of a logged payload (None for no limit)
+        self.max_log_length: int | None = None
+
     def __str__(self) -> str:
         """Return a string representation of the object."""
         return f"{self.__class__.__name__}(base='{self.url_base}')"
@@ -75,22 +150,84 @@ class AbstractAuth(ABC):
         """Return the URL base used for GET/PUT requests."""
         return self._url_base
 
+    @property
+    def validation_failures(self) -> dict[str, int]:
+        """Return the number of GET responses that failed validation, by URL template."""
+        return dict(self._validation_failures)
+
+    def _should_validate(self, url_template: str) -> bool:
+        """Return True if a GET response from the URL should be validated."""
+
+        count = self._response_counts.get(url_template, 0)
+        self._response_counts[url_template] = count + 1
+
+        if self._validation == ValidationPolicy.FIRST:
+            return url_template not in self._validated_urls
+        if self._validation == ValidationPolicy.SAMPLED:
+            return count % self._sample_rate == 0
+        return self._validation == ValidationPolicy.ALWAYS
+
     async def get(
-        self, url: StrOrURL, /, schema: vol.Schema | None = None
+        self,
+        url: StrOrURL,
+        /,
+        schema: vol.Schema | None = None,
+        *,
+        convert_keys: bool = True,
     ) -> dict[str, Any] | list[dict[str, Any]]:
         """Call the vendor's TCC API with a GET.
 
-        Optionally checks the response JSON against the expected schema and logs a
-        debug message if it doesn't match.
+        Optionally checks the response JSON against the expected schema (as per the
+        validation policy) and logs a debug message if it doesn't match. If
+        convert_keys is False, the response keys are left in camelCase (and so the
+        schema should be camelCase too).
+
+        Concurrent identical GETs are coalesced into a single request (and validation).
+        The first caller gets the response object, and the others get a (deep) copy of
+        it, so that no caller can corrupt the response of another.
         """
 
-        response = await self.request(HTTPMethod.GET, url)
+        key = (str(url), convert_keys, id(schema))
 
-        if schema:
+        def request_done(task: asyncio.Task[Any]) -> None:
+            self._pending_gets.pop(key, None)
+            if not task.cancelled():  # the exception is retrieved, even if all the
+                task.exception()  # callers were cancelled (so it is never awaited)
+
+        # the request is not cancelled if a caller is, as others may be waiting
+        if (task := self._pending_gets.get(key)) is not None:
+            return deepcopy(await asyncio.shield(task))
+
+        task = asyncio.create_task(self._get(url, schema, convert_keys=convert_keys))
+        self._pending_gets[key] = task
+        task.add_done_callback(request_done)
+
+        return await asyncio.shield(task)
+
+    async def _get(
+        self,
+        url: StrOrURL,
+        schema: vol.Schema | None,
+        /,
+        *,
+        convert_keys: bool,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Call the vendor's TCC API with a GET, and validate the response."""
+
+        response = await self.request(HTTPMethod.GET, url, convert_keys=convert_keys)
+
+        url_template = _URL_IDS.sub("{id}", str(url))
+
+        if schema and self._should_validate(url_template):
             try:
-                response = schema(response)
+                response = compile_schema(schema)(response)
             except vol.Invalid as err:
+                self._validation_failures[url_template] = (
+                    self._validation_failures.get(url_template, 0) + 1
+                )
                 self.logger.debug(f"GET {url}: payload may be invalid: {err}")
+            else:
+                self._validated_urls.add(url_template)
 
         return response  # type: ignore[return-value]
 
@@ -110,25 +247,32 @@ class AbstractAuth(ABC):
 
         if schema:
             try:
-                schema(json)
+                compile_schema(schema)(json)
             except vol.Invalid as err:
                 self.logger.debug(f"PUT {url}: payload may be invalid: {err}")
 
         return await self.request(HTTPMethod.PUT, url, json=json)  # type: ignore[return-value]
 
     async def request(
-        self, method: HTTPMethod, url: StrOrURL, /, **kwargs: Any
+        self,
+        method: HTTPMethod,
+        url: StrOrURL,
+        /,
+        *,
+        convert_keys: bool = True,
+        **kwargs: Any,
     ) -> dict[str, Any] | list[dict[str, Any]] | str | None:
         """Make a request to the vendor's TCC RESTful API.
 
-        Converts keys to/from snake_case as required.
+        Converts keys to/from snake_case as required (unless convert_keys is False, in
+        which case the caller is expected to convert the keys of any GET response).
         """
 
         if method == HTTPMethod.PUT and "json" in kwargs:
             kwargs["json"] = convert_keys_to_camel_case(kwargs["json"])
 
         try:
-            response = await self._make_request(method, url, **kwargs)
+            response = await self._make_request_with_retries(method, url, **kwargs)
         except exc.ApiRequestFailedError as err:
             if err.status != HTTPStatus.UNAUTHORIZED:  # 401
                 # leave it up to higher layers to handle 401s as they can either be
@@ -139,12 +283,15 @@ class AbstractAuth(ABC):
                 )
             raise
 
-        if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug(
-                f"{method} {self.url_base}/{url}: {obscure_secrets(response)}"
-            )
+        self.logger.debug(  # the payload is redacted only if the record is emitted
+            "%s %s/%s: %s",
+            method,
+            self.url_base,
+            url,
+            _RedactedPayload(response, self.max_log_length),
+        )
 
-        if method == HTTPMethod.GET:
+        if method == HTTPMethod.GET and convert_keys:
             return convert_keys_to_snake_case(response)
         return response
 
@@ -155,6 +302,35 @@ class AbstractAuth(ABC):
         This could take the form of an access token, or a session id.
         """
 
+    async def _make_request_with_retries(
+        self, method: HTTPMethod, url: StrOrURL, /, **kwargs: Any
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Make a GET/PUT request, retrying it as per the retry policy (if any)."""
+
+        if (policy := self.retry_policy) is None:
+            return await self._make_request(method, url, **kwargs)
+
+        attempt = 1
+
+        while True:
+            policy.check_circuit(self.hostname, f"{method} {self.url_base}/{url}")
+
+            try:
+                response = await self._make_request(method, url, **kwargs)
+            except exc.ApiRequestFailedError as err:
+                policy.record_result(self.hostname, err)
+
+                if (delay := policy.retry_delay(method, err, attempt)) is None:
+                    raise
+
+                self.logger.warning(f"{err}; retrying in {delay:.1f}s (#{attempt})")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+            else:
+                policy.record_result(self.hostname, None)
+                return response
+
     async def _make_request(
         self, method: HTTPMethod, url: StrOrURL, /, **kwargs: Any
     ) -> dict[str, Any] | list[dict[str, Any]]:
@@ -168,6 +344,8 @@ class AbstractAuth(ABC):
         url = f"{self.url_base}/{url}"
         headers = await self._headers(kwargs.pop("headers", {}))
 
+        await self._wait_for_budget(method)
+
         try:
             rsp = await self._request(method, url, headers=headers, **kwargs)
 
@@ -197,10 +375,15 @@ class AbstractAuth(ABC):
             if hint := ERR_MSG_LOOKUP_BASE.get(err.status):
                 self.logger.error(hint)  # noqa: TRY400
 
+            if err.status == HTTPStatus.TOO_MANY_REQUESTS and self.rate_limiter:
+                self.rate_limiter.throttle(self.hostname)  # the budget was too generous
+
             msg = f"{err.status} {err.message}, response={await _payload(rsp)}"
 
             raise exc.ApiRequestFailedError(
-                f"{method} {url}: {msg}", status=err.status
+                f"{method} {url}: {msg}",
+                status=err.status,
+                retry_after=retry_after(err),
             ) from err
 
         except aiohttp.ClientError as err:  # e.g. ClientConnectionError
@@ -217,6 +400,15 @@ class AbstractAuth(ABC):
             if rsp is not None:
                 rsp.release()
 
+    async def _wait_for_budget(self, method: HTTPMethod) -> None:
+        """Wait until the rate limiter (if any) permits a request to the host."""
+
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(
+                self.hostname,
+                Priority.POLL if method == HTTPMethod.GET else Priority.WRITE,
+            )
+
     async def _request(  # dev/test wrapper
         self, method: HTTPMethod, url: StrOrURL, /, **kwargs: Any
     ) -> aiohttp.ClientResponse:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from enum import StrEnum
 from http import HTTPStatus
 from typing import Final
 
@@ -11,6 +12,16 @@ _DBG_DONT_OBFUSCATE = False  # default is to obfuscate sensitive JSON in debug o
 
 HOSTNAME: Final = "tccna.resideo.com"
 
+
+class ValidationPolicy(StrEnum):
+    """When to validate the schema of a GET response (failures are only logged)."""
+
+    ALWAYS = "always"  # validate every response
+    FIRST = "first"  # validate each URL (template) until its first success
+    SAMPLED = "sampled"  # validate one in every N responses of each URL (template)
+    NEVER = "never"  # don't validate any response
+
+
 REGEX_EMAIL_ADDRESS = re.compile(
     r"^([a-zA-Z0-9_\-\.]+)@([a-zA-Z0-9_\-\.]+)\.([a-zA-Z]{2,5})$"
 )
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from datetime import UTC, datetime as dt, timedelta as td
 from functools import cached_property
 from http import HTTPMethod
 from typing import TYPE_CHECKING, Any, Final
@@ -15,9 +17,122 @@ from .auth import _payload
 from .const import ERR_MSG_LOOKUP_BASE, HINT_CHECK_NETWORK, HOSTNAME
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from aiohttp.typedefs import StrOrURL
 
 
+# the delay before a failed (background) refresh of credentials is retried
+REFRESH_RETRY_DELAY: Final = td(minutes=1)
+
+
+class CredentialRefresher:
+    """Refresh a credential (e.g. an access token) in the background.
+
+    The credential is refreshed the margin before it expires (rather than on demand,
+    when it has already expired). The credential manager supplies the coroutines
+    to fetch and save the credential, and its expiry.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[None]],
+        save: Callable[[], Awaitable[None]],
+        expires: Callable[[], dt],
+        /,
+        *,
+        margin: td | None,
+        logger: logging.Logger,
+    ) -> None:
+        """Initialise the refresher (a margin of None means no refreshes)."""
+
+        self._name: Final = name
+        self._fetch: Final = fetch
+        self._save: Final = save
+        self._expires: Final = expires
+
+        self._margin: Final = margin
+        self._logger: Final = logger
+
+        # only one fetch of the credential at a time (concurrent callers await it)
+        self.lock: Final = asyncio.Lock()
+
+        self._timer: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def schedule(self, retry_after: td | None = None) -> None:
+        """Schedule a refresh of the credential, before it expires.
+
+        The refresh is after retry_after, if given (i.e. a refresh has failed). Does
+        nothing if there is no margin, or if the margin is not less than the remaining
+        lifetime of the credential (it would be refreshed continually): then, the
+        credential will be fetched on demand.
+        """
+
+        self.cancel_timer()
+
+        if self._margin is None:
+            return
+
+        if retry_after is None:
+            delay = self._expires() - self._margin - dt.now(tz=UTC)
+        else:
+            delay = retry_after
+
+        if delay <= td(0):
+            self._logger.debug(f"Not refreshing the {self._name} (margin > TTL)")
+            return
+
+        self._timer = asyncio.get_running_loop().call_later(
+            delay.total_seconds(), self._start
+        )
+
+    def cancel_timer(self) -> None:
+        """Cancel any scheduled refresh (but not one that is in progress)."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def cancel(self) -> None:
+        """Cancel any scheduled refresh, and any refresh that is in progress."""
+
+        self.cancel_timer()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _start(self) -> None:
+        """Start the (background) refresh of the credential."""
+
+        self._timer = None
+        self._task = asyncio.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        """Refresh (and save) the credential, before it expires.
+
+        Any failure is logged rather than raised. A failed refresh is retried while
+        the credential remains valid; after that, it will be fetched on demand.
+        """
+
+        async with self.lock:
+            try:
+                await self._fetch()  # will schedule the next refresh
+
+            except (exc.EvohomeError, OSError) as err:  # OSError includes TimeoutError
+                self._logger.warning(f"Unable to refresh the {self._name}: {err}")
+                if self._expires() > dt.now(tz=UTC) + REFRESH_RETRY_DELAY:
+                    self.schedule(retry_after=REFRESH_RETRY_DELAY)
+                return
+
+            try:
+                await self._save()
+            except (exc.EvohomeError, OSError) as err:
+                self._logger.warning(f"Unable to save the {self._name}: {err}")
+
+
 class CredentialsManagerBase:
     """A base class for managing the credentials used for HTTP authentication."""
 
@@ -30,8 +145,14 @@ class CredentialsManagerBase:
         *,
         _hostname: str | None = None,
         logger: logging.Logger | None = None,
+        refresh_margin: td | None = None,
     ) -> None:
-        """Initialise the session manager."""
+        """Initialise the session manager.
+
+        If `refresh_margin` is not None, then credentials (e.g. access tokens) are
+        refreshed in the background that long before they expire, rather than on
+        demand, when they have already expired.
+        """
 
         self._client_id = client_id
         self._secret = secret
@@ -40,6 +161,14 @@ class CredentialsManagerBase:
         self._hostname: Final = _hostname or HOSTNAME
         self.logger = logger or logging.getLogger(__name__)
 
+        if refresh_margin is not None and refresh_margin < td(0):
+            raise ValueError(
+                f"refresh_margin must not be negative, got {refresh_margin}"
+            )
+
+        self._refresh_margin: Final = refresh_margin
+        self._refreshers: Final[list[CredentialRefresher]] = []
+
         self._was_authenticated = False  # True once credentials are proven valid
 
     def __str__(self) -> str:
@@ -49,6 +178,36 @@ class CredentialsManagerBase:
             f"(client_id='{self.client_id}, hostname='{self.hostname}')"
         )
 
+    def _add_refresher(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[None]],
+        save: Callable[[], Awaitable[None]],
+        expires: Callable[[], dt],
+        /,
+    ) -> CredentialRefresher:
+        """Return a refresher of a credential, to be cancelled by close()."""
+
+        refresher = CredentialRefresher(
+            name,
+            fetch,
+            save,
+            expires,
+            margin=self._refresh_margin,
+            logger=self.logger,
+        )
+        self._refreshers.append(refresher)
+        return refresher
+
+    def close(self) -> None:
+        """Cancel any (background) refresh of the credentials.
+
+        Should be called before the websession is closed.
+        """
+
+        for refresher in self._refreshers:
+            refresher.cancel()
+
     @cached_property
     def client_id(self) -> str:
         """Return the client id used for HTTP authentication."""
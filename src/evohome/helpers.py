@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import re
 from datetime import datetime as dt
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from .const import _DBG_DONT_OBFUSCATE, REGEX_EMAIL_ADDRESS
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Collection
     from datetime import tzinfo
 
 _T = TypeVar("_T")
@@ -71,6 +72,10 @@ def as_local_time(dtm: dt | str, tzinfo: tzinfo) -> dt:
 _STEP_1 = re.compile(r"(.)([A-Z][a-z]+)")
 _STEP_2 = re.compile(r"([a-z0-9])([A-Z])")
 
+# the vendor's APIs use a small vocabulary of keys, so the same strings are converted
+# on every poll: cache the results (the bound allows for unexpected keys)
+_KEY_CACHE_SIZE = 1024
+
 
 def camel_to_pascal(s: str) -> str:
     """Return a string convert (from camelCase) to PascalCase."""
@@ -79,6 +84,7 @@ def camel_to_pascal(s: str) -> str:
     return s[:1].upper() + s[1:]
 
 
+@lru_cache(maxsize=_KEY_CACHE_SIZE)
 def camel_to_snake(s: str) -> str:
     """Return a string converted (from camelCase) to snake_case."""
     if " " in s:
@@ -86,6 +92,7 @@ def camel_to_snake(s: str) -> str:
     return _STEP_2.sub(r"\1_\2", _STEP_1.sub(r"\1_\2", s)).lower()
 
 
+@lru_cache(maxsize=_KEY_CACHE_SIZE)
 def snake_to_camel(s: str) -> str:
     """Return a string converted (from snake_case) to camelCase."""
     if " " in s:
@@ -115,37 +122,91 @@ def convert_keys_to_snake_case(data: _T) -> _T:
     return _convert_keys(data, camel_to_snake)
 
 
-def convert_naive_dtm_strs_to_aware(data: _T, tzinfo: tzinfo) -> _T:
-    """Recursively convert TZ-naive datetime strings to TZ-aware.
+# a cheap check that a string may be an isoformat datetime, e.g. 2023-11-30T22:10:00
+_DTM_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}T")
+
+
+def _convert_naive_dtm_str_to_aware(value: str, tzinfo: tzinfo) -> str:
+    """Convert a TZ-naive datetime string to TZ-aware (other strings are unchanged).
 
     Does not convert TZ-aware strings, even if they're from a different TZ.
-    Used after retrieving JSON from the vendor API.
     """
 
-    def recurse(data_: Any) -> Any:  # noqa: PLR0911
+    try:
+        if value[-1:] == "Z":  # the fast path, e.g. 2023-11-30T22:10:00Z
+            return dt.fromisoformat(value).astimezone(tzinfo).isoformat()
+        d = dt.fromisoformat(value)
+    except ValueError:
+        return value
+
+    if d.tzinfo is None:  # e.g. 2023-11-30T22:10:00
+        return d.replace(tzinfo=tzinfo).isoformat()
+
+    return value  # e.g. 2023-11-30T22:10:00+00:00
+
+
+def _convert_keys_and_dtms(
+    data: Any,
+    tzinfo: tzinfo,
+    key_fnc: Callable[[str], str],
+    dtm_keys: Collection[str] | None,
+) -> Any:
+    """Recursively convert all dict keys, and datetime strings to TZ-aware.
+
+    If dtm_keys is provided, only the values of those (converted) keys are treated as
+    datetimes, otherwise any string that looks like a datetime is converted.
+    """
+
+    def recurse(data_: Any, key: str | None = None) -> Any:
         if isinstance(data_, dict):
-            return {k: recurse(v) for k, v in data_.items()}
+            result = {}
+            for k, v in data_.items():
+                k_ = key_fnc(k)
+                result[k_] = recurse(v, key=k_)
+            return result
 
         if isinstance(data_, list):
-            return [recurse(i) for i in data_]
+            return [recurse(i, key=key) for i in data_]
 
         if not isinstance(data_, str):
             return data_
 
-        try:
-            d = dt.fromisoformat(data_)
-        except ValueError:
+        if dtm_keys is None:  # don't raise a ValueError for every non-datetime string
+            if not _DTM_PREFIX.match(data_):
+                return data_
+
+        elif key not in dtm_keys:
             return data_
 
-        if d.tzinfo is None:  # e.g. 2023-11-30T22:10:00
-            return d.replace(tzinfo=tzinfo).isoformat()
+        return _convert_naive_dtm_str_to_aware(data_, tzinfo)
 
-        if data_.endswith("Z"):  # e.g. 2023-11-30T22:10:00Z
-            return d.astimezone(tzinfo).isoformat()
+    return recurse(data)
 
-        return data_  # e.g. 2023-11-30T22:10:00+00:00
 
-    return recurse(data)  # type:ignore[no-any-return]
+def convert_naive_dtm_strs_to_aware(
+    data: _T, tzinfo: tzinfo, /, *, dtm_keys: Collection[str] | None = None
+) -> _T:
+    """Recursively convert TZ-naive datetime strings to TZ-aware.
+
+    If dtm_keys is provided, only the values of those keys are treated as datetimes,
+    otherwise any string that looks like a datetime is converted.
+
+    Does not convert TZ-aware strings, even if they're from a different TZ.
+    Used after retrieving JSON from the vendor API.
+    """
+    return _convert_keys_and_dtms(data, tzinfo, noop, dtm_keys)  # type: ignore[no-any-return]
+
+
+def convert_keys_and_dtm_strs[T](
+    data: T, tzinfo: tzinfo, dtm_keys: Collection[str]
+) -> T:
+    """Recursively convert all dict keys to snake_case, and datetime strings to TZ-aware.
+
+    Only the values of the (snake_case) dtm_keys are treated as datetimes. Does the
+    work of convert_keys_to_snake_case() & convert_naive_dtm_strs_to_aware() in a
+    single pass. Used after retrieving JSON from the vendor API.
+    """
+    return _convert_keys_and_dtms(data, tzinfo, camel_to_snake, dtm_keys)  # type: ignore[no-any-return]
 
 
 def obfuscate(value: bool | int | str) -> bool | int | str | None:
@@ -0,0 +1,208 @@
+"""evohomeasync provides an async client for the Resideo TCC API.
+
+Provides rate limiting (e.g. of polls, or requests) for the vendor's APIs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class Priority(IntEnum):
+    """The priority class of a request (the lower the value, the higher the priority)."""
+
+    WRITE = 0  # e.g. PUT, a user is waiting for a change of mode/setpoint
+    POLL = 1  # e.g. GET, an update of status
+
+
+class TokenBucket:
+    """A token bucket, to limit the (average) rate of some action, e.g. a poll.
+
+    Tokens are added at a constant rate, up to a maximum (the burst capacity), and
+    each action consumes a token. Callers that acquire a token when none are available
+    are delayed (in the order they acquired them).
+    """
+
+    def __init__(self, rate: float, /, *, capacity: float | None = None) -> None:
+        """Initialise the bucket, which starts full.
+
+        The rate is in tokens per second, and the capacity defaults to the greater of
+        one token, or a second's worth of tokens.
+        """
+
+        if rate <= 0:
+            raise ValueError(f"rate must be greater than 0, got {rate}")
+
+        self._rate = rate
+        self._capacity = max(rate, 1) if capacity is None else capacity
+
+        self._tokens = self._capacity  # can be negative, if tokens are reserved
+        self._last_refill = time.monotonic()
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return f"{self.__class__.__name__}(rate={self._rate}, tokens={self.tokens:.2f})"
+
+    @property
+    def rate(self) -> float:
+        """Return the rate at which tokens are added (per second)."""
+        return self._rate
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of available tokens (negative if any are reserved)."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    def delay(self, tokens: float = 1) -> float:
+        """Return the time (in seconds) until the tokens will be available."""
+        return max(tokens - self.tokens, 0) / self._rate
+
+    def drain(self) -> None:
+        """Consume all the available tokens (e.g. after the server has said to slow down)."""
+        self._refill()
+        self._tokens = min(self._tokens, 0)
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Consume the tokens, if they are available now (without waiting).
+
+        Returns True if the tokens were consumed, otherwise False.
+        """
+
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Consume the tokens, waiting until they are available, if required."""
+
+        self._refill()
+        self._tokens -= tokens  # reserve them, so later callers will wait longer
+
+        if self._tokens >= 0:
+            return
+
+        try:
+            await asyncio.sleep(-self._tokens / self._rate)
+        except asyncio.CancelledError:
+            self._tokens += tokens  # return the reservation
+            raise
+
+
+class _HostLimiter:
+    """Limit the rate of requests to a host, serving waiters in order of priority."""
+
+    def __init__(self, bucket: TokenBucket) -> None:
+        self.bucket = bucket
+
+        self._waiters: list[tuple[Priority, int, asyncio.Future[None]]] = []  # a heap
+        self._counter = itertools.count()  # so waiters of the same priority are FIFO
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    @property
+    def num_waiting(self) -> int:
+        """Return the number of requests that are waiting for a token."""
+        return sum(not f.done() for _, _, f in self._waiters)
+
+    async def acquire(self, priority: Priority) -> None:
+        if not self._waiters and self.bucket.try_acquire():
+            return
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        await fut
+
+    async def _dispatch(self) -> None:
+        """Hand out tokens to the waiters, highest priority first, as they accrue."""
+
+        while self._waiters:
+            await asyncio.sleep(self.bucket.delay())
+
+            while self._waiters and self._waiters[0][2].done():  # i.e. cancelled
+                heapq.heappop(self._waiters)
+
+            if self._waiters and self.bucket.try_acquire():
+                heapq.heappop(self._waiters)[2].set_result(None)
+
+
+class RateLimiter:
+    """Limit the rate of requests to the vendor's servers, with a budget per host.
+
+    Each host has its own token bucket (its budget). When a host's budget is spent,
+    requests wait for it to be replenished, and are then sent in order of priority
+    (e.g. writes before polls), rather than in the order they were made.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        /,
+        *,
+        capacity: float | None = None,
+        budgets: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialise the rate limiter.
+
+        The rate (in requests per second) and the burst capacity are for any host,
+        unless the host has its own rate in budgets (by hostname).
+        """
+
+        self._rate = rate
+        self._capacity = capacity
+        self._budgets = dict(budgets or {})
+
+        if min([rate, *self._budgets.values()]) <= 0:
+            raise ValueError(f"rates must be greater than 0, got {rate}, {budgets}")
+
+        self._hosts: dict[str, _HostLimiter] = {}  # by hostname
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"{self.__class__.__name__}(rate={self._rate}, hosts={list(self._hosts)})"
+        )
+
+    def _host(self, hostname: str) -> _HostLimiter:
+        if (host := self._hosts.get(hostname)) is None:
+            bucket = TokenBucket(
+                self._budgets.get(hostname, self._rate), capacity=self._capacity
+            )
+            host = self._hosts[hostname] = _HostLimiter(bucket)
+        return host
+
+    def remaining(self, hostname: str) -> float:
+        """Return the remaining budget of a host (negative if the host is throttled)."""
+        return self._host(hostname).bucket.tokens
+
+    def num_waiting(self, hostname: str) -> int:
+        """Return the number of requests to a host that are waiting to be sent."""
+        return self._host(hostname).num_waiting
+
+    def throttle(self, hostname: str) -> None:
+        """Spend the remaining budget of a host (e.g. after a 429 response)."""
+        self._host(hostname).bucket.drain()
+
+    async def acquire(self, hostname: str, priority: Priority = Priority.POLL) -> None:
+        """Wait until a request can be sent to a host, as permitted by its budget."""
+        await self._host(hostname).acquire(priority)
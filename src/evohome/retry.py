@@ -0,0 +1,191 @@
+"""evohomeasync provides an async client for the Resideo TCC API.
+
+Provides a policy for retrying requests that failed for a transient reason (e.g. a 503
+or a connection error), with a circuit breaker for each of the vendor's hosts.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import UTC, datetime as dt
+from email.utils import parsedate_to_datetime
+from http import HTTPMethod, HTTPStatus
+from typing import TYPE_CHECKING, Final
+
+import aiohttp
+
+from . import exceptions as exc
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+# the statuses that indicate the request may succeed if retried
+RETRY_STATUSES: Final = (
+    HTTPStatus.TOO_MANY_REQUESTS,  # 429
+    HTTPStatus.INTERNAL_SERVER_ERROR,  # 500
+    HTTPStatus.BAD_GATEWAY,  # 502
+    HTTPStatus.SERVICE_UNAVAILABLE,  # 503
+    HTTPStatus.GATEWAY_TIMEOUT,  # 504
+)
+
+# the statuses that may have a Retry-After header
+_RETRY_AFTER_STATUSES: Final = (
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+)
+
+
+def retry_after(err: aiohttp.ClientResponseError) -> float | None:
+    """Return the delay (in seconds) of a response's Retry-After header, if any.
+
+    The header is either a number of seconds, or an HTTP date.
+    """
+
+    if err.status not in _RETRY_AFTER_STATUSES or not err.headers:
+        return None
+    if (value := err.headers.get("Retry-After")) is None:
+        return None
+
+    if value.strip().isdigit():
+        return float(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((when - dt.now(tz=UTC)).total_seconds(), 0)
+
+
+class _CircuitBreaker:
+    """Track the consecutive transient failures of requests to a host.
+
+    After too many, the circuit is opened (requests fail without being sent), until a
+    timeout has passed, when a single request is allowed to test the host.
+    """
+
+    def __init__(self, threshold: int, timeout: float) -> None:
+        self._threshold = threshold
+        self._timeout = timeout
+
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if requests to the host should not be sent."""
+
+        if self._opened_at is None:
+            return False
+        if time.monotonic() - self._opened_at < self._timeout:
+            return True
+
+        self._opened_at = time.monotonic()  # half-open: allow one (trial) request
+        return False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._threshold:
+            self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+
+class RetryPolicy:
+    """A policy for retrying requests that failed for a transient reason.
+
+    GETs are retried by default, but PUTs only if `retry_puts` is True, as they may
+    have been actioned by the server even though the request appears to have failed.
+
+    Retries are delayed by a jittered exponential backoff, unless the server asked for
+    a specific delay (via a Retry-After header). The policy (and so its circuit
+    breakers) can be shared by many clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_puts: bool = False,
+        statuses: Iterable[int] = RETRY_STATUSES,
+        breaker_threshold: int = 5,
+        breaker_timeout: float = 60.0,
+    ) -> None:
+        """Initialise the retry policy.
+
+        The delays are in seconds. A request is retried up to max_attempts - 1 times,
+        and not at all if the server asks for a delay greater than max_backoff. The
+        circuit breaker of a host opens after breaker_threshold consecutive transient
+        failures, for breaker_timeout seconds.
+        """
+
+        self.max_attempts: Final = max(max_attempts, 1)
+        self.backoff: Final = backoff
+        self.max_backoff: Final = max_backoff
+        self.retry_puts: Final = retry_puts
+        self.statuses: Final = frozenset(statuses)
+
+        self._breaker_threshold = breaker_threshold
+        self._breaker_timeout = breaker_timeout
+        self._breakers: dict[str, _CircuitBreaker] = {}  # by hostname
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return f"{self.__class__.__name__}(max_attempts={self.max_attempts})"
+
+    def _breaker(self, hostname: str) -> _CircuitBreaker:
+        if (breaker := self._breakers.get(hostname)) is None:
+            breaker = self._breakers[hostname] = _CircuitBreaker(
+                self._breaker_threshold, self._breaker_timeout
+            )
+        return breaker
+
+    def is_transient(self, err: exc.ApiRequestFailedError) -> bool:
+        """Return True if the request failed for a reason that may soon pass."""
+
+        if err.status is not None:
+            return err.status in self.statuses
+        return isinstance(err.__cause__, aiohttp.ClientConnectionError)
+
+    def check_circuit(self, hostname: str, request: str) -> None:
+        """Raise an ApiRequestFailedError if the circuit of the host is open."""
+
+        if self._breaker(hostname).is_open:
+            raise exc.ApiRequestFailedError(
+                f"{request}: not sent, as {hostname} has failed too many times"
+            )
+
+    def record_result(
+        self, hostname: str, err: exc.ApiRequestFailedError | None
+    ) -> None:
+        """Record the outcome of a request to a host (err is None if it succeeded)."""
+
+        if err is not None and self.is_transient(err):
+            self._breaker(hostname).record_failure()
+        else:  # even a 401 shows the host is available
+            self._breaker(hostname).record_success()
+
+    def retry_delay(
+        self, method: HTTPMethod, err: exc.ApiRequestFailedError, attempt: int
+    ) -> float | None:
+        """Return the delay (in seconds) before a failed request is retried.
+
+        Returns None if the request should not be retried.
+        """
+
+        if attempt >= self.max_attempts or not self.is_transient(err):
+            return None
+        if method != HTTPMethod.GET and not self.retry_puts:
+            return None
+
+        if err.retry_after is not None:
+            return err.retry_after if err.retry_after <= self.max_backoff else None
+
+        return random.uniform(  # noqa: S311
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
@@ -0,0 +1,282 @@
+"""evohomeasync provides an async client for the Resideo TCC API.
+
+Compiles voluptuous schemas into specialised (and faster) validators.
+
+The compiled validators have the same accept/reject behaviour (and output) as the
+schemas they are compiled from, but avoid voluptuous's generic machinery (e.g. the
+building of error paths) when a value is valid. When a value is invalid, the schema
+itself is called, so that the voluptuous exception (and its message) is identical.
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Mapping
+from typing import Any, Final
+
+import voluptuous as vol
+
+_Validator = Callable[[Any], Any]
+
+_PRIMITIVE_TYPES: Final = (*vol.primitive_types, type(None))
+
+
+class _Invalid(Exception):  # noqa: N818
+    """The value is invalid (as per a compiled validator)."""
+
+    def __init__(self, deep: bool) -> None:  # noqa: FBT001
+        super().__init__()
+        self.deep = deep  # True if invalid below the validator's node (e.g. dict value)
+
+
+class _UnsupportedError(Exception):
+    """The schema contains a node that can't be compiled."""
+
+
+# schemas are (usually) module constants, so the cache is not bounded
+_COMPILED: dict[int, tuple[vol.Schema, _Validator]] = {}
+
+
+def compile_schema(schema: vol.Schema) -> _Validator:
+    """Return a compiled validator for a schema (the schema itself, if unsupported).
+
+    The validator is compiled on first use, and cached thereafter.
+    """
+
+    if (entry := _COMPILED.get(id(schema))) and entry[0] is schema:
+        return entry[1]
+
+    try:
+        fnc = _compile_schema(schema)
+    except _UnsupportedError:
+        validator: _Validator = schema
+
+    else:
+
+        def validator(data: Any) -> Any:
+            try:
+                return fnc(data)
+            except _Invalid:
+                return schema(data)  # will raise the appropriate vol.Invalid
+
+    _COMPILED[id(schema)] = (schema, validator)
+    return validator
+
+
+def _compile_schema(schema: vol.Schema) -> _Validator:
+    """Compile a schema (but not some other callable, e.g. a mock)."""
+
+    if not isinstance(schema, vol.Schema):
+        raise _UnsupportedError
+    return _compile(schema, vol.PREVENT_EXTRA, False)  # noqa: FBT003
+
+
+def _compile(node: Any, extra: int, required: bool) -> _Validator:  # noqa: C901, FBT001, PLR0911
+    """Compile a node of a schema, as would voluptuous (but without error paths)."""
+
+    if node is vol.Extra or node is vol.Self:
+        raise _UnsupportedError
+
+    if isinstance(node, vol.Schema):  # is callable, so its own extra, required, etc.
+        return _compile(node.schema, node.extra, node.required)
+
+    if type(node) in (vol.Any, vol.All) and node.discriminant is None:
+        return _compile_sub_validators(node, extra)
+
+    if hasattr(node, "__voluptuous_compile__") or isinstance(node, vol.Object):
+        raise _UnsupportedError
+
+    if isinstance(node, Mapping):
+        return _compile_mapping(node, extra, required)
+
+    if isinstance(node, list):
+        return _compile_list(node, extra, required)
+
+    if isinstance(node, tuple | set | frozenset):
+        raise _UnsupportedError
+
+    if inspect.isclass(node):
+        return _compile_instance(node)
+
+    if callable(node):
+        return _compile_callable(node)
+
+    if type(node) in _PRIMITIVE_TYPES:
+        return _compile_value(node)
+
+    raise _UnsupportedError
+
+
+def _compile_keys(
+    schema: Mapping[Any, Any],
+    extra: int,
+    required: bool,  # noqa: FBT001
+) -> tuple[dict[Any, tuple[_Validator, bool]], tuple[type, _Validator] | None]:
+    """Compile the keys (and their values) of a mapping node."""
+
+    by_key: dict[Any, tuple[_Validator, bool]] = {}  # key: (validator, is required)
+    wildcards: list[tuple[type, _Validator]] = []  # e.g. {str: object}
+
+    for key, value in schema.items():
+        fnc = _compile(value, extra, required)
+
+        if type(key) in (vol.Required, vol.Optional):
+            if not isinstance(key.default, vol.Undefined):
+                raise _UnsupportedError
+            if type(key.schema) not in _PRIMITIVE_TYPES:
+                raise _UnsupportedError
+            by_key[key.schema] = (fnc, type(key) is vol.Required)
+
+        elif type(key) in _PRIMITIVE_TYPES:
+            by_key[key] = (fnc, required)
+
+        elif inspect.isclass(key) and not required:
+            wildcards.append((key, fnc))
+
+        else:
+            raise _UnsupportedError
+
+    if len(wildcards) > 1:  # would need to be tried in voluptuous's order
+        raise _UnsupportedError
+
+    return by_key, (wildcards[0] if wildcards else None)
+
+
+def _compile_mapping(
+    schema: Mapping[Any, Any],
+    extra: int,
+    required: bool,  # noqa: FBT001
+) -> _Validator:
+    """Compile a mapping node (i.e. a dict)."""
+
+    by_key, wildcard = _compile_keys(schema, extra, required)
+
+    num_required = sum(is_required for _, is_required in by_key.values())
+
+    def validate_mapping(data: Any) -> Any:
+        if not isinstance(data, dict):
+            raise _Invalid(False)  # noqa: FBT003
+
+        out = data.__class__()
+        num_found = 0
+
+        for key, value in data.items():
+            if (entry := by_key.get(key)) is None:
+                if wildcard and isinstance(key, wildcard[0]):
+                    entry = (wildcard[1], False)
+                elif extra == vol.ALLOW_EXTRA:
+                    out[key] = value
+                    continue
+                elif extra == vol.REMOVE_EXTRA:
+                    continue
+                else:  # i.e. PREVENT_EXTRA
+                    raise _Invalid(True)  # noqa: FBT003
+
+            try:
+                out[key] = entry[0](value)
+            except _Invalid:
+                raise _Invalid(True) from None  # noqa: FBT003
+            num_found += entry[1]
+
+        if num_found != num_required:  # a required key is missing
+            raise _Invalid(True)  # noqa: FBT003
+
+        return out
+
+    return validate_mapping
+
+
+def _compile_list(schema: list[Any], extra: int, required: bool) -> _Validator:  # noqa: FBT001
+    """Compile a list node (each value must be valid against any one of its nodes)."""
+
+    if not schema:
+        raise _UnsupportedError
+
+    fncs = [_compile(s, extra, required) for s in schema]
+
+    def validate_list(data: Any) -> Any:
+        if not isinstance(data, list):
+            raise _Invalid(False)  # noqa: FBT003
+
+        out = []
+
+        for value in data:
+            for fnc in fncs:
+                try:
+                    out.append(fnc(value))
+                    break
+                except _Invalid as err:
+                    if err.deep:  # voluptuous won't try the remaining nodes
+                        raise _Invalid(True) from None  # noqa: FBT003
+            else:
+                raise _Invalid(True)  # noqa: FBT003
+
+        return type(data)(out)
+
+    return validate_list
+
+
+def _compile_sub_validators(node: vol.Any | vol.All, extra: int) -> _Validator:
+    """Compile an Any or All node (sub-validators inherit the node's required)."""
+
+    fncs = [_compile(v, extra, node.required) for v in node.validators]
+    has_msg = node.msg is not None  # if so, errors are at the node's level
+
+    if type(node) is vol.All:
+
+        def validate_all(data: Any) -> Any:
+            try:
+                for fnc in fncs:
+                    data = fnc(data)
+            except _Invalid as err:
+                raise _Invalid(err.deep and not has_msg) from None
+            return data
+
+        return validate_all
+
+    def validate_any(data: Any) -> Any:
+        deep = False
+        for fnc in fncs:
+            try:
+                return fnc(data)
+            except _Invalid as err:
+                deep = deep or err.deep
+        raise _Invalid(deep and not has_msg)
+
+    return validate_any
+
+
+def _compile_instance(node: type) -> _Validator:
+    """Compile a type node (e.g. str, float)."""
+
+    def validate_instance(data: Any) -> Any:
+        if not isinstance(data, node):
+            raise _Invalid(False)  # noqa: FBT003
+        return data
+
+    return validate_instance
+
+
+def _compile_callable(node: Callable[[Any], Any]) -> _Validator:
+    """Compile a callable node (e.g. vol.Match, vol.Range, or a function)."""
+
+    def validate_callable(data: Any) -> Any:
+        try:
+            return node(data)
+        except ValueError:
+            raise _Invalid(False) from None  # noqa: FBT003
+        except vol.Invalid as err:
+            raise _Invalid(bool(err.path)) from None
+
+    return validate_callable
+
+
+def _compile_value(node: Any) -> _Validator:
+    """Compile a literal node (e.g. True, "notUsed")."""
+
+    def validate_value(data: Any) -> Any:
+        if data != node:
+            raise _Invalid(False)  # noqa: FBT003
+        return data
+
+    return validate_value
@@ -11,6 +11,8 @@ from datetime import UTC, datetime as dt, timedelta as td
 
 import aiohttp
 
+from evohome.const import ValidationPolicy
+
 from .auth import AbstractSessionManager
 from .entities import ControlSystem, Gateway, HotWater, Location, Zone
 from .exceptions import (
@@ -119,6 +121,7 @@ class EvohomeClientOld(EvohomeClient):
 __all__ = [  # noqa: RUF022
     "EvohomeClient",
     "AbstractSessionManager",
+    "ValidationPolicy",
     #
     "Location",
     "Gateway",
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime as dt, timedelta as td
 from typing import TYPE_CHECKING, Any, Final, TypedDict
 
 import voluptuous as vol
 
-from evohome.auth import AbstractAuth
-from evohome.const import HEADERS_BASE, HEADERS_CRED, HINT_BAD_CREDS
+from evohome.auth import DEFAULT_SAMPLE_RATE, AbstractAuth
+from evohome.const import HEADERS_BASE, HEADERS_CRED, HINT_BAD_CREDS, ValidationPolicy
 from evohome.credentials import CredentialsManagerBase
 from evohome.helpers import convert_keys_to_snake_case
 
@@ -17,11 +18,12 @@ from . import exceptions as exc
 from .schemas import TCC_POST_USR_SESSION
 
 if TYPE_CHECKING:
-    import logging
-
     import aiohttp
     from aiohttp.typedefs import StrOrURL
 
+    from evohome.rate_limit import RateLimiter
+    from evohome.retry import RetryPolicy
+
     from .schemas import EvoSessionDictT, EvoUserAccountDictT, TccSessionResponseT
 
 
@@ -62,12 +64,26 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         *,
         _hostname: str | None = None,
         logger: logging.Logger | None = None,
+        refresh_margin: td | None = None,
     ) -> None:
         """Initialise the session manager."""
 
         super().__init__(
-            client_id, secret, websession, _hostname=_hostname, logger=logger
+            client_id,
+            secret,
+            websession,
+            _hostname=_hostname,
+            logger=logger,
+            refresh_margin=refresh_margin,
         )
+
+        self._session_id_refresher = self._add_refresher(
+            "session_id",
+            self.fetch_session_id,
+            self.save_session_id,
+            lambda: self._session_id_expires,
+        )
+
         self._clear_session_id()  # initialise the attrs
 
     def _clear_session_id(self) -> None:
@@ -76,6 +92,8 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         self._session_id = ""
         self._session_id_expires = dt.min.replace(tzinfo=UTC)  # don't need local TZ
 
+        self._session_id_refresher.cancel_timer()  # no point refreshing it now
+
     @property
     def session_id(self) -> str:
         """Return the session id."""
@@ -93,11 +111,14 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         """Return a valid session id.
 
         If required, fetch (and save) a new session id via the vendor's web API.
+        Concurrent callers will share a single fetch, rather than each making their own.
         """
 
         if not self.is_session_valid():  # although may be rejected for other reasons
-            await self.fetch_session_id()
-            await self.save_session_id()
+            async with self._session_id_refresher.lock:
+                if not self.is_session_valid():  # may have been fetched whilst waiting
+                    await self.fetch_session_id()
+                    await self.save_session_id()
 
         return self.session_id
 
@@ -131,6 +152,8 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         self.logger.debug(f" - session_id_expires = {self.session_id_expires}")
         self.logger.debug(f" - user_info = {self._user_info}")
 
+        self._session_id_refresher.schedule()
+
     async def _fetch_session_id(self, credentials: dict[str, str]) -> None:
         """Obtain an session id using the supplied credentials.
 
@@ -146,13 +169,14 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
             data=credentials,  # NOTE: is camelCase
         )
 
-        try:  # the dict _should_ be the expected schema...
-            self.logger.debug(
-                f"POST {url}: {TCC_POST_USR_SESSION(response)}"  # should be obfuscated
-            )
+        if self.logger.isEnabledFor(logging.DEBUG):  # the schema is only for logging
+            try:  # the dict _should_ be the expected schema...
+                self.logger.debug(
+                    f"POST {url}: {TCC_POST_USR_SESSION(response)}"  # should be obfuscated
+                )
 
-        except vol.Invalid as err:
-            self.logger.warning(f"POST {url}: payload may be invalid: {err}")
+            except vol.Invalid as err:
+                self.logger.warning(f"POST {url}: payload may be invalid: {err}")
 
         session: EvoSessionDictT = convert_keys_to_snake_case(response)  # type:ignore[assignment]
 
@@ -190,6 +214,9 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         self._session_id = session[SZ_SESSION_ID]
         self._session_id_expires = dt.fromisoformat(session[SZ_SESSION_ID_EXPIRES])
 
+        if self.is_session_valid():  # otherwise, it will be fetched on demand
+            self._session_id_refresher.schedule()
+
     def _export_session_id(self) -> SessionIdEntryT:
         """Convert the session id to a (serialized) dictionary."""
 
@@ -210,10 +237,22 @@ class Auth(AbstractAuth):
         *,
         _hostname: str | None = None,
         logger: logging.Logger | None = None,
+        validation: ValidationPolicy = ValidationPolicy.ALWAYS,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """A class for interacting with the v0 Resideo TCC API."""
 
-        super().__init__(websession, _hostname=_hostname, logger=logger)
+        super().__init__(
+            websession,
+            _hostname=_hostname,
+            logger=logger,
+            validation=validation,
+            sample_rate=sample_rate,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
 
         self._session_id = session_manager.get_session_id
         self._url_base = f"https://{self.hostname}/{URL_BASE}"
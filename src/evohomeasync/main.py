@@ -6,6 +6,8 @@ import logging
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Final
 
+from evohome.auth import DEFAULT_SAMPLE_RATE
+from evohome.const import ValidationPolicy
 from evohome.helpers import camel_to_snake
 
 from . import exceptions as exc
@@ -16,6 +18,9 @@ from .schemas import factory_location_response_list, factory_user_account_info_r
 if TYPE_CHECKING:
     import aiohttp
 
+    from evohome.rate_limit import RateLimiter
+    from evohome.retry import RetryPolicy
+
     from .schemas import EvoTcsInfoDictT, EvoUserAccountDictT
 
 SCH_GET_ACCOUNT_INFO: Final = factory_user_account_info_response(camel_to_snake)
@@ -36,9 +41,22 @@ class EvohomeClient:
         /,
         *,
         websession: aiohttp.ClientSession | None = None,
+        validation: ValidationPolicy = ValidationPolicy.ALWAYS,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
         debug: bool = False,
     ) -> None:
-        """Construct the v0 EvohomeClient object."""
+        """Construct the v0 EvohomeClient object.
+
+        The `validation` policy determines which responses have their schema checked
+        (e.g. only the first response of each URL); see `auth.validation_failures`.
+
+        A `rate_limiter` (which may be shared by many clients) limits the rate of
+        requests to the vendor's servers; see `evohome.rate_limit.RateLimiter`. If
+        there is a `retry_policy`, failed requests may be retried (by default, they
+        are not); see `evohome.retry.RetryPolicy`.
+        """
 
         self.logger = _LOGGER
         if debug:
@@ -46,7 +64,14 @@ class EvohomeClient:
             self.logger.debug("Debug mode explicitly enabled via kwarg.")
 
         self._session_manager = session_manager
-        self.auth = Auth(session_manager, websession or session_manager.websession)
+        self.auth = Auth(
+            session_manager,
+            websession or session_manager.websession,
+            validation=validation,
+            sample_rate=sample_rate,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
 
         # self.devices: dict[_ZoneIdT, _DeviceDictT] = {}  # dhw or zone by id
         # self.named_devices: dict[_ZoneNameT, _DeviceDictT] = {}  # zone by name
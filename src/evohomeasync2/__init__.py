@@ -11,8 +11,11 @@ from datetime import UTC, datetime as dt
 
 import aiohttp
 
+from evohome.const import ValidationPolicy
+
 from .auth import AbstractTokenManager
-from .control_system import ControlSystem
+from .control_system import BackupStatus, ControlSystem, RestoreStatus, SetpointTable
+from .events import EntityEvent, EventType
 from .exceptions import (
     ApiRateLimitExceededError,
     ApiRequestFailedError,
@@ -30,10 +33,13 @@ from .exceptions import (
     NoSingleTcsError,
     StatusError,
 )
+from .fleet import FleetManager
 from .gateway import Gateway
 from .hotwater import HotWater
 from .location import Location
 from .main import EvohomeClient
+from .poll_planner import PollPlanner
+from .schedule_cache import ScheduleCache
 from .zone import Zone
 
 
@@ -123,6 +129,10 @@ class EvohomeClientOld(EvohomeClient):
 __all__ = [  # noqa: RUF022
     "EvohomeClient",
     "AbstractTokenManager",
+    "FleetManager",
+    "PollPlanner",
+    "ScheduleCache",
+    "ValidationPolicy",
     #
     "Location",
     "Gateway",
@@ -130,6 +140,12 @@ __all__ = [  # noqa: RUF022
     "Zone",
     "HotWater",
     #
+    "EntityEvent",
+    "EventType",
+    "BackupStatus",
+    "RestoreStatus",
+    "SetpointTable",
+    #
     "ApiRateLimitExceededError",
     "ApiRequestFailedError",
     "AuthenticationFailedError",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import logging
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime as dt, timedelta as td
 from http import HTTPStatus
@@ -10,19 +11,20 @@ from typing import TYPE_CHECKING, Any, Final
 
 import voluptuous as vol
 
-from evohome.auth import AbstractAuth
-from evohome.const import HEADERS_BASE, HEADERS_CRED, HINT_BAD_CREDS
+from evohome.auth import DEFAULT_SAMPLE_RATE, AbstractAuth
+from evohome.const import HEADERS_BASE, HEADERS_CRED, HINT_BAD_CREDS, ValidationPolicy
 from evohome.credentials import CredentialsManagerBase
 from evohome.helpers import convert_keys_to_snake_case, obfuscate
 
 from . import exceptions as exc
 
 if TYPE_CHECKING:
-    import logging
-
     import aiohttp
     from aiohttp.typedefs import StrOrURL
 
+    from evohome.rate_limit import RateLimiter
+    from evohome.retry import RetryPolicy
+
     from .schemas.typedefs import (
         EvoAuthTokensDictT as AccessTokenEntryT,
         TccAuthTokensResponseT as AuthTokenResponseT,  # TCC is snake_case anyway
@@ -87,12 +89,27 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         /,
         _hostname: str | None = None,
         logger: logging.Logger | None = None,
+        *,
+        refresh_margin: td | None = None,
     ) -> None:
         """Initialize the token manager."""
 
         super().__init__(
-            client_id, secret, websession, _hostname=_hostname, logger=logger
+            client_id,
+            secret,
+            websession,
+            _hostname=_hostname,
+            logger=logger,
+            refresh_margin=refresh_margin,
         )
+
+        self._access_token_refresher = self._add_refresher(
+            "access_token",
+            self.fetch_access_token,
+            self.save_access_token,
+            lambda: self._access_token_expires,
+        )
+
         self._clear_access_token()  # initialise the attrs
 
     def _clear_access_token(self) -> None:
@@ -101,6 +118,8 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         self._access_token = ""
         self._access_token_expires = dt.min.replace(tzinfo=UTC)  # don't need local TZ
 
+        self._access_token_refresher.cancel_timer()  # no point refreshing it now
+
     @property
     def access_token(self) -> str:
         """Return the access token."""
@@ -119,12 +138,15 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
     async def get_access_token(self) -> str:  # convenience wrapper
         """Return a valid access token.
 
-        If required, fetch (and save) a new token via the vendor's web API.
+        If required, fetch (and save) a new token via the vendor's web API. Concurrent
+        callers will share a single fetch, rather than each making their own.
         """
 
         if not self.is_token_valid():  # although may be rejected for other reasons
-            await self.fetch_access_token()
-            await self.save_access_token()
+            async with self._access_token_refresher.lock:
+                if not self.is_token_valid():  # may have been fetched whilst waiting
+                    await self.fetch_access_token()
+                    await self.save_access_token()
 
         return self.access_token
 
@@ -177,6 +199,8 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         self.logger.debug(f" - access_token_expires = {self.access_token_expires}")
         self.logger.debug(f" - refresh_token = {self.refresh_token}")
 
+        self._access_token_refresher.schedule()
+
     async def _fetch_access_token(self, credentials: dict[str, str]) -> None:
         """Obtain an access token using the supplied credentials.
 
@@ -192,13 +216,14 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
             data=credentials,  # NOTE: is snake_case
         )
 
-        try:  # the dict _should_ be the expected schema...
-            self.logger.debug(
-                f"POST {url}: {SCH_OAUTH_TOKEN(response)}"  # should be obfuscated
-            )
+        if self.logger.isEnabledFor(logging.DEBUG):  # the schema is only for logging
+            try:  # the dict _should_ be the expected schema...
+                self.logger.debug(
+                    f"POST {url}: {SCH_OAUTH_TOKEN(response)}"  # should be obfuscated
+                )
 
-        except vol.Invalid as err:
-            self.logger.warning(f"POST {url}: payload may be invalid: {err}")
+            except vol.Invalid as err:
+                self.logger.warning(f"POST {url}: payload may be invalid: {err}")
 
         tokens: AuthTokenResponseT = convert_keys_to_snake_case(response)
 
@@ -238,6 +263,9 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         self._access_token_expires = dt.fromisoformat(tokens[SZ_ACCESS_TOKEN_EXPIRES])
         self._refresh_token = tokens[SZ_REFRESH_TOKEN]
 
+        if self.is_token_valid():  # otherwise, it will be fetched on demand
+            self._access_token_refresher.schedule()
+
     def _export_access_token(self) -> AccessTokenEntryT:
         """Convert the token data to a (serialized) dictionary."""
 
@@ -259,10 +287,22 @@ class Auth(AbstractAuth):
         *,
         _hostname: str | None = None,
         logger: logging.Logger | None = None,
+        validation: ValidationPolicy = ValidationPolicy.ALWAYS,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """A class for interacting with the v2 Resideo TCC API."""
 
-        super().__init__(websession, _hostname=_hostname, logger=logger)
+        super().__init__(
+            websession,
+            _hostname=_hostname,
+            logger=logger,
+            validation=validation,
+            sample_rate=sample_rate,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
 
         self._access_token = token_manager.get_access_token
         self._url_base = f"https://{self.hostname}/{URL_BASE}"
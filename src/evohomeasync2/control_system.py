@@ -4,9 +4,10 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from enum import StrEnum
 from functools import cached_property
-from typing import TYPE_CHECKING, Final, NoReturn, NotRequired, TypedDict
+from typing import TYPE_CHECKING, Any, Final, NoReturn, NotRequired, TypedDict
 
 from evohome.helpers import as_local_time, camel_to_snake
 
@@ -28,6 +29,7 @@ from .const import (
     SZ_ZONE_ID,
     SZ_ZONES,
 )
+from .events import EventType
 from .hotwater import HotWater
 from .schemas import SystemMode, factory_tcs_status
 from .schemas.const import (
@@ -37,9 +39,11 @@ from .schemas.const import (
     EntityType,
     TcsModelType,
 )
-from .zone import ActiveFaultsBase, EntityBase, Zone
+from .zone import ActiveFaultsBase, EntityBase, Zone, _Timeline
 
 if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Coroutine, Iterable
     from datetime import datetime as dt
 
     import voluptuous as vol
@@ -58,6 +62,75 @@ if TYPE_CHECKING:
     )
 
 
+class BackupStatus(StrEnum):
+    """The outcome of backing up a schedule (see ControlSystem.backup_schedules)."""
+
+    BACKED_UP = "backed_up"
+    NO_SCHEDULE = "no_schedule"  # backed up as empty, as is missing/invalid
+    FAILED = "failed"  # not backed up
+
+
+class RestoreStatus(StrEnum):
+    """The outcome of restoring a schedule (see ControlSystem.restore_schedules)."""
+
+    RESTORED = "restored"
+    UNCHANGED = "unchanged"  # not restored, as is the same as the current schedule
+    UNMATCHED = "unmatched"  # there is no such zone/dhw
+    FAILED = "failed"
+
+
+def _same_schedule(
+    current: list[DayOfWeekDhwT] | list[DayOfWeekZoneT],
+    schedule: list[DayOfWeekDhwT] | list[DayOfWeekZoneT],
+) -> bool:
+    """Return True if two (daily) schedules are the same (in any order of day)."""
+
+    def by_day(sched: list[DayOfWeekDhwT] | list[DayOfWeekZoneT]) -> dict[str, Any]:
+        return {d["day_of_week"]: d["switchpoints"] for d in sched}
+
+    return by_day(current) == by_day(schedule)
+
+
+class SetpointTable:
+    """The scheduled setpoints of a TCS's zones, at each of a sequence of datetimes.
+
+    The setpoints of each zone are a column (an array of floats, one per datetime),
+    which is much more compact than (say) a dict of them.
+    """
+
+    def __init__(
+        self, timestamps: tuple[dt, ...], columns: dict[str, array[float]]
+    ) -> None:
+        """Initialise the table (each column must have one setpoint per timestamp)."""
+
+        self.timestamps: Final = timestamps
+        self._columns = columns  # by zone id
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"{self.__class__.__name__}"
+            f"(zones={len(self._columns)}, timestamps={len(self.timestamps)})"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of timestamps (i.e. of rows)."""
+        return len(self.timestamps)
+
+    def __getitem__(self, zone_id: str) -> array[float]:
+        """Return the setpoints of a zone (i.e. a column), one per timestamp."""
+        return self._columns[zone_id]
+
+    @property
+    def zone_ids(self) -> tuple[str, ...]:
+        """Return the ids of the zones (i.e. of the columns)."""
+        return tuple(self._columns)
+
+    def row(self, idx: int) -> dict[str, float]:
+        """Return the setpoints of every zone at a timestamp (by its index)."""
+        return {k: v[idx] for k, v in self._columns.items()}
+
+
 class TccSetTcsModeT(TypedDict):
     """PUT /temperatureControlSystem/{tcs_id}/mode"""
 
@@ -71,6 +144,7 @@ class ControlSystem(ActiveFaultsBase, EntityBase):
 
     SCH_STATUS: vol.Schema = factory_tcs_status(camel_to_snake)
     _TYPE = EntityType.TCS
+    _EVENT_KEYS = ((SZ_SYSTEM_MODE_STATUS, EventType.MODE),)
 
     def __init__(self, gateway: Gateway, config: EvoTcsConfigResponseT) -> None:
         super().__init__(
@@ -108,6 +182,7 @@ class ControlSystem(ActiveFaultsBase, EntityBase):
             self.hotwater = HotWater(self, dhw_entry)
 
         self._status: EvoTcsStatusResponseT | None = None
+        self._last_status: EvoTcsStatusResponseT | None = None  # incl. the children
 
     @property
     def config(self) -> EvoTcsConfigEntryT:
@@ -166,15 +241,38 @@ class ControlSystem(ActiveFaultsBase, EntityBase):
 
         raise NotImplementedError
 
-    def _update_status(self, status: EvoTcsStatusResponseT) -> None:
-        """Update the TCS's status and cascade to its descendants."""
+    def _update_status(self, status: EvoTcsStatusResponseT) -> list[EntityBase]:
+        """Update the TCS's status and cascade to its descendants.
+
+        Returns the entities whose status has changed (unchanged subtrees are skipped).
+        """
 
-        self._update_faults(status["active_faults"])
+        if status == self._last_status:
+            self._relog_faults()
+            return []
+
+        self._last_status = status
+        changed: list[EntityBase] = []
+
+        tcs_status: EvoTcsStatusResponseT = {  # type: ignore[assignment]
+            k: v for k, v in status.items() if k not in (SZ_ZONES, SZ_DHW)
+        }
 
-        # break the TypedDict into its parts (so, ignore[misc])...
-        for zon_status in status.pop(SZ_ZONES):  # type: ignore[misc]
+        if tcs_status == self._status:
+            super()._relog_faults()  # only this entity's faults, not its descendants'
+
+        else:
+            self._update_faults(status["active_faults"])
+
+            old_status, self._status = self._status, tcs_status
+            self._emit_changes(old_status, tcs_status)
+
+            changed.append(self)
+
+        # cascade the parts of the status to the children (without mutating it)...
+        for zon_status in status[SZ_ZONES]:
             if zone := self.zone_by_id.get(zon_status[SZ_ZONE_ID]):
-                zone._update_status(zon_status)
+                changed.extend(zone._update_status(zon_status))
 
             else:
                 self._logger.warning(
@@ -182,9 +280,9 @@ class ControlSystem(ActiveFaultsBase, EntityBase):
                     ", (has the system configuration been changed?)"
                 )
 
-        if dhw_status := status.pop(SZ_DHW, None):
+        if dhw_status := status.get(SZ_DHW):
             if self.hotwater and self.hotwater.id == dhw_status[SZ_DHW_ID]:
-                self.hotwater._update_status(dhw_status)
+                changed.extend(self.hotwater._update_status(dhw_status))
 
             else:
                 self._logger.warning(
@@ -192,7 +290,16 @@ class ControlSystem(ActiveFaultsBase, EntityBase):
                     ", (has the system configuration been changed?)"
                 )
 
-        self._status = status
+        return changed
+
+    def _relog_faults(self) -> None:
+        """Re-log active faults if necessary (also those of its descendants)."""
+
+        super()._relog_faults()
+        for zone in self.zones:
+            zone._relog_faults()
+        if self.hotwater:
+            self.hotwater._relog_faults()
 
     @property
     def system_mode_status(self) -> EvoSystemModeStatusResponseT:
@@ -307,105 +414,279 @@ class ControlSystem(ActiveFaultsBase, EntityBase):
 
     # these are convenience methods
 
-    async def get_schedules(self) -> list[EvoScheduleDhwT | EvoScheduleZoneT]:
-        """Backup all schedules from the TCS."""
+    async def _gather(
+        self,
+        coros: list[Coroutine[Any, Any, Any]],
+        max_concurrency: int | None,
+    ) -> list[Any]:
+        """Await the coroutines, up to max_concurrency at a time (default: the client's).
+
+        The results are in the order of the coroutines. If any coroutine fails, the
+        others are cancelled (so none are left running), and its exception is raised.
+        """
+
+        semaphore = asyncio.Semaphore(
+            max(max_concurrency or self.location.client.max_concurrency, 1)
+        )
+
+        async def limited(coro: Coroutine[Any, Any, Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        tasks = [asyncio.create_task(limited(c)) for c in coros]
+
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _fetch_schedules(
+        self, max_concurrency: int | None
+    ) -> list[
+        tuple[HotWater | Zone, EvoScheduleDhwT | EvoScheduleZoneT | exc.EvohomeError]
+    ]:
+        """Fetch the schedule of each zone (then the DHW), or the error if it failed.
+
+        A missing/invalid schedule is fetched as an empty schedule.
+        """
 
         async def get_schedule(
             child: HotWater | Zone,
-        ) -> list[DayOfWeekDhwT] | list[DayOfWeekZoneT]:
+        ) -> EvoScheduleDhwT | EvoScheduleZoneT | exc.EvohomeError:
+            schedule: list[DayOfWeekDhwT] | list[DayOfWeekZoneT]
+
             try:
-                return await child.get_schedule()
+                schedule = await child.get_schedule()
             except exc.InvalidScheduleError:
                 self._logger.warning(
                     f"Ignoring {child.id} ({child.name}): missing/invalid schedule"
                 )
-            return []
+                schedule = []
+            except exc.EvohomeError as err:
+                return err
+
+            return {  # type: ignore[return-value]
+                SZ_ZONE_ID: child.id,
+                SZ_NAME: child.name,
+                SZ_DAILY_SCHEDULES: schedule,
+            }
 
         self._logger.info(
             f"Schedules: Backing up from {self.id} ({self.location.name})"
         )
 
-        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT] = []
-
-        for zone in self.zones:
-            schedules.append(  # noqa: PERF401
-                {
-                    SZ_ZONE_ID: zone.id,
-                    SZ_NAME: zone.name,
-                    SZ_DAILY_SCHEDULES: await get_schedule(zone),  # type: ignore[typeddict-item]
-                }
-            )
+        children: list[HotWater | Zone] = list(self.zones)
         if self.hotwater:
-            schedules.append(
-                {
-                    SZ_ZONE_ID: self.hotwater.id,
-                    SZ_NAME: self.hotwater.name,
-                    SZ_DAILY_SCHEDULES: await get_schedule(self.hotwater),  # type: ignore[typeddict-item]
-                }
-            )
+            children.append(self.hotwater)
 
+        results = await self._gather(
+            [get_schedule(c) for c in children], max_concurrency
+        )
+        return list(zip(children, results, strict=True))
+
+    async def get_schedules(
+        self, /, *, max_concurrency: int | None = None
+    ) -> list[EvoScheduleDhwT | EvoScheduleZoneT]:
+        """Backup all schedules from the TCS.
+
+        The schedules are fetched up to max_concurrency at a time (by default, as per
+        the client), and are returned in the order of the zones (then the DHW). If a
+        schedule can't be fetched, the error is raised (see backup_schedules() for a
+        backup that tolerates such failures).
+        """
+
+        schedules = []
+        for _, result in await self._fetch_schedules(max_concurrency):
+            if isinstance(result, exc.EvohomeError):
+                raise result
+            schedules.append(result)
         return schedules
 
-    async def set_schedules(
-        self,
-        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT],
-        match_by_name: bool | None = None,
-    ) -> bool:
-        """Restore all schedules to the TCS and return True if success.
+    async def backup_schedules(
+        self, /, *, max_concurrency: int | None = None
+    ) -> tuple[list[EvoScheduleDhwT | EvoScheduleZoneT], dict[str, BackupStatus]]:
+        """Backup all schedules from the TCS, and return the status of each, by its id.
 
-        The default is to match a schedule to its zone/dhw by id.
+        As get_schedules(), except that if a schedule can't be fetched, it is omitted
+        (and a warning logged) and its status is FAILED, rather than failing the backup.
         """
 
-        async def restore_by_id(sched: EvoScheduleDhwT | EvoScheduleZoneT) -> bool:
-            """Restore a schedule by id and return False if there was no match."""
+        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT] = []
+        status: dict[str, BackupStatus] = {}
 
-            id_: str = sched.get("zone_id") or sched["dhw_id"]  # type: ignore[assignment,typeddict-item]
+        for child, result in await self._fetch_schedules(max_concurrency):
+            if isinstance(result, exc.EvohomeError):
+                self._logger.warning(
+                    f"Omitting {child.id} ({child.name}): failed to get schedule: {result}"
+                )
+                status[child.id] = BackupStatus.FAILED
+                continue
+
+            schedules.append(result)
+            status[child.id] = (
+                BackupStatus.BACKED_UP
+                if result[SZ_DAILY_SCHEDULES]
+                else BackupStatus.NO_SCHEDULE
+            )
 
-            if self.hotwater and self.hotwater.id == id_:
-                await self.hotwater.set_schedule(json.dumps(sched["daily_schedules"]))
+        return schedules, status
 
-            elif zone := self.zone_by_id.get(id_):
-                await zone.set_schedule(json.dumps(sched["daily_schedules"]))
+    async def get_setpoints(
+        self, timestamps: Iterable[dt], /, *, max_concurrency: int | None = None
+    ) -> SetpointTable:
+        """Return the scheduled setpoint of every zone, at each of the datetimes.
 
-            else:
+        Naive datetimes are assumed to be in the location's time zone. The schedules
+        are fetched (or taken from the cache) only if they have not been already. Zones
+        without a schedule are omitted (and a warning logged).
+        """
+
+        async def get_schedule(zone: Zone) -> None:
+            try:
+                await zone.get_schedule()
+            except exc.EvohomeError as err:
                 self._logger.warning(
-                    f"Ignoring schedule of {id_} ({sched.get('name')}): unknown id"
-                    ", consider matching by name rather than by id"
+                    f"Omitting {zone.id} ({zone.name}): failed to get schedule: {err}"
                 )
-                return False
 
-            return True
+        await self._gather(
+            [get_schedule(z) for z in self.zones if z._timeline is None],
+            max_concurrency,
+        )
+
+        tzinfo = self.location.tzinfo
+        dtms = tuple(timestamps)
 
-        async def restore_by_name(sched: EvoScheduleDhwT | EvoScheduleZoneT) -> bool:
-            """Restore a schedule by name and return False if there was no match."""
+        # the conversion to local time is the costly part, so is done once for all zones
+        offsets = [_Timeline.offset(as_local_time(d, tzinfo)) for d in dtms]
 
-            name: str | None = sched.get("name")  # name is NotRequired[str]
+        return SetpointTable(
+            dtms,
+            {
+                z.id: z._timeline.setpoints(offsets)
+                for z in self.zones
+                if z._timeline is not None
+            },
+        )
 
-            if name and self.hotwater and name == self.hotwater.name:
-                await self.hotwater.set_schedule(json.dumps(sched["daily_schedules"]))
+    def _match_schedule(
+        self,
+        sched: EvoScheduleDhwT | EvoScheduleZoneT,
+        match_by_name: bool | None,  # noqa: FBT001
+    ) -> HotWater | Zone | None:
+        """Return the zone/DHW of a schedule (by id or by name), or None if no match."""
 
-            elif name and (zone := self.zone_by_name.get(name)):
-                await zone.set_schedule(json.dumps(sched["daily_schedules"]))
+        id_: str = sched.get("zone_id") or sched["dhw_id"]  # type: ignore[assignment,typeddict-item]
+        name: str | None = sched.get("name")  # name is NotRequired[str]
 
-            else:
-                id_: str = sched.get("zone_id") or sched["dhw_id"]  # type: ignore[assignment,typeddict-item]
+        if not match_by_name:
+            if self.hotwater and self.hotwater.id == id_:
+                return self.hotwater
+            if zone := self.zone_by_id.get(id_):
+                return zone
 
+            self._logger.warning(
+                f"Ignoring schedule of {id_} ({name}): unknown id"
+                ", consider matching by name rather than by id"
+            )
+            return None
+
+        if name and self.hotwater and name == self.hotwater.name:
+            return self.hotwater
+        if name and (zone := self.zone_by_name.get(name)):
+            return zone
+
+        self._logger.warning(
+            f"Ignoring schedule of {id_} ({name}): unknown name"
+            ", consider matching by id rather than by name"
+        )
+        return None
+
+    async def restore_schedules(
+        self,
+        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT],
+        /,
+        *,
+        match_by_name: bool | None = None,
+        only_changed: bool = True,
+        max_concurrency: int | None = None,
+    ) -> dict[str, RestoreStatus]:
+        """Restore the schedules to the TCS and return the status of each, by its id.
+
+        The id is that of the schedule (not of its zone/dhw, if matched by name). If
+        only_changed is True, a schedule is not restored if it is the same as the
+        current schedule of its zone/dhw (which may be cached).
+        """
+
+        async def restore(sched: EvoScheduleDhwT | EvoScheduleZoneT) -> RestoreStatus:
+            if (child := self._match_schedule(sched, match_by_name)) is None:
+                return RestoreStatus.UNMATCHED
+
+            if only_changed:
+                try:
+                    current = await child.get_schedule()
+                except exc.EvohomeError:  # e.g. InvalidScheduleError
+                    pass
+                else:
+                    if _same_schedule(current, sched["daily_schedules"]):
+                        return RestoreStatus.UNCHANGED
+
+            try:
+                await child.set_schedule(sched["daily_schedules"])  # type: ignore[arg-type]
+            except exc.EvohomeError as err:
                 self._logger.warning(
-                    f"Ignoring schedule of {id_} ({name}): unknown name"
-                    ", consider matching by id rather than by name"
+                    f"Failed to restore schedule of {child.id} ({child.name}): {err}"
                 )
-                return False
-
-            return True
+                return RestoreStatus.FAILED
+            except Exception:  # e.g. TimeoutError: must not abort the other restores
+                self._logger.exception(
+                    f"Failed to restore schedule of {child.id} ({child.name})"
+                )
+                return RestoreStatus.FAILED
+            return RestoreStatus.RESTORED
 
         self._logger.info(
             f"Schedules: Restoring (matched by {'name' if match_by_name else 'id'})"
             f" to {self.id} ({self.location.name})"
         )
 
-        fnc = restore_by_name if match_by_name else restore_by_id
-        all_restored = all([await fnc(sch) for sch in schedules])
+        results = await self._gather([restore(s) for s in schedules], max_concurrency)
 
+        return {
+            s.get("zone_id") or s["dhw_id"]: r  # type: ignore[typeddict-item,misc]
+            for s, r in zip(schedules, results, strict=True)
+        }
+
+    async def set_schedules(
+        self,
+        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT],
+        match_by_name: bool | None = None,
+        *,
+        only_changed: bool = False,
+        max_concurrency: int | None = None,
+    ) -> bool:
+        """Restore all schedules to the TCS and return True if success.
+
+        The default is to match a schedule to its zone/dhw by id. The schedules are set
+        up to max_concurrency at a time (by default, as per the client). If a schedule
+        can't be set, a warning is logged, rather than failing the restore. See also
+        restore_schedules(), which reports on each schedule.
+        """
+
+        report = await self.restore_schedules(
+            schedules,
+            match_by_name=match_by_name,
+            only_changed=only_changed,
+            max_concurrency=max_concurrency,
+        )
+
+        all_restored = all(
+            r in (RestoreStatus.RESTORED, RestoreStatus.UNCHANGED)
+            for r in report.values()
+        )
         same_count = len(schedules) == len(self.zones) + (1 if self.hotwater else 0)
 
         if not (success := same_count and all_restored):
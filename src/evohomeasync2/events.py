@@ -0,0 +1,33 @@
+"""Provides the change events of TCC v2 entities.
+
+The events are emitted (to any listeners) as the entity's status is updated.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from .zone import EntityBase
+
+
+class EventType(StrEnum):
+    TEMPERATURE = "temperature"  # temperature_status of a zone/DHW
+    SETPOINT = "setpoint"  # setpoint_status of a zone, state_status of a DHW
+    MODE = "mode"  # system_mode_status of a TCS
+    FAULT_RAISED = "fault_raised"
+    FAULT_CLEARED = "fault_cleared"
+
+
+class EntityEvent(NamedTuple):
+    """A change in the status of an entity.
+
+    The old/new values are the relevant part of the entity's status (e.g. a fault), and
+    are None if there is no such value (e.g. the status before the first update).
+    """
+
+    entity: EntityBase
+    type: EventType
+    old: Any
+    new: Any
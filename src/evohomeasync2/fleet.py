@@ -0,0 +1,179 @@
+"""Provides a manager for the clients of many user accounts (a fleet).
+
+The clients share a single aiohttp.ClientSession (and so its connection pool), and
+their polls are staggered across the poll interval and limited by rate budgets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import zlib
+from datetime import timedelta as td
+from typing import TYPE_CHECKING, Any, Final
+
+from evohome.rate_limit import TokenBucket
+
+from . import exceptions as exc
+from .main import EvohomeClient
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .auth import AbstractTokenManager
+
+
+DEFAULT_POLL_INTERVAL: Final = td(seconds=60)
+
+_LOGGER = logging.getLogger(__name__.rpartition(".")[0])
+
+
+class FleetManager:
+    """Manage the clients of many user accounts, and poll them.
+
+    Each account is polled once per poll interval, at an offset (within the interval)
+    derived from its account id, so that the polls are spread over the interval. Polls
+    are further limited by a (global) rate and a per-account rate, if either is given.
+    """
+
+    def __init__(
+        self,
+        websession: aiohttp.ClientSession,
+        /,
+        *,
+        poll_interval: td = DEFAULT_POLL_INTERVAL,
+        rate: float | None = None,
+        account_rate: float | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Initialise the fleet manager.
+
+        The rates are in polls per second (None for no limit): `rate` is for all the
+        accounts together, and `account_rate` is for each account.
+        """
+
+        if poll_interval <= td(0):
+            raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+
+        self.websession: Final = websession
+        self.logger: Final = logger or _LOGGER
+
+        self._poll_interval = poll_interval.total_seconds()
+        self._account_rate = account_rate
+
+        self._bucket = TokenBucket(rate) if rate else None
+        self._buckets: dict[str, TokenBucket] = {}  # by account_id
+
+        self._clients: dict[str, EvohomeClient] = {}  # by account_id
+        self._poll_tasks: dict[str, asyncio.Task[None]] = {}  # by account_id
+
+    def __str__(self) -> str:
+        """Return a string representation of this object."""
+        return f"{self.__class__.__name__}(accounts={len(self._clients)})"
+
+    @property
+    def clients(self) -> dict[str, EvohomeClient]:
+        """Return the clients, by account id."""
+        return dict(self._clients)
+
+    @property
+    def is_polling(self) -> bool:
+        """Return True if the accounts are being polled."""
+        return bool(self._poll_tasks)
+
+    def add_account(
+        self,
+        account_id: str,
+        token_manager: AbstractTokenManager,
+        /,
+        **kwargs: Any,
+    ) -> EvohomeClient:
+        """Create a client for an account (with the shared ClientSession).
+
+        The kwargs are passed to the client. If the fleet is being polled, the account
+        is polled too.
+        """
+
+        if account_id in self._clients:
+            raise exc.ConfigError(f"{self}: account_id='{account_id}' already exists")
+
+        client = EvohomeClient(token_manager, websession=self.websession, **kwargs)
+
+        self._clients[account_id] = client
+        if self._account_rate:
+            self._buckets[account_id] = TokenBucket(self._account_rate)
+
+        if self._poll_tasks:
+            self._start_polling(account_id)
+
+        return client
+
+    async def remove_account(self, account_id: str) -> None:
+        """Remove an account (and stop polling it)."""
+
+        if self._clients.pop(account_id, None) is None:
+            raise exc.ConfigError(f"{self}: account_id='{account_id}' does not exist")
+        self._buckets.pop(account_id, None)
+
+        if task := self._poll_tasks.pop(account_id, None):
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def update(self, account_id: str) -> None:
+        """Update (poll) an account now, as permitted by the rate budgets."""
+
+        # the account's budget is taken first, so that a token of the global budget
+        # is not held (unused by the other accounts) whilst waiting for it
+        if bucket := self._buckets.get(account_id):
+            await bucket.acquire()
+        if self._bucket:
+            await self._bucket.acquire()
+
+        await self._clients[account_id].update()
+
+    def start(self) -> None:
+        """Start polling the accounts (is a no-op if they are already being polled)."""
+
+        for account_id in self._clients:
+            if account_id not in self._poll_tasks:
+                self._start_polling(account_id)
+
+    async def stop(self) -> None:
+        """Stop polling the accounts."""
+
+        tasks = list(self._poll_tasks.values())
+        self._poll_tasks.clear()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _poll_offset(self, account_id: str) -> float:
+        """Return the account's offset (in seconds) within the poll interval."""
+        return zlib.crc32(account_id.encode()) % 1000 / 1000 * self._poll_interval
+
+    def _start_polling(self, account_id: str) -> None:
+        self._poll_tasks[account_id] = asyncio.create_task(
+            self._poll(account_id), name=f"{self}: poll {account_id}"
+        )
+
+    async def _poll(self, account_id: str) -> None:
+        """Poll an account, once per poll interval (starting at its offset)."""
+
+        loop = asyncio.get_running_loop()
+
+        next_poll = loop.time() + self._poll_offset(account_id)
+
+        while True:
+            await asyncio.sleep(max(next_poll - loop.time(), 0))
+
+            try:
+                await self.update(account_id)
+            except exc.EvohomeError as err:  # the next poll may succeed
+                self.logger.warning(f"{self}: Failed to poll {account_id}: {err}")
+            except Exception:  # an unexpected error must not end the polls
+                self.logger.exception(f"{self}: Error when polling {account_id}")
+
+            next_poll += self._poll_interval
+            while next_poll < loop.time():  # the poll overran, so skip the missed polls
+                next_poll += self._poll_interval
@@ -59,6 +59,7 @@ class Gateway(ActiveFaultsBase, EntityBase):
             self.system_by_id[tcs.id] = tcs
 
         self._status: EvoGwyStatusResponseT | None = None
+        self._last_status: EvoGwyStatusResponseT | None = None  # incl. the children
 
     @property
     def config(self) -> EvoGwyConfigEntryT:
@@ -87,15 +88,35 @@ class Gateway(ActiveFaultsBase, EntityBase):
 
         raise NotImplementedError
 
-    def _update_status(self, status: EvoGwyStatusResponseT) -> None:
-        """Update the GWY's status and cascade to its descendants."""
+    def _update_status(self, status: EvoGwyStatusResponseT) -> list[EntityBase]:
+        """Update the GWY's status and cascade to its descendants.
 
-        self._update_faults(status["active_faults"])
+        Returns the entities whose status has changed (unchanged subtrees are skipped).
+        """
+
+        if status == self._last_status:
+            self._relog_faults()
+            return []
+
+        self._last_status = status
+        changed: list[EntityBase] = []
+
+        gwy_status: EvoGwyStatusResponseT = {  # type: ignore[assignment]
+            k: v for k, v in status.items() if k != SZ_TEMPERATURE_CONTROL_SYSTEMS
+        }
 
-        # break the TypedDict into its parts (so, ignore[misc])...
-        for tcs_status in status.pop(SZ_TEMPERATURE_CONTROL_SYSTEMS):  # type: ignore[misc]
+        if gwy_status == self._status:
+            super()._relog_faults()  # only this entity's faults, not its descendants'
+
+        else:
+            self._update_faults(status["active_faults"])
+            self._status = gwy_status
+            changed.append(self)
+
+        # cascade the parts of the status to the children (without mutating it)...
+        for tcs_status in status[SZ_TEMPERATURE_CONTROL_SYSTEMS]:
             if tcs := self.system_by_id.get(tcs_status[SZ_SYSTEM_ID]):
-                tcs._update_status(tcs_status)
+                changed.extend(tcs._update_status(tcs_status))
 
             else:
                 self._logger.warning(
@@ -103,4 +124,11 @@ class Gateway(ActiveFaultsBase, EntityBase):
                     ", (has the gateway configuration been changed?)"
                 )
 
-        self._status = status
+        return changed
+
+    def _relog_faults(self) -> None:
+        """Re-log active faults if necessary (also those of its descendants)."""
+
+        super()._relog_faults()
+        for tcs in self.systems:
+            tcs._relog_faults()
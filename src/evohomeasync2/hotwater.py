@@ -7,7 +7,7 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING, Final, NotRequired, TypedDict
 
-from evohome.helpers import as_local_time, camel_to_snake
+from evohome.helpers import camel_to_snake
 
 from . import exceptions as exc
 from .const import (
@@ -19,7 +19,9 @@ from .const import (
     SZ_SCHEDULE_CAPABILITIES_RESPONSE,
     SZ_STATE,
     SZ_STATE_STATUS,
+    SZ_TEMPERATURE_STATUS,
 )
+from .events import EventType
 from .schemas import factory_dhw_schedule, factory_dhw_status
 from .schemas.const import (
     S2_MODE,
@@ -29,7 +31,7 @@ from .schemas.const import (
     EntityType,
     ZoneMode,
 )
-from .zone import _ZoneBase
+from .zone import _StatusRecord, _ZoneBase
 
 if TYPE_CHECKING:
     from datetime import datetime as dt
@@ -60,6 +62,10 @@ class HotWater(_ZoneBase):
     """Instance of a TCS's DHW zone (domesticHotWater)."""
 
     _TYPE = EntityType.DHW
+    _EVENT_KEYS = (
+        (SZ_TEMPERATURE_STATUS, EventType.TEMPERATURE),
+        (SZ_STATE_STATUS, EventType.SETPOINT),
+    )
 
     SCH_SCHEDULE: vol.Schema = factory_dhw_schedule(camel_to_snake)
     SCH_STATUS: vol.Schema = factory_dhw_status(camel_to_snake)
@@ -144,17 +150,27 @@ class HotWater(_ZoneBase):
 
     @property
     def mode(self) -> ZoneMode:
-        return self.state_status[SZ_MODE]
+        return self._status_record.mode
 
     @property
     def state(self) -> DhwState:
-        return self.state_status[SZ_STATE]
+        return self._status_record.state  # type: ignore[return-value]
 
     @property
     def until(self) -> dt | None:
-        if (until := self.state_status.get("until")) is None:
-            return None
-        return as_local_time(until, self.location.tzinfo)
+        return self._status_record.until(self.location.tzinfo)
+
+    def _parse_status(self, status: EvoDhwStatusResponseT) -> _StatusRecord:  # type: ignore[override]
+        """Return the parsed status of the DHW."""
+
+        state_status = status[SZ_STATE_STATUS]
+
+        return _StatusRecord(
+            status[SZ_TEMPERATURE_STATUS],
+            state_status[SZ_MODE],
+            state_status.get("until"),
+            state=state_status[SZ_STATE],
+        )
 
     async def _set_mode(self, mode: TccSetDhwModeT) -> None:
         """Set the DHW mode (state)."""
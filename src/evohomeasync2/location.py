@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 
 from aiozoneinfo import async_get_time_zone
 
-from evohome.helpers import camel_to_snake, convert_naive_dtm_strs_to_aware
+from evohome.helpers import camel_to_snake, convert_keys_and_dtm_strs
 from evohome.time_zone import EvoZoneInfo, iana_tz_from_windows_tz
 
 from .const import (
@@ -26,8 +26,9 @@ from .const import (
     SZ_USE_DAYLIGHT_SAVE_SWITCHING,
 )
 from .gateway import Gateway
-from .schemas import factory_loc_status
+from .schemas import TCC_GET_LOC_STATUS, factory_loc_status
 from .schemas.const import EntityType
+from .schemas.status import STATUS_DTM_KEYS
 from .schemas.typedefs import EvoTimeZoneInfoT
 from .zone import EntityBase
 
@@ -35,6 +36,7 @@ if TYPE_CHECKING:
     import voluptuous as vol
 
     from . import EvohomeClient
+    from .schemas.status import TccLocStatusResponseT
     from .schemas.typedefs import (
         EvoLocConfigEntryT,
         EvoLocConfigResponseT,
@@ -139,6 +141,9 @@ class Location(EntityBase):
             self.gateway_by_id[gwy.id] = gwy
 
         self._status: EvoLocStatusResponseT | None = None
+        self._last_status: EvoLocStatusResponseT | None = None  # incl. the children
+
+        self._changed_entities: tuple[EntityBase, ...] = ()
 
     def __str__(self) -> str:
         """Return a string representation of the entity."""
@@ -212,49 +217,80 @@ class Location(EntityBase):
 
     # Status (state) attrs & methods...
 
+    @property
+    def changed_entities(self) -> tuple[EntityBase, ...]:
+        """Return the entities whose status changed with the latest status update.
+
+        Includes the location itself (if changed), and its descendants.
+        """
+        return self._changed_entities
+
     async def update(
         self, *, _update_time_zone_info: bool = False
     ) -> EvoLocStatusResponseT:
         """Get the latest state of the location and update its status attrs.
 
         Will also update the status of its gateways, their TCSs, and their DHW/zones.
-        Returns the raw JSON of the latest state.
+        Returns the raw JSON of the latest state (which is shared with those entities,
+        but never mutated; a new one is built for every update).
         """
 
         if _update_time_zone_info:
             await self._get_config()
 
-        status = await self._get_status()
-
-        self._update_status(status)
-        return status
+        return await self._get_status()  # which has updated the status attrs
 
     async def _get_status(self) -> EvoLocStatusResponseT:
         """Get the latest state of the location and update its status attr.
 
-        Returns the raw JSON of the latest state.
+        Returns the JSON of the latest state (with snake_case keys and TZ-aware
+        datetimes).
         """
 
-        status: EvoLocStatusResponseT = await self._auth.get(
+        # the response is validated with its camelCase keys, as received...
+        response: TccLocStatusResponseT = await self._auth.get(
             f"{self._TYPE}/{self.id}/status?includeTemperatureControlSystems=True",
-            schema=self.SCH_STATUS,
+            schema=TCC_GET_LOC_STATUS,
+            convert_keys=False,
         )  # type: ignore[assignment]
 
-        self._update_status(status)
+        # then converted to snake_case keys & TZ-aware datetimes in a single pass
+        status: EvoLocStatusResponseT = convert_keys_and_dtm_strs(  # type: ignore[assignment]
+            response, self.tzinfo, STATUS_DTM_KEYS
+        )
+
+        self._changed_entities = tuple(self._update_status(status))
         return status
 
-    def _update_status(self, status: EvoLocStatusResponseT) -> None:
-        """Update the LOC's status and cascade to its descendants."""
+    def _update_status(self, status: EvoLocStatusResponseT) -> list[EntityBase]:
+        """Update the LOC's status and cascade to its descendants.
+
+        The status is expected to have TZ-aware datetimes (see _get_status()). Returns
+        the entities whose status has changed (unchanged subtrees are skipped).
+        """
 
-        # convert all naive datetimes to TZ-aware datetimes (do when snake_casing?)
-        status = convert_naive_dtm_strs_to_aware(status, self.tzinfo)
+        if status == self._last_status:
+            for gateway in self.gateways:
+                gateway._relog_faults()
+            return []
+
+        self._last_status = status
+        changed: list[EntityBase] = []
 
         # No ActiveFaults in location node of status
 
-        # break the TypedDict into its parts (so, ignore[misc])...
-        for gwy_status in status.pop(SZ_GATEWAYS):  # type: ignore[misc]
+        loc_status: EvoLocStatusResponseT = {  # type: ignore[assignment]
+            k: v for k, v in status.items() if k != SZ_GATEWAYS
+        }
+
+        if loc_status != self._status:
+            self._status = loc_status
+            changed.append(self)
+
+        # cascade the parts of the status to the children (without mutating it)...
+        for gwy_status in status[SZ_GATEWAYS]:
             if gwy := self.gateway_by_id.get(gwy_status[SZ_GATEWAY_ID]):
-                gwy._update_status(gwy_status)
+                changed.extend(gwy._update_status(gwy_status))
 
             else:
                 self._logger.warning(
@@ -262,4 +298,4 @@ class Location(EntityBase):
                     ", (has the location configuration changed?)"
                 )
 
-        self._status = status
+        return changed
@@ -10,6 +10,8 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from aiozoneinfo import async_get_time_zone
 
+from evohome.auth import DEFAULT_SAMPLE_RATE
+from evohome.const import ValidationPolicy
 from evohome.helpers import camel_to_snake
 
 from . import exceptions as exc
@@ -21,7 +23,11 @@ from .schemas import factory_user_account, factory_user_locations_installation_i
 if TYPE_CHECKING:
     import aiohttp
 
+    from evohome.rate_limit import RateLimiter
+    from evohome.retry import RetryPolicy
+
     from .control_system import ControlSystem
+    from .schedule_cache import ScheduleCache
     from .schemas.typedefs import EvoLocConfigResponseT, EvoUsrConfigResponseT
 
 
@@ -44,9 +50,30 @@ class EvohomeClient:
         /,
         *,
         websession: aiohttp.ClientSession | None = None,
+        max_concurrency: int = 1,
+        validation: ValidationPolicy = ValidationPolicy.ALWAYS,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        schedule_cache: ScheduleCache | None = None,
         debug: bool = False,
     ) -> None:
-        """Construct the v2 EvohomeClient object."""
+        """Construct the v2 EvohomeClient object.
+
+        If `max_concurrency` is greater than 1, then `update()` will fetch the status
+        of up to that many locations at a time, rather than one after the other.
+
+        The `validation` policy determines which responses have their schema checked
+        (e.g. only the first response of each URL); see `auth.validation_failures`.
+
+        A `rate_limiter` (which may be shared by many clients) limits the rate of
+        requests to the vendor's servers; see `evohome.rate_limit.RateLimiter`. If
+        there is a `retry_policy`, failed requests may be retried (by default, they
+        are not); see `evohome.retry.RetryPolicy`.
+
+        If there is a `schedule_cache`, schedules are only fetched if they are not
+        cached (or the cached schedule has expired); see `ScheduleCache`.
+        """
 
         self.logger = _LOGGER
         if debug:
@@ -54,11 +81,21 @@ class EvohomeClient:
             self.logger.debug("Debug mode explicitly enabled via kwarg.")
 
         self._token_manager = token_manager
-        self.auth = Auth(token_manager, websession or token_manager.websession)
+        self.auth = Auth(
+            token_manager,
+            websession or token_manager.websession,
+            validation=validation,
+            sample_rate=sample_rate,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
 
         self._locations: list[Location] | None = None  # to preserve the order
         self._location_by_id: dict[str, Location] | None = None
 
+        self.max_concurrency: Final = max_concurrency
+        self.schedule_cache: Final = schedule_cache
+
         self._tzinfo: ZoneInfo | None = None
         self._init_tzinfo = asyncio.create_task(self._async_init_tzinfo())
 
@@ -79,7 +116,8 @@ class EvohomeClient:
         information & the configuration of all their locations.
 
         There is one API call for the user info, and a second for the config of all the
-        user's locations; there are additional API calls for each location's status.
+        user's locations; there are additional API calls for each location's status
+        (these are made concurrently if the client was created with `max_concurrency`).
 
         If `disable_status_update` is true, does not update the status of each location
         hierarchy (and so, does not make those additional API calls).
@@ -99,14 +137,38 @@ class EvohomeClient:
             await self._get_config(dont_update_status=dont_update_status)
 
         if not dont_update_status:  # don't retrieve/update status of location hierarchy
-            #
-            for loc in self.locations:
-                await loc.update()
-                #
+            await self._update_locations()
 
         assert self._user_locs is not None  # mypy
         return self._user_locs
 
+    async def _update_locations(self) -> None:
+        """Update the status of each location, concurrently if so configured.
+
+        Each location (and its descendants) is updated only by its own status GET, so
+        the results don't need merging. If any update fails, the other locations are
+        still updated before the first exception is raised.
+        """
+
+        if self.max_concurrency <= 1 or len(self.locations) <= 1:
+            for loc in self.locations:
+                await loc.update()
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def update(loc: Location) -> None:
+            async with semaphore:
+                await loc.update()
+
+        results = await asyncio.gather(
+            *(update(loc) for loc in self.locations), return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     async def _async_init_tzinfo(self) -> None:
         """Initialize timezone info without blocking the event loop."""
 
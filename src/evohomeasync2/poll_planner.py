@@ -0,0 +1,150 @@
+"""Provides a planner of when to poll a TCC location, based on its schedules.
+
+The state of a location changes mostly at predictable times: at the switchpoints of
+its schedules, and when overrides (e.g. a temporary setpoint, or a TCS mode) expire.
+So, rather than polling at a fixed interval, it is better to poll soon after those
+times, and less often in between.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime as dt, timedelta as td
+from typing import TYPE_CHECKING, Final
+
+from . import exceptions as exc
+
+if TYPE_CHECKING:
+    from .control_system import ControlSystem
+    from .hotwater import HotWater
+    from .location import Location
+    from .zone import Zone
+
+
+DEFAULT_MIN_INTERVAL: Final = td(seconds=60)
+DEFAULT_MAX_INTERVAL: Final = td(minutes=15)
+DEFAULT_POLL_DELAY: Final = td(seconds=30)  # the TCS may be slow to act on a change
+
+
+class PollPlanner:
+    """Plan when to poll a location: soon after its next expected change of state.
+
+    The expected changes are the switchpoints of the (compiled) schedules of its
+    zones/DHW, and the expiry of any overrides. Polls are never closer together than
+    the min_interval, nor further apart than the max_interval (as other changes, e.g.
+    by the user, are not predictable).
+    """
+
+    def __init__(
+        self,
+        location: Location,
+        /,
+        *,
+        min_interval: td = DEFAULT_MIN_INTERVAL,
+        max_interval: td = DEFAULT_MAX_INTERVAL,
+        delay: td = DEFAULT_POLL_DELAY,
+    ) -> None:
+        """Initialise the planner.
+
+        A poll is planned at the delay after an expected change, but within the min
+        and max intervals of the previous poll.
+        """
+
+        if not td(0) < min_interval <= max_interval:
+            raise ValueError(
+                f"intervals must be 0 < min_interval <= max_interval, got "
+                f"{min_interval}, {max_interval}"
+            )
+
+        self.location: Final = location
+
+        self.min_interval: Final = min_interval
+        self.max_interval: Final = max_interval
+        self.delay: Final = delay
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return f"{self.__class__.__name__}(location={self.location.id})"
+
+    def _systems(self) -> list[ControlSystem]:
+        return [t for g in self.location.gateways for t in g.systems]
+
+    @staticmethod
+    def _children(tcs: ControlSystem) -> list[HotWater | Zone]:
+        return [*tcs.zones, *([tcs.hotwater] if tcs.hotwater else [])]
+
+    def next_change(self, now: dt | None = None) -> dt | None:
+        """Return the datetime of the next expected change of state, if any.
+
+        Only schedules that have been fetched (or cached), and overrides of entities
+        whose status has been fetched, are considered.
+        """
+
+        now = now or dt.now(tz=UTC)
+        changes: list[dt] = []
+
+        for tcs in self._systems():
+            children = self._children(tcs)
+
+            changes.extend(
+                e.until
+                for e in (tcs, *children)
+                if e._status is not None and e.until is not None
+            )
+            changes.extend(
+                c.switchpoints(now, count=2)[1][0]
+                for c in children
+                if c._timeline is not None
+            )
+
+        return min((c for c in changes if c > now), default=None)
+
+    def next_poll(self, now: dt | None = None) -> dt:
+        """Return the datetime of the next poll, given the previous one was now."""
+
+        now = now or dt.now(tz=UTC)
+
+        if (change := self.next_change(now)) is None:
+            return now + self.max_interval
+
+        return now + min(
+            max(change + self.delay - now, self.min_interval), self.max_interval
+        )
+
+    async def load_schedules(self) -> None:
+        """Get the schedules of the zones/DHW that have not been fetched already.
+
+        Zones/DHW without a (valid) schedule are ignored (and a warning logged). The
+        schedules are fetched concurrently, as per the client's max_concurrency.
+        """
+
+        async def get_schedule(child: HotWater | Zone) -> None:
+            try:
+                await child.get_schedule()
+            except exc.EvohomeError as err:
+                self.location._logger.warning(
+                    f"{self}: Failed to get schedule of {child.id}: {err}"
+                )
+
+        for tcs in self._systems():
+            await tcs._gather(
+                [get_schedule(c) for c in self._children(tcs) if c._timeline is None],
+                None,
+            )
+
+    async def run(self) -> None:
+        """Poll the location, as planned, until cancelled.
+
+        The schedules are loaded first (if required).
+        """
+
+        await self.load_schedules()
+
+        while True:
+            try:
+                await self.location.update()
+            except exc.EvohomeError as err:  # the next poll may succeed
+                self.location._logger.warning(f"{self}: Failed to poll: {err}")
+
+            now = dt.now(tz=UTC)
+            await asyncio.sleep((self.next_poll(now) - now).total_seconds())
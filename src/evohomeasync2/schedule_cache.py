@@ -0,0 +1,97 @@
+"""Provides a cache of the schedules of TCC zones/DHW.
+
+Schedules rarely change, so they need not be downloaded every time they are used. The
+cache can be dumped to (and loaded from) a JSON-serializable dict, so that it can be
+persisted between runs.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from datetime import UTC, datetime as dt, timedelta as td
+from typing import TYPE_CHECKING, Final, TypedDict
+
+from .const import SZ_DAILY_SCHEDULES
+
+if TYPE_CHECKING:
+    from .schemas.typedefs import DayOfWeekT
+
+
+DEFAULT_SCHEDULE_TTL: Final = td(hours=1)
+
+SZ_FETCHED: Final = "fetched"
+
+
+class ScheduleEntryT(TypedDict):
+    fetched: str  # isoformat, tz-aware
+    daily_schedules: list[DayOfWeekT]
+
+
+class ScheduleCache:
+    """A cache of the schedules of zones/DHW, by entity id.
+
+    A cached schedule is used until it is older than the TTL, or until the entity's
+    schedule is set (which invalidates it). The cache keeps its own copy of each
+    schedule, so that a caller's changes to its copy don't change the cache.
+    """
+
+    def __init__(self, ttl: td = DEFAULT_SCHEDULE_TTL) -> None:
+        """Initialise the cache (it starts empty)."""
+
+        self.ttl: Final = ttl
+        self._entries: dict[str, tuple[dt, list[DayOfWeekT]]] = {}  # by entity id
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return f"{self.__class__.__name__}(ttl={self.ttl}, entries={len(self)})"
+
+    def __len__(self) -> int:
+        """Return the number of schedules in the cache (some may be expired)."""
+        return len(self._entries)
+
+    def get(self, entity_id: str) -> list[DayOfWeekT] | None:
+        """Return the schedule of an entity, or None if it is absent or expired."""
+
+        if (entry := self._entries.get(entity_id)) is None:
+            return None
+        if dt.now(tz=UTC) - entry[0] >= self.ttl:
+            return None
+        return deepcopy(entry[1])
+
+    def set(
+        self,
+        entity_id: str,
+        schedule: list[DayOfWeekT],
+        /,
+        *,
+        fetched: dt | None = None,
+    ) -> None:
+        """Add the schedule of an entity, as fetched at a datetime (default now)."""
+        self._entries[entity_id] = (fetched or dt.now(tz=UTC), deepcopy(schedule))
+
+    def invalidate(self, entity_id: str | None = None) -> None:
+        """Remove the schedule of an entity (or of all entities, if None)."""
+
+        if entity_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(entity_id, None)
+
+    def dump(self) -> dict[str, ScheduleEntryT]:
+        """Return the cache as a JSON-serializable dict (e.g. to save to a file)."""
+
+        return {
+            k: {SZ_FETCHED: v[0].isoformat(), SZ_DAILY_SCHEDULES: v[1]}
+            for k, v in self._entries.items()
+        }
+
+    def load(self, data: dict[str, ScheduleEntryT]) -> None:
+        """Add the schedules from a dict, as returned by dump() (e.g. a saved file).
+
+        Expired schedules are ignored.
+        """
+
+        for entity_id, entry in data.items():
+            fetched = dt.fromisoformat(entry[SZ_FETCHED])
+            if dt.now(tz=UTC) - fetched < self.ttl:
+                self.set(entity_id, entry[SZ_DAILY_SCHEDULES], fetched=fetched)
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Final, NotRequired, TypedDict
 
 import voluptuous as vol
 
-from evohome.helpers import noop
+from evohome.helpers import camel_to_snake, noop
 
 from .const import (
     REGEX_DHW_ID,
@@ -56,6 +56,17 @@ if TYPE_CHECKING:
 # HACK: "2023-05-04T18:47:36.7727046" (7, not 6 digits) seen with gateway fault
 _DTM_FORMAT = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{1,7}$"
 
+# the (snake_case) keys of the only status values that are datetimes
+STATUS_DTM_KEYS: Final = frozenset(
+    camel_to_snake(k) for k in (S2_SINCE, S2_TIME_UNTIL, S2_UNTIL)
+)
+
+# the above datetimes, once the client has converted them to TZ-aware
+_SCH_DTM_AWARE: Final = vol.Any(
+    vol.Datetime(format="%Y-%m-%dT%H:%M:%S%z"),
+    vol.Datetime(format="%Y-%m-%dT%H:%M:%S.%f%z"),
+)
+
 
 # GET /location/{loc_id}/status?include... returns this dict
 class TccLocStatusResponseT(TypedDict):
@@ -135,6 +146,7 @@ def factory_active_faults(fnc: Callable[[str], str] = noop) -> vol.Schema:
                 vol.Datetime(format="%Y-%m-%dT%H:%M:%S"),  # faults for zones
                 vol.Datetime(format="%Y-%m-%dT%H:%M:%S.%f"),
                 vol.All(str, vol.Match(_DTM_FORMAT)),  # faults for gateways
+                _SCH_DTM_AWARE,
             ),
         },
         extra=vol.PREVENT_EXTRA,
@@ -167,7 +179,9 @@ def factory_zon_status(fnc: Callable[[str], str] = noop) -> vol.Schema:
         {
             vol.Required(fnc(S2_TARGET_HEAT_TEMPERATURE)): float,
             vol.Required(fnc(S2_SETPOINT_MODE)): vol.In(ZoneMode),
-            vol.Optional(fnc(S2_UNTIL)): vol.Datetime(format="%Y-%m-%dT%H:%M:%SZ"),
+            vol.Optional(fnc(S2_UNTIL)): vol.Any(
+                vol.Datetime(format="%Y-%m-%dT%H:%M:%SZ"), _SCH_DTM_AWARE
+            ),
         },
         extra=vol.PREVENT_EXTRA,
     )  # NOTE: S2_UNTIL is present only for some modes
@@ -200,7 +214,9 @@ def factory_dhw_status(fnc: Callable[[str], str] = noop) -> vol.Schema:
         {
             vol.Required(fnc(S2_STATE)): vol.In(DhwState),
             vol.Required(fnc(S2_MODE)): vol.In(ZoneMode),
-            vol.Optional(fnc(S2_UNTIL)): vol.Datetime(format="%Y-%m-%dT%H:%M:%SZ"),
+            vol.Optional(fnc(S2_UNTIL)): vol.Any(
+                vol.Datetime(format="%Y-%m-%dT%H:%M:%SZ"), _SCH_DTM_AWARE
+            ),
         },
         extra=vol.PREVENT_EXTRA,
     )  # NOTE: S2_UNTIL is present only for some modes
@@ -234,8 +250,8 @@ def factory_system_mode_status(fnc: Callable[[str], str] = noop) -> vol.Any:
                     str(SystemMode.CUSTOM),
                     str(SystemMode.DAY_OFF),
                 ),
-                vol.Required(fnc(S2_TIME_UNTIL)): vol.Datetime(
-                    format="%Y-%m-%dT%H:%M:%SZ"
+                vol.Required(fnc(S2_TIME_UNTIL)): vol.Any(
+                    vol.Datetime(format="%Y-%m-%dT%H:%M:%SZ"), _SCH_DTM_AWARE
                 ),
                 vol.Required(fnc(S2_IS_PERMANENT)): False,
             }
@@ -5,16 +5,20 @@
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime as dt, timedelta as td
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from datetime import UTC, datetime as dt, time as dt_time, timedelta as td
 from functools import cached_property
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Final, NotRequired, TypedDict
 
-from evohome.helpers import as_local_time, camel_to_snake
+from evohome.helpers import as_local_time, camel_to_snake, convert_keys_to_snake_case
 
 from . import exceptions as exc
 from .const import (
     API_STRFTIME,
+    SZ_ACTIVE_FAULTS,
     SZ_ALLOWED_SETPOINT_MODES,
     SZ_DAILY_SCHEDULES,
     SZ_FAULT_TYPE,
@@ -34,6 +38,7 @@ from .const import (
     SZ_ZONE_ID,
     SZ_ZONE_TYPE,
 )
+from .events import EntityEvent, EventType
 from .schemas import factory_zon_schedule, factory_zon_status
 from .schemas.const import (
     S2_HEAT_SETPOINT_VALUE,
@@ -48,12 +53,14 @@ from .schemas.schedule import DayOfWeek
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Callable, Iterable
     from datetime import tzinfo
 
     import voluptuous as vol
 
     from . import ControlSystem, Location
     from .auth import Auth
+    from .schemas.const import DhwState
     from .schemas.typedefs import (
         DailySchedulesT,
         DayOfWeekT,
@@ -74,7 +81,6 @@ if TYPE_CHECKING:
         EvoZonSetpointCapabilitiesResponseT,
         EvoZonSetpointStatusResponseT,
         EvoZonStatusResponseT,
-        SwitchpointT,
     )
 
     _ScheduleT = list[DayOfWeekT]
@@ -92,9 +98,16 @@ class TccSetZonModeT(TypedDict):
 _ONE_DAY = td(days=1)
 
 
+def _hash_fault(fault: EvoActiveFaultResponseT) -> str:
+    return f"{fault[SZ_SINCE]}_{fault[SZ_FAULT_TYPE]}"
+
+
 class EntityBase:
     _TYPE: EntityType  # e.g. "temperatureControlSystem", "domesticHotWater"
 
+    # the parts of the entity's status that emit an event when changed
+    _EVENT_KEYS: tuple[tuple[str, EventType], ...] = ()
+
     _config: (
         EvoLocConfigEntryT
         | EvoGwyConfigEntryT
@@ -111,6 +124,9 @@ class EntityBase:
         | EvoZonStatusResponseT
         | None
     )
+    _last_status: (  # the status as received, i.e. including that of its descendants
+        EvoGwyStatusResponseT | EvoLocStatusResponseT | EvoTcsStatusResponseT | None
+    )
 
     def __init__(self, entity_id: str, auth: Auth, logger: logging.Logger) -> None:
         self._id: Final = entity_id
@@ -118,10 +134,56 @@ class EntityBase:
         self._auth = auth
         self._logger = logger
 
+        self._listeners: list[Callable[[EntityEvent], None]] = []
+
     def __str__(self) -> str:
         """Return a string representation of the entity."""
         return f"{self.__class__.__name__}(id='{self._id}')"
 
+    # Change events...
+
+    def add_listener(
+        self, listener: Callable[[EntityEvent], None]
+    ) -> Callable[[], None]:
+        """Add a listener for the entity's change events.
+
+        The events are emitted as the entity's status is updated. Returns a callable
+        that will remove the listener.
+        """
+
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    def _emit(self, type_: EventType, old: Any, new: Any) -> None:
+        """Emit a change event to the entity's listeners (if any)."""
+
+        if not self._listeners:
+            return
+
+        event = EntityEvent(self, type_, old, new)
+
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:  # a listener must not break the update of the status
+                self._logger.exception(f"{self}: Error in listener for {event.type}")
+
+    def _emit_changes(self, old_status: Any, new_status: Any) -> None:
+        """Emit an event for each part of the entity's status that has changed."""
+
+        if not self._listeners:  # don't compare the statuses if no-one is listening
+            return
+
+        for key, type_ in self._EVENT_KEYS:
+            old = old_status.get(key) if old_status else None
+            if (new := new_status.get(key)) != old:
+                self._emit(type_, old, new)
+
     # Config attrs...
 
     @cached_property
@@ -160,6 +222,27 @@ class EntityBase:
             )
         return self._status
 
+    @property
+    def full_status(
+        self,
+    ) -> (
+        EvoLocStatusResponseT
+        | EvoGwyStatusResponseT
+        | EvoTcsStatusResponseT
+        | EvoZonStatusResponseT
+        | EvoDhwStatusResponseT
+    ):
+        """Return the latest status of the entity, including that of its descendants.
+
+        It is the entity's part of the status returned by Location.update(), and is
+        shared (not copied) and never mutated, so can be cached without copying.
+        """
+        if self._last_status is None:
+            raise exc.InvalidStatusError(
+                "No status available (have not invoked Location.update()?)"
+            )
+        return self._last_status
+
 
 class ActiveFaultsBase(EntityBase):
     """Provide the base for active faults."""
@@ -180,35 +263,38 @@ class ActiveFaultsBase(EntityBase):
     ) -> None:
         """Maintain self._active_faults list and self._last_logged dict."""
 
-        def hash_(fault: EvoActiveFaultResponseT) -> str:
-            return f"{fault[SZ_SINCE]}_{fault[SZ_FAULT_TYPE]}"
-
-        def log_as_active(fault: EvoActiveFaultResponseT) -> None:
-            self._logger.warning(
-                f"{self}: Active fault: {fault[SZ_SINCE]} {fault[SZ_FAULT_TYPE]}"
-            )
-            self._last_logged[hash_(fault)] = dt.now(tz=UTC)  # aware dtm not required
-
         def log_as_resolved(fault: EvoActiveFaultResponseT) -> None:
             self._logger.info(
                 f"{self}: Fault cleared: {fault[SZ_SINCE]} {fault[SZ_FAULT_TYPE]}"
             )
-            del self._last_logged[hash_(fault)]
+            del self._last_logged[_hash_fault(fault)]
 
         # Remove resolved (non-active) faults
         for fault in [f for f in self._active_faults if f not in active_faults]:
             log_as_resolved(fault)
             self._active_faults.remove(fault)
+            self._emit(EventType.FAULT_CLEARED, fault, None)
 
         # Add new (active) faults
         for fault in [f for f in active_faults if f not in self._active_faults]:
-            log_as_active(fault)
+            self._log_as_active(fault)
             self._active_faults.append(fault)
+            self._emit(EventType.FAULT_RAISED, None, fault)
+
+        self._relog_faults()
+
+    def _log_as_active(self, fault: EvoActiveFaultResponseT) -> None:
+        self._logger.warning(
+            f"{self}: Active fault: {fault[SZ_SINCE]} {fault[SZ_FAULT_TYPE]}"
+        )
+        self._last_logged[_hash_fault(fault)] = dt.now(tz=UTC)  # aware not required
+
+    def _relog_faults(self) -> None:
+        """Re-log active faults if necessary (also when the status is unchanged)."""
 
-        # Re-log active faults if necessary
         for fault in self._active_faults:
-            if dt.now(tz=UTC) - self._last_logged[hash_(fault)] > _ONE_DAY:
-                log_as_active(fault)
+            if dt.now(tz=UTC) - self._last_logged[_hash_fault(fault)] > _ONE_DAY:
+                self._log_as_active(fault)
 
     @property
     def active_faults(self) -> tuple[EvoActiveFaultResponseT, ...]:
@@ -224,56 +310,75 @@ class ActiveFaultsBase(EntityBase):
         return tuple(self._active_faults)
 
 
-def _dt_to_dow_and_tod(dtm: dt, tzinfo: tzinfo) -> tuple[DayOfWeek, str]:
-    """Return a pair of strings representing the local day of week and time of day."""
-    dtm = as_local_time(dtm, tzinfo)
-    return dtm.strftime("%A"), dtm.strftime("%H:%M")  # type: ignore[return-value]
+_MINUTES_PER_DAY: Final = 24 * 60
+_MINUTES_PER_WEEK: Final = 7 * _MINUTES_PER_DAY
 
+_DAY_INDEX: Final[dict[str, int]] = {d: i for i, d in enumerate(DayOfWeek)}  # Mon=0
 
-def _find_switchpoints(
-    schedule: _ScheduleT,
-    day_of_week: DayOfWeek,
-    time_of_day: str,
-) -> tuple[SwitchpointT, int, SwitchpointT, int]:
-    """Find this/next switchpoints for a given day of week and time of day."""
 
-    # TODO: schedule can be [], i.e. response was {'DailySchedules': []}
+class _Timeline:
+    """A weekly schedule, compiled into a sorted timeline of its switchpoints.
 
-    # assumes 1+ switchpoint per day, which could be this_sp or next_sp only
+    Each switchpoint is an offset (in minutes from Monday 00:00, local time) and a
+    value (a setpoint or a DHW state), so lookups are a bisect of the offsets.
+    """
 
-    try:
-        day_idx = list(DayOfWeek).index(day_of_week)
-    except ValueError as err:
-        raise TypeError(f"Invalid parameter: {day_of_week}") from err
+    __slots__ = ("_offsets", "_values")
 
-    this_sp: SwitchpointT | None = None
-    next_sp: SwitchpointT | None = None
+    def __init__(self, schedule: _ScheduleT) -> None:
+        points: list[tuple[int, float | str]] = []
 
-    this_offset = 0
-    next_offset = 0
+        for day in schedule:
+            day_offset = _DAY_INDEX[day["day_of_week"]] * _MINUTES_PER_DAY
 
-    # Check the switchpoints of the given day of week
-    for sp in schedule[day_idx]["switchpoints"]:
-        if sp["time_of_day"] <= time_of_day:
-            this_sp = sp
-            continue
+            for sp in day["switchpoints"]:
+                hh, mm = sp["time_of_day"].split(":")[:2]
+                points.append(
+                    (
+                        day_offset + int(hh) * 60 + int(mm),
+                        sp.get("dhw_state") or sp["heat_setpoint"],
+                    )
+                )
+
+        points.sort(key=lambda p: p[0])
+
+        self._offsets = [p[0] for p in points]
+        self._values = [p[1] for p in points]
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @staticmethod
+    def offset(dtm: dt) -> int:
+        """Return the offset (in minutes from Monday 00:00) of a (local) datetime."""
+        return dtm.weekday() * _MINUTES_PER_DAY + dtm.hour * 60 + dtm.minute
+
+    def setpoints(self, offsets: Iterable[int]) -> array[float]:
+        """Return the setpoints in effect at each of the offsets (for zones only)."""
+
+        values = self._values  # -1 is the previous week's last
+        return array(
+            "d",
+            (values[bisect_right(self._offsets, o) - 1] for o in offsets),  # type: ignore[misc]
+        )
+
+    def switchpoints(self, dtm: dt, count: int) -> list[_SwitchPoint]:
+        """Return the switchpoint in effect at a (local) datetime, and the next ones.
 
-        if sp["time_of_day"] > time_of_day:
-            if this_sp is None:
-                this_sp = schedule[(day_idx + 6) % 7]["switchpoints"][-1]
-                this_offset = -1
+        The datetimes of the switchpoints are local wall-clock times (i.e. naive).
+        """
 
-            next_sp = sp
-            break
+        week_start = dt.combine(dtm.date() - td(days=dtm.weekday()), dt_time())
 
-    else:
-        assert this_sp is not None  # mypy
+        idx = bisect_right(self._offsets, self.offset(dtm)) - 1  # maybe last week's
 
-        if next_sp is None:
-            next_sp = schedule[(day_idx + 1) % 7]["switchpoints"][0]
-            next_offset = +1
+        result = []
+        for i in range(idx, idx + count):
+            weeks, j = divmod(i, len(self._offsets))
+            minutes = weeks * _MINUTES_PER_WEEK + self._offsets[j]
+            result.append((week_start + td(minutes=minutes), self._values[j]))
 
-    return this_sp, this_offset, next_sp, next_offset
+        return result
 
 
 class _ScheduleBase(EntityBase):
@@ -282,6 +387,7 @@ class _ScheduleBase(EntityBase):
     SCH_SCHEDULE: vol.Schema
 
     _schedule: _ScheduleT | None
+    _timeline: _Timeline | None = None  # the compiled schedule
 
     _this_switchpoint: _SwitchPoint  # is float for zones...
     _next_switchpoint: _SwitchPoint  # and str for DHW
@@ -327,7 +433,17 @@ class _ScheduleBase(EntityBase):
         return self._next_switchpoint
 
     async def get_schedule(self) -> _ScheduleT:
-        """Get the schedule for this DHW/zone object."""
+        """Get the schedule for this DHW/zone object.
+
+        If the client has a schedule cache, a cached schedule is used, if it is current.
+        """
+
+        cache = self.location.client.schedule_cache
+
+        if cache is not None and (cached := cache.get(self.id)) is not None:
+            self._logger.debug(f"{self}: Using cached schedule...")
+            self._update_schedule(cached)
+            return cached
 
         self._logger.debug(f"{self}: Getting schedule...")
 
@@ -343,13 +459,41 @@ class _ScheduleBase(EntityBase):
                 ) from err
             raise exc.ApiRequestFailedError(f"{self}: Unexpected error") from err
 
-        self._schedule = schedule[SZ_DAILY_SCHEDULES]
+        if cache is not None:
+            cache.set(self.id, schedule[SZ_DAILY_SCHEDULES])
 
-        self._this_switchpoint, self._next_switchpoint = self._find_switchpoints(
-            dt.now(tz=UTC)
-        )
+        self._update_schedule(schedule[SZ_DAILY_SCHEDULES])
+        return schedule[SZ_DAILY_SCHEDULES]
 
-        return self._schedule
+    def _update_schedule(self, schedule: _ScheduleT) -> None:
+        """Update the schedule, and compile it into a timeline of its switchpoints."""
+
+        self._schedule = schedule
+        self._timeline = _Timeline(schedule) if schedule else None
+
+        if self._timeline:
+            self._this_switchpoint, self._next_switchpoint = self._find_switchpoints(
+                dt.now(tz=UTC)
+            )
+
+    def switchpoints(self, dtm: dt, /, count: int = 2) -> list[_SwitchPoint]:
+        """Return the switchpoint in effect at a datetime, and the next count - 1.
+
+        Each switchpoint is a (tz-aware) start datetime and a setpoint (or DHW state).
+        """
+
+        if not self._timeline:
+            raise exc.InvalidScheduleError(f"{self}: No Schedule, or is invalid")
+
+        tzinfo = self.location.tzinfo
+        return [
+            (d.replace(tzinfo=tzinfo), v)
+            for d, v in self._timeline.switchpoints(as_local_time(dtm, tzinfo), count)
+        ]
+
+    def setpoint_at(self, dtm: dt, /) -> float | str:
+        """Return the scheduled setpoint (or DHW state) at a datetime."""
+        return self.switchpoints(dtm, count=1)[0][1]
 
     def _find_switchpoints(self, dtm: dt) -> tuple[_SwitchPoint, _SwitchPoint]:
         """Find the current (this) and next switchpoints for a given datetime.
@@ -363,26 +507,8 @@ class _ScheduleBase(EntityBase):
         }
         """
 
-        dtm = as_local_time(dtm, self.location.tzinfo)
-
-        this_sp, this_offset, next_sp, next_offset = _find_switchpoints(
-            self.schedule, *_dt_to_dow_and_tod(dtm, self.location.tzinfo)
-        )
-
-        this_tod = dt.strptime(this_sp["time_of_day"], "%H:%M:00").time()  # noqa: DTZ007
-        next_tod = dt.strptime(next_sp["time_of_day"], "%H:%M:00").time()  # noqa: DTZ007
-
-        this_dtm = dt.combine(dtm + td(days=this_offset), this_tod)
-        next_dtm = dt.combine(dtm + td(days=next_offset), next_tod)
-
-        # either "dhw_state" (str) or "heat_setpoint" (float) _will_ be present...
-        this_val = this_sp.get("dhw_state") or this_sp["heat_setpoint"]
-        next_val = next_sp.get("dhw_state") or next_sp["heat_setpoint"]
-
-        return (
-            (this_dtm.replace(tzinfo=self.location.tzinfo), this_val),
-            (next_dtm.replace(tzinfo=self.location.tzinfo), next_val),
-        )
+        this_sp, next_sp = self.switchpoints(dtm, count=2)
+        return this_sp, next_sp
 
     async def set_schedule(
         self,
@@ -415,6 +541,10 @@ class _ScheduleBase(EntityBase):
                 f"{self}: Invalid schedule: {type(schedule)} is not JSON serializable"
             )
 
+        # the schedule may be camelCase (e.g. from the vendor's API), but is compiled
+        # from snake_case, as per get_schedule()
+        schedule = convert_keys_to_snake_case(schedule)
+
         _ = await self._auth.put(
             f"{self._TYPE}/{self.id}/schedule",
             json={"daily_schedules": schedule},
@@ -423,10 +553,58 @@ class _ScheduleBase(EntityBase):
 
         # TODO: check the status of the task
 
-        self._schedule = schedule
+        if (cache := self.location.client.schedule_cache) is not None:
+            cache.invalidate(self.id)  # the vendor may have normalised the schedule
+        self._update_schedule(schedule)
+
 
+class _StatusRecord:
+    """The status of a DHW/zone, as parsed once per status update.
 
-class _ZoneBase(_ScheduleBase, ActiveFaultsBase, EntityBase):
+    Saves navigating the status dict (and parsing its datetimes) on every access.
+    """
+
+    __slots__ = (
+        "_until",
+        "_until_dtm",
+        "is_available",
+        "mode",
+        "setpoint",
+        "state",
+        "temperature",
+    )
+
+    def __init__(
+        self,
+        temperature_status: EvoTemperatureStatusResponseT,
+        mode: ZoneMode,
+        until: str | None,
+        *,
+        setpoint: float | None = None,  # zones only
+        state: DhwState | None = None,  # DHW only
+    ) -> None:
+        self.is_available = temperature_status[SZ_IS_AVAILABLE]
+        self.temperature = (  # None if not available
+            temperature_status.get(SZ_TEMPERATURE) if self.is_available else None
+        )
+        self.mode = mode
+        self.setpoint = setpoint
+        self.state = state
+
+        self._until = until
+        self._until_dtm: dt | None = None
+
+    def until(self, tzinfo: tzinfo) -> dt | None:
+        """Return the until datetime (it is parsed on first access)."""
+
+        if self._until is None:
+            return None
+        if self._until_dtm is None:
+            self._until_dtm = as_local_time(self._until, tzinfo)
+        return self._until_dtm
+
+
+class _ZoneBase(_ScheduleBase, ActiveFaultsBase, EntityBase, ABC):
     """Provide the base for temperatureZone / domesticHotWater Zones."""
 
     SCH_STATUS: vol.Schema
@@ -439,6 +617,8 @@ class _ZoneBase(_ScheduleBase, ActiveFaultsBase, EntityBase):
         self.location = tcs.location
         self.tcs = tcs
 
+        self._record: _StatusRecord | None = None
+
     # Status (state) attrs & methods...
 
     async def _get_status(self) -> EvoDhwStatusResponseT | EvoZonStatusResponseT:
@@ -455,13 +635,43 @@ class _ZoneBase(_ScheduleBase, ActiveFaultsBase, EntityBase):
         self._update_status(status)
         return status
 
+    @property
+    def full_status(self) -> EvoDhwStatusResponseT | EvoZonStatusResponseT:
+        """Return the latest status of the entity (a DHW/zone has no descendants)."""
+        return self.status  # type: ignore[return-value]
+
     def _update_status(
         self, status: EvoDhwStatusResponseT | EvoZonStatusResponseT
-    ) -> None:
-        """Update the DHW/ZON's status."""
+    ) -> list[EntityBase]:
+        """Update the DHW/ZON's status.
+
+        Returns the entities whose status has changed (i.e. [self], or []).
+        """
+
+        if status == self._status:
+            self._relog_faults()
+            return []
 
-        self._update_faults(status["active_faults"])
-        self._status = status
+        record = self._parse_status(status)
+        self._update_faults(status[SZ_ACTIVE_FAULTS])
+
+        old_status, self._status = self._status, status
+        self._record = record
+        self._emit_changes(old_status, status)
+
+        return [self]
+
+    @abstractmethod
+    def _parse_status(
+        self, status: EvoDhwStatusResponseT | EvoZonStatusResponseT
+    ) -> _StatusRecord:
+        """Return the parsed status of the DHW/zone."""
+
+    @property
+    def _status_record(self) -> _StatusRecord:
+        if self._record is None:
+            raise exc.InvalidStatusError(f"{self} has no state, has it been fetched?")
+        return self._record
 
     @property
     def temperature_status(self) -> EvoTemperatureStatusResponseT:
@@ -478,15 +688,17 @@ class _ZoneBase(_ScheduleBase, ActiveFaultsBase, EntityBase):
 
     @property  # a convenience attr
     def temperature(self) -> float | None:
-        if not (status := self.temperature_status) or not status[SZ_IS_AVAILABLE]:
-            return None
-        return status[SZ_TEMPERATURE]
+        return self._status_record.temperature
 
 
 class Zone(_ZoneBase):
     """Instance of a TCS's heating zone (temperatureZone)."""
 
     _TYPE = EntityType.ZON
+    _EVENT_KEYS = (
+        (SZ_TEMPERATURE_STATUS, EventType.TEMPERATURE),
+        (SZ_SETPOINT_STATUS, EventType.SETPOINT),
+    )
 
     SCH_SCHEDULE: vol.Schema = factory_zon_schedule(camel_to_snake)
     SCH_STATUS: vol.Schema = factory_zon_status(camel_to_snake)
@@ -605,17 +817,27 @@ class Zone(_ZoneBase):
 
     @property
     def mode(self) -> ZoneMode:
-        return self.setpoint_status[SZ_SETPOINT_MODE]
+        return self._status_record.mode
 
     @property
     def target_heat_temperature(self) -> float:
-        return self.setpoint_status[SZ_TARGET_HEAT_TEMPERATURE]
+        return self._status_record.setpoint  # type: ignore[return-value]
 
     @property
     def until(self) -> dt | None:
-        if (until := self.setpoint_status.get("until")) is None:
-            return None
-        return as_local_time(until, self.location.tzinfo)
+        return self._status_record.until(self.location.tzinfo)
+
+    def _parse_status(self, status: EvoZonStatusResponseT) -> _StatusRecord:  # type: ignore[override]
+        """Return the parsed status of the zone."""
+
+        setpoint_status = status[SZ_SETPOINT_STATUS]
+
+        return _StatusRecord(
+            status[SZ_TEMPERATURE_STATUS],
+            setpoint_status[SZ_SETPOINT_MODE],
+            setpoint_status.get("until"),
+            setpoint=setpoint_status[SZ_TARGET_HEAT_TEMPERATURE],
+        )
 
     async def _set_mode(self, mode: TccSetZonModeT) -> None:
         """Set the zone mode (heating only, a cooling is not exposed by the API)."""
@@ -152,13 +152,15 @@ def zone_schedule_fixture(folder: Path, zon_type: str) -> JsonObjectType:
     )  # type: ignore[return-value]
 
 
-def auth_get(fixture: Path) -> Callable[[Any, str, vol.Schema | None], Any]:
+def auth_get(fixture: Path) -> Callable[..., Any]:
     """Return a mock of Auth.get() for both v0 and v2 API."""
 
     async def get(  # type: ignore[no-untyped-def]
         self,  # noqa: ANN001
         url: str,
         schema: vol.Schema | None = None,
+        *,
+        convert_keys: bool = True,
     ) -> JsonArrayType | JsonObjectType:
         # "accountInfo"
         if "accountInfo" in url:
@@ -186,9 +188,10 @@ def auth_get(fixture: Path) -> Callable[[Any, str, vol.Schema | None], Any]:
 
         # f"{_TYPE}/{id}/status?includeTemperatureControlSystems=True"
         if "status" in url:
-            return convert_keys_to_snake_case(  # type: ignore[no-any-return]
-                TCC_GET_LOC_STATUS(location_status_fixture(fixture, url.split("/")[1]))
+            status = TCC_GET_LOC_STATUS(
+                location_status_fixture(fixture, url.split("/")[1])
             )
+            return convert_keys_to_snake_case(status) if convert_keys else status  # type: ignore[no-any-return]
 
         # f"{_TYPE}/{id}/schedule"
         if "schedule" in url:
@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from copy import deepcopy
+from datetime import UTC, datetime as dt, timedelta as td
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, patch
 
-from evohome.helpers import convert_keys_to_snake_case
+import pytest
+
+from evohome.helpers import convert_keys_to_camel_case, convert_keys_to_snake_case
+from evohomeasync2 import (
+    BackupStatus,
+    EvohomeClient,
+    PollPlanner,
+    RestoreStatus,
+    ScheduleCache,
+    exceptions as exc,
+)
+from evohomeasync2.auth import Auth
 from evohomeasync2.schemas import TCC_GET_DHW_SCHEDULE, TCC_GET_ZON_SCHEDULE
 from evohomeasync2.schemas.const import DayOfWeek
-from evohomeasync2.zone import _find_switchpoints
+from evohomeasync2.zone import _Timeline
 
-from .conftest import JsonObjectType, load_fixture
+from .conftest import FIXTURES_V2, JsonObjectType, auth_get, load_fixture
 
 if TYPE_CHECKING:
-    from evohomeasync2.schemas.typedefs import DayOfWeekT
+    from freezegun.api import FrozenDateTimeFactory
+
+    from evohomeasync2.schemas.typedefs import DayOfWeekT, SwitchpointT
+    from tests.conftest import CredentialsManager
 
 SCHEDULES_DIR = Path(__file__).parent / "schedules"
 
@@ -119,42 +138,404 @@ def test_schema_schedule_zone() -> None:
     # assert get_sched == convert_to_get_schedule(put_sched)
 
 
-def test_find_switchpoints() -> None:
-    """Test the find_switchpoints method."""
+def test_switchpoints() -> None:
+    """Test the switchpoints of the compiled timeline (this/next, and their days)."""
 
     schedule: list[DayOfWeekT] = SCHEDULE["daily_schedules"]  # type: ignore[assignment]
+    timeline = _Timeline(schedule)
 
-    assert _find_switchpoints(schedule, DayOfWeek.MONDAY, "00:00:00") == (
-        {"heat_setpoint": 14.8, "time_of_day": "21:30:00"},
-        -1,
-        {"heat_setpoint": 23.2, "time_of_day": "06:30:00"},
-        0,
-    )
+    monday = dt(2025, 1, 6)  # noqa: DTZ001 (a Monday, as a wall-clock time)
 
-    assert _find_switchpoints(schedule, DayOfWeek.TUESDAY, "07:59:59") == (
-        {"heat_setpoint": 19.2, "time_of_day": "06:30:00"},
-        0,
-        {"heat_setpoint": 18.2, "time_of_day": "08:00:00"},
-        0,
-    )
+    assert timeline.switchpoints(monday, 2) == [  # the last of the previous week
+        (monday - td(days=1) + td(hours=21, minutes=30), 14.8),
+        (monday + td(hours=6, minutes=30), 23.2),
+    ]
 
-    assert _find_switchpoints(schedule, DayOfWeek.TUESDAY, "08:00:00") == (
-        {"heat_setpoint": 18.2, "time_of_day": "08:00:00"},
-        0,
-        {"heat_setpoint": 19.3, "time_of_day": "17:00:00"},
-        0,
-    )
+    tuesday = monday + td(days=1)
+
+    assert timeline.switchpoints(tuesday + td(hours=7, minutes=59, seconds=59), 2) == [
+        (tuesday + td(hours=6, minutes=30), 19.2),
+        (tuesday + td(hours=8), 18.2),
+    ]
+
+    for dtm in (tuesday + td(hours=8), tuesday + td(hours=8, seconds=1)):
+        assert timeline.switchpoints(dtm, 2) == [
+            (tuesday + td(hours=8), 18.2),
+            (tuesday + td(hours=17), 19.3),
+        ]
+
+    sunday = monday + td(days=6)
+
+    assert timeline.switchpoints(sunday + td(hours=23, minutes=59), 2) == [
+        (sunday + td(hours=21, minutes=30), 14.8),
+        (sunday + td(days=1, hours=6, minutes=30), 23.2),  # the next week
+    ]
+
+
+def test_timeline() -> None:
+    """Test the compiled timeline agrees with the schedule, minute by minute."""
+
+    schedule: list[DayOfWeekT] = SCHEDULE["daily_schedules"]  # type: ignore[assignment]
+    timeline = _Timeline(schedule)
+
+    assert len(timeline) == sum(len(d["switchpoints"]) for d in schedule)
+
+    def value(sp: SwitchpointT) -> float | str:
+        return sp.get("dhw_state") or sp["heat_setpoint"]
+
+    # every switchpoint of the schedule, in order, as (day of week, time, value)
+    points = [
+        (
+            list(DayOfWeek).index(DayOfWeek(d["day_of_week"])),
+            sp["time_of_day"][:5],
+            value(sp),
+        )
+        for d in schedule
+        for sp in d["switchpoints"]
+    ]
+    points.sort(key=lambda p: p[:2])
+
+    monday = dt(2025, 1, 6)  # noqa: DTZ001 (a Monday, as a wall-clock time)
+
+    for minutes in range(0, 7 * 24 * 60, 7):  # every 7th minute of a week
+        dtm = monday + td(minutes=minutes)
+
+        (this_dtm, this_val), (next_dtm, next_val) = timeline.switchpoints(dtm, 2)
+
+        assert this_dtm <= dtm < next_dtm
+
+        # this/next are switchpoints of the schedule, and are consecutive
+        idx = points.index((this_dtm.weekday(), this_dtm.strftime("%H:%M"), this_val))
+        assert points[(idx + 1) % len(points)] == (
+            next_dtm.weekday(),
+            next_dtm.strftime("%H:%M"),
+            next_val,
+        )
+
+    # the timeline wraps around, to the following weeks
+    weeks = timeline.switchpoints(monday + td(days=6, hours=23), len(timeline) + 2)
+    assert weeks[-1][0] - weeks[1][0] == td(weeks=1)
+    assert weeks[-1][1] == weeks[1][1]
+
+
+def test_schedule_cache_copies() -> None:
+    """Test changes to a schedule, once set or got, don't change the cached schedule."""
+
+    cache = ScheduleCache()
+    schedule: list[DayOfWeekT] = deepcopy(SCHEDULE["daily_schedules"])  # type: ignore[arg-type]
+
+    cache.set("3432576", schedule)
+    schedule[0]["switchpoints"].clear()
+
+    cached = cache.get("3432576")
+    assert cached == SCHEDULE["daily_schedules"]
+
+    cached[0]["switchpoints"].clear()
+    assert cache.get("3432576") == SCHEDULE["daily_schedules"]
+
+
+async def test_schedule_cache(
+    credentials_manager: CredentialsManager,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test schedules are cached until they expire, or are set."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    cache = ScheduleCache(ttl=td(hours=1))
+
+    with patch.object(
+        Auth, "get", autospec=True, side_effect=auth_get(FIXTURES_V2 / "system_004")
+    ) as get:
+        evo = EvohomeClient(credentials_manager, schedule_cache=cache)
+        await evo.update()
+
+        tcs = evo.locations[0].gateways[0].systems[0]
+        num_schedules = len(tcs.zones) + (1 if tcs.hotwater else 0)
+
+        def num_gets() -> int:
+            return sum(c.args[1].endswith("/schedule") for c in get.call_args_list)
+
+        schedules = await tcs.get_schedules()
+        assert num_gets() == len(cache) == num_schedules
+
+        assert await tcs.get_schedules() == schedules  # are all cached
+        assert num_gets() == num_schedules
+
+        freezer.tick(td(minutes=30))
+
+        with patch("evohome.auth.AbstractAuth.request"):
+            await tcs.zones[0].set_schedule(tcs.zones[0].schedule)  # type: ignore[arg-type]
+
+        await tcs.zones[0].get_schedule()  # was invalidated by set_schedule()
+        assert num_gets() == num_schedules + 1
+
+        saved = ScheduleCache(ttl=td(hours=1))
+        saved.load(json.loads(json.dumps(cache.dump())))
+        assert len(saved) == num_schedules
+
+        freezer.tick(td(minutes=30))
+
+        await tcs.get_schedules()  # all but one have expired
+        assert num_gets() == num_schedules * 2
+
+
+async def test_set_schedule_camel_case(
+    credentials_manager: CredentialsManager,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a camelCase schedule is set, and compiled, as if it were snake_case."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    cache = ScheduleCache(ttl=td(hours=1))
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(FIXTURES_V2 / "system_004")):
+        evo = EvohomeClient(credentials_manager, schedule_cache=cache)
+        await evo.update()
+
+        zone = evo.locations[0].gateways[0].systems[0].zones[0]
+        schedule = await zone.get_schedule()
+
+    assert cache.get(zone.id) is not None
+
+    with patch("evohome.auth.AbstractAuth.request") as req:
+        await zone.set_schedule(convert_keys_to_camel_case(schedule))
+
+    assert req.call_args.kwargs["json"] == {"daily_schedules": schedule}
+
+    assert zone.schedule == schedule
+    assert zone._timeline is not None
+    assert cache.get(zone.id) is None  # was invalidated
+
+
+async def test_schedules_concurrent(
+    credentials_manager: CredentialsManager,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test schedules are backed up/restored concurrently, reporting failures."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    get = auth_get(FIXTURES_V2 / "system_004")
 
-    assert _find_switchpoints(schedule, DayOfWeek.TUESDAY, "08:00:01") == (
-        {"heat_setpoint": 18.2, "time_of_day": "08:00:00"},
-        0,
-        {"heat_setpoint": 19.3, "time_of_day": "17:00:00"},
-        0,
+    with patch("evohomeasync2.auth.Auth.get", get):
+        evo = EvohomeClient(credentials_manager)
+        await evo.update()
+
+        tcs = evo.locations[0].gateways[0].systems[0]
+        schedules = await tcs.get_schedules()
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def concurrent_get(self: Any, url: str, *args: Any, **kwargs: Any) -> Any:
+        nonlocal in_flight, max_in_flight
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)  # allow the other GETs to start
+        in_flight -= 1
+
+        if url.startswith(f"temperatureZone/{tcs.zones[0].id}/"):
+            raise exc.ApiRequestFailedError("Service unavailable", status=503)
+        return await get(self, url, *args, **kwargs)
+
+    with patch("evohomeasync2.auth.Auth.get", concurrent_get):
+        result, status = await tcs.backup_schedules(max_concurrency=2)
+
+    assert max_in_flight == 2  # noqa: PLR2004
+    assert result == schedules[1:]  # the failed zone is omitted, the order is kept
+
+    assert list(status) == [s["zone_id"] for s in schedules]  # type: ignore[typeddict-item]
+    assert status[tcs.zones[0].id] == BackupStatus.FAILED
+    assert BackupStatus.FAILED not in list(status.values())[1:]
+
+    with (
+        patch("evohomeasync2.auth.Auth.get", concurrent_get),
+        pytest.raises(exc.ApiRequestFailedError),
+    ):
+        await tcs.get_schedules(max_concurrency=2)  # a partial backup is an error
+
+    with patch(
+        "evohome.auth.AbstractAuth.request",
+        side_effect=exc.ApiRequestFailedError("Service unavailable", status=503),
+    ):
+        assert await tcs.set_schedules(schedules, max_concurrency=2) is False
+
+
+async def test_gather_failure(
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test a failed coroutine cancels the others, rather than leaving them running."""
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(FIXTURES_V2 / "system_004")):
+        evo = EvohomeClient(credentials_manager)
+        await evo.update()
+
+    tcs = evo.locations[0].gateways[0].systems[0]
+    completed: list[int] = []
+
+    async def work(idx: int) -> int:
+        await asyncio.sleep(0)
+        if idx == 0:
+            raise exc.ApiRequestFailedError("Service unavailable", status=503)
+        await asyncio.sleep(0.01)  # i.e. complete after the failure
+        completed.append(idx)
+        return idx
+
+    with pytest.raises(exc.ApiRequestFailedError):
+        await tcs._gather([work(i) for i in range(3)], 3)
+
+    await asyncio.sleep(0.02)
+    assert completed == []  # none were left running
+
+    assert await tcs._gather([work(i) for i in range(1, 3)], 1) == [1, 2]
+
+
+async def test_restore_schedules(
+    credentials_manager: CredentialsManager,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test only the schedules that differ from the current schedules are restored."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(FIXTURES_V2 / "system_004")):
+        evo = EvohomeClient(credentials_manager)
+        await evo.update()
+
+        tcs = evo.locations[0].gateways[0].systems[0]
+        schedules = deepcopy(await tcs.get_schedules())
+
+        schedules[0]["daily_schedules"][0]["switchpoints"][0]["heat_setpoint"] += 1  # type: ignore[typeddict-item]
+        schedules[1]["daily_schedules"].reverse()  # the order of days doesn't matter
+        schedules.append({**schedules[1], "zone_id": "0000000"})  # type: ignore[arg-type]
+
+        with patch("evohome.auth.AbstractAuth.request") as req:
+            report = await tcs.restore_schedules(schedules)
+
+    assert req.call_count == 1
+    assert (
+        report
+        == {
+            schedules[0]["zone_id"]: RestoreStatus.RESTORED,  # type: ignore[typeddict-item]
+            **{
+                s["zone_id"]: RestoreStatus.UNCHANGED  # type: ignore[typeddict-item]
+                for s in schedules[1:-1]
+            },
+            "0000000": RestoreStatus.UNMATCHED,
+        }
     )
 
-    assert _find_switchpoints(schedule, DayOfWeek.SUNDAY, "23:59:59") == (
-        {"heat_setpoint": 14.8, "time_of_day": "21:30:00"},
-        0,
-        {"heat_setpoint": 23.2, "time_of_day": "06:30:00"},
-        1,
+    def request(method: str, url: str, **kwargs: Any) -> None:
+        if url.startswith(f"temperatureZone/{tcs.zones[0].id}/"):
+            raise TimeoutError
+
+    # any failure of one schedule is reported, rather than failing the restore
+    with patch("evohome.auth.AbstractAuth.request", side_effect=request):
+        report = await tcs.restore_schedules(schedules[:-1], only_changed=False)
+
+    assert report[tcs.zones[0].id] == RestoreStatus.FAILED
+    assert set(list(report.values())[1:]) == {RestoreStatus.RESTORED}
+
+
+async def test_get_setpoints(
+    credentials_manager: CredentialsManager,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the setpoints of a TCS's zones are tabulated over a grid of datetimes."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(FIXTURES_V2 / "system_004")):
+        evo = EvohomeClient(credentials_manager)
+        await evo.update()
+
+        tcs = evo.locations[0].gateways[0].systems[0]
+
+        start = dt(2025, 1, 6, tzinfo=tcs.location.tzinfo)
+        grid = [start + td(minutes=10 * i) for i in range(7 * 24 * 6)]  # 7 days
+
+        table = await tcs.get_setpoints(grid)
+
+    assert len(table) == len(grid)
+    assert table.zone_ids  # i.e. there are zones with schedules
+    assert table.timestamps == tuple(grid)
+    assert table.zone_ids == tuple(z.id for z in tcs.zones)
+
+    for zone in tcs.zones:  # the schedules were fetched, so no more GETs are needed
+        column = table[zone.id]
+        assert len(column) == len(grid)
+        assert all(column[i] == zone.setpoint_at(d) for i, d in enumerate(grid))
+
+    assert table.row(0) == {z.id: z.setpoint_at(start) for z in tcs.zones}
+
+
+async def test_poll_planner(
+    credentials_manager: CredentialsManager,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test polls are planned soon after switchpoints, and within the intervals."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(FIXTURES_V2 / "system_004")):
+        evo = EvohomeClient(credentials_manager)
+        await evo.update()
+
+        loc = evo.locations[0]
+        planner = PollPlanner(loc, max_interval=td(hours=24))
+
+        assert planner.next_change() is None  # no schedules have been fetched
+        await planner.load_schedules()
+
+    now = dt.now(tz=UTC)
+    tcs = loc.gateways[0].systems[0]
+
+    children = [*tcs.zones, *([tcs.hotwater] if tcs.hotwater else [])]
+    switchpoints = [c.switchpoints(now)[1][0] for c in children]
+    assert planner.next_change(now) == min(switchpoints)
+    assert planner.next_poll(now) == max(
+        min(switchpoints) + planner.delay, now + planner.min_interval
     )
+
+    planner = PollPlanner(loc, min_interval=td(minutes=1), max_interval=td(minutes=5))
+    assert planner.next_poll(now) - now <= td(minutes=5)
+
+    with pytest.raises(ValueError, match="intervals must be"):
+        PollPlanner(loc, min_interval=td(hours=1), max_interval=td(minutes=5))
+
+
+async def test_poll_planner_no_status(
+    credentials_manager: CredentialsManager,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the planner drives polls even if no status has (ever) been fetched."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(FIXTURES_V2 / "system_004")):
+        evo = EvohomeClient(credentials_manager)
+        await evo.update(dont_update_status=True)
+
+        loc = evo.locations[0]
+        planner = PollPlanner(loc)
+
+        now = dt.now(tz=UTC)
+        assert planner.next_change(now) is None  # there is nothing to plan by
+        assert planner.next_poll(now) == now + planner.max_interval
+
+        update = AsyncMock(side_effect=exc.ApiRequestFailedError("Not available"))
+        sleep = AsyncMock(side_effect=[None, asyncio.CancelledError])
+
+        with (
+            patch.object(loc, "update", new=update),
+            patch("evohomeasync2.poll_planner.asyncio.sleep", new=sleep),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await planner.run()  # the schedules are loaded, but the polls all fail
+
+    assert update.call_count == 2  # noqa: PLR2004
+    assert sleep.call_args.args[0] == (planner.next_poll(now) - now).total_seconds()
+    assert planner.next_change(now) is not None  # the schedules were loaded
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from datetime import UTC
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
 
-from evohome.helpers import camel_to_snake, convert_keys_to_snake_case
+from evohome.helpers import (
+    camel_to_snake,
+    convert_keys_to_snake_case,
+    convert_naive_dtm_strs_to_aware,
+)
+from evohome.schema_compiler import compile_schema
 from evohomeasync2 import Location
 from evohomeasync2.schemas.config import factory_tcs, factory_time_zone
 from evohomeasync2.schemas.const import (
@@ -19,7 +25,7 @@ from evohomeasync2.schemas.const import (
     S2_TIME_ZONE,
     S2_USE_DAYLIGHT_SAVE_SWITCHING,
 )
-from evohomeasync2.schemas.status import factory_loc_status
+from evohomeasync2.schemas.status import STATUS_DTM_KEYS, factory_loc_status
 
 from .conftest import ClientStub
 from .const import TEST_DIR
@@ -85,7 +91,7 @@ def test_config_schemas(config: dict[str, Any]) -> None:
 def test_status_schemas(status: dict[str, Any]) -> None:
     """Test the status schema for a location."""
 
-    _ = SCH_LOCN_STATUS(status)
+    assert compile_schema(SCH_LOCN_STATUS)(status) == SCH_LOCN_STATUS(status)
 
 
 # def test_came_to_snake() -> None:
@@ -94,3 +100,23 @@ def test_status_schemas(status: dict[str, Any]) -> None:
 assert camel_to_snake("camel2_camel2_case") == "camel2_camel2_case"
 assert camel_to_snake("getHTTPResponseCode") == "get_http_response_code"
 assert camel_to_snake("HTTPResponseCodeXYZ") == "http_response_code_xyz"
+
+# the converted keys are cached, so the result must be the same the second time around
+assert camel_to_snake("getHTTPResponseCode") == "get_http_response_code"
+assert camel_to_snake.cache_info().hits > 0
+
+# only the values of the datetime keys are converted, when they are specified
+_STATUS = {
+    "name": "2023-11-30T22:10:00",  # looks like a datetime, but isn't one
+    "active_faults": [{"since": "2023-11-30T22:10:00"}],
+    "setpoint_status": {"until": "2023-11-30T22:10:00Z"},
+}
+
+assert convert_naive_dtm_strs_to_aware(_STATUS, UTC, dtm_keys=STATUS_DTM_KEYS) == {
+    "name": "2023-11-30T22:10:00",
+    "active_faults": [{"since": "2023-11-30T22:10:00+00:00"}],
+    "setpoint_status": {"until": "2023-11-30T22:10:00+00:00"},
+}
+assert convert_naive_dtm_strs_to_aware(_STATUS, UTC)["name"] == (
+    "2023-11-30T22:10:00+00:00"
+)
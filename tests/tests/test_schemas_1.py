@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
 
+import voluptuous as vol
+
 from evohome.helpers import convert_keys_to_snake_case
+from evohome.schema_compiler import compile_schema
 from evohomeasync2.location import create_location
 from evohomeasync2.schemas import TCC_GET_LOC_STATUS
 from evohomeasync2.schemas.config import factory_tcs, factory_time_zone
 from evohomeasync2.schemas.const import (
     S2_GATEWAYS,
+    S2_LOCATION_ID,
     S2_LOCATION_INFO,
     S2_SUPPORTS_DAYLIGHT_SAVING,
     S2_TEMPERATURE_CONTROL_SYSTEMS,
@@ -22,6 +27,8 @@ from .conftest import ClientStub
 from .const import TEST_DIR
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pytest
 
 WORK_DIR = f"{TEST_DIR}/schemas_1"
@@ -72,4 +79,30 @@ def test_config_schemas(config: dict[str, Any]) -> None:
 def test_status_schemas(status: dict[str, Any]) -> None:
     """Test the status schema for a location."""
 
-    _ = TCC_GET_LOC_STATUS(status)
+    assert compile_schema(TCC_GET_LOC_STATUS)(status) == TCC_GET_LOC_STATUS(status)
+
+
+def test_status_schemas_invalid(status: dict[str, Any]) -> None:
+    """Test the compiled status schema rejects invalid statuses, as would the schema."""
+
+    def result(validator: Any, data: dict[str, Any]) -> Any:
+        try:
+            return validator(data)
+        except vol.Invalid as err:
+            return type(err), str(err)
+
+    mutations: dict[str, Callable[[dict[str, Any]], Any]] = {
+        "extra key": lambda d: d.update({"unexpectedKey": None}),
+        "missing key": lambda d: d.pop(S2_LOCATION_ID),
+        "wrong type": lambda d: d.update({S2_LOCATION_ID: 1234567}),
+        "not a list": lambda d: d.update({S2_GATEWAYS: {}}),
+        "bad item": lambda d: d[S2_GATEWAYS].append([]),
+    }
+
+    for mutate in mutations.values():
+        data = deepcopy(status)
+        mutate(data)
+
+        assert result(compile_schema(TCC_GET_LOC_STATUS), data) == result(
+            TCC_GET_LOC_STATUS, data
+        )
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import uuid
+from datetime import UTC, datetime as dt, timedelta as td
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
@@ -24,6 +26,8 @@ if TYPE_CHECKING:
     from cli.auth import CacheDataT
     from freezegun.api import FrozenDateTimeFactory
 
+    from evohomeasync.auth import SessionIdEntryT
+
 
 async def test_get_session_id(
     client_session: aiohttp.ClientSession,
@@ -115,6 +119,187 @@ async def test_get_session_id(
     assert session_manager.is_session_valid() is False
 
 
+async def test_get_session_id_concurrently(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test concurrent calls to .get_session_id() share a single fetch."""
+
+    async def post_session_id_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0)  # allow the other callers to (try to) fetch a session
+        return {"sessionId": str(uuid.uuid4()), "userInfo": {}}
+
+    session_manager = CredentialsManager(
+        *credentials, client_session, cache_file=cache_file
+    )
+
+    with (
+        patch(
+            "evohomeasync.auth.AbstractSessionManager._post_session_id_request",
+            side_effect=post_session_id_request,
+        ) as req,
+        patch("cli.auth.CredentialsManager.save_session_id", new_callable=AsyncMock),
+    ):
+        session_ids = await asyncio.gather(
+            *(session_manager.get_session_id() for _ in range(5))
+        )
+
+        req.assert_called_once()
+
+    assert len(set(session_ids)) == 1
+    assert session_manager.is_session_valid() is True
+
+
+async def test_refresh_session_id(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test the session id is renewed in the background, before it expires."""
+
+    with (
+        patch(
+            "evohomeasync.auth.AbstractSessionManager._post_session_id_request",
+            new_callable=AsyncMock,
+        ) as req,
+        patch("cli.auth.CredentialsManager.save_session_id", new_callable=AsyncMock),
+    ):
+        session_manager = CredentialsManager(
+            *credentials,
+            client_session,
+            cache_file=cache_file,
+            refresh_margin=td(minutes=1),
+        )
+
+        req.return_value = {"sessionId": "session_id...", "userInfo": {}}
+
+        assert await session_manager.get_session_id() == "session_id..."
+
+        # a renewal is scheduled for 1 minute before the session id expires
+        timer = session_manager._session_id_refresher._timer
+        assert timer is not None
+        delay = timer.when() - asyncio.get_running_loop().time()
+        assert 900 - 60 - 5 < delay <= 900 - 60
+
+        req.return_value = {"sessionId": "new_session_id...", "userInfo": {}}
+
+        timer._run()  # as if the timer had expired
+        assert session_manager._session_id_refresher._task is not None
+        await session_manager._session_id_refresher._task
+
+        assert req.call_count == 2  # noqa: PLR2004
+
+    assert session_manager.session_id == "new_session_id..."
+    assert session_manager._session_id_refresher._timer is not None  # the next renewal
+
+    session_manager._clear_session_id()
+    assert session_manager._session_id_refresher._timer is None
+
+
+async def test_refresh_session_id_failures(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test an imported session id is renewed, and a failed renewal is retried."""
+
+    with (
+        patch(
+            "evohomeasync.auth.AbstractSessionManager._post_session_id_request",
+            new_callable=AsyncMock,
+        ) as req,
+        patch(
+            "cli.auth.CredentialsManager.save_session_id", new_callable=AsyncMock
+        ) as save,
+    ):
+        session_manager = CredentialsManager(
+            *credentials,
+            client_session,
+            cache_file=cache_file,
+            refresh_margin=td(minutes=1),
+        )
+
+        session_manager._import_session_id(
+            {
+                "session_id": "session_id...",
+                "session_id_expires": (dt.now(tz=UTC) + td(minutes=15)).isoformat(),
+            }
+        )
+
+        # a renewal is scheduled for 1 minute before the imported session id expires
+        timer = session_manager._session_id_refresher._timer
+        assert timer is not None
+        delay = timer.when() - asyncio.get_running_loop().time()
+        assert 900 - 60 - 5 < delay <= 900 - 60
+
+        req.side_effect = TimeoutError()
+
+        timer._run()  # as if the timer had expired
+        assert session_manager._session_id_refresher._task is not None
+        await session_manager._session_id_refresher._task
+
+        # the renewal failed, so is retried soon (the session id is still valid)
+        timer = session_manager._session_id_refresher._timer
+        assert timer is not None
+        delay = timer.when() - asyncio.get_running_loop().time()
+        assert 55 < delay <= 60  # noqa: PLR2004
+
+        req.side_effect = None
+        req.return_value = {"sessionId": "new_session_id...", "userInfo": {}}
+        save.side_effect = exc.ApiRequestFailedError("Not saved")
+
+        timer._run()
+        assert session_manager._session_id_refresher._task is not None
+        await session_manager._session_id_refresher._task
+
+        assert req.call_count == 2  # noqa: PLR2004
+        save.assert_awaited_once()
+
+    # the session id was renewed (but not saved), and the next renewal is scheduled
+    assert session_manager.session_id == "new_session_id..."
+    assert session_manager._session_id_refresher._timer is not None
+
+    session_manager._clear_session_id()
+
+
+async def test_refresh_session_id_margin(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test a refresh_margin not less than the session id's lifetime, and close()."""
+
+    session_manager = CredentialsManager(
+        *credentials,
+        client_session,
+        cache_file=cache_file,
+        refresh_margin=td(minutes=15),
+    )
+
+    session_id: SessionIdEntryT = {
+        "session_id": "session_id...",
+        "session_id_expires": (dt.now(tz=UTC) + td(minutes=15)).isoformat(),
+    }
+
+    # a renewal would be due now (and again, and again...), so is not scheduled
+    session_manager._import_session_id(session_id)
+    assert session_manager._session_id_refresher._timer is None
+
+    session_manager = CredentialsManager(
+        *credentials,
+        client_session,
+        cache_file=cache_file,
+        refresh_margin=td(minutes=1),
+    )
+
+    session_manager._import_session_id(session_id)
+    assert (timer := session_manager._session_id_refresher._timer) is not None
+
+    session_manager.close()  # e.g. before the websession is closed
+    assert timer.cancelled()
+
+
 async def test_session_manager(
     cache_data_expired: CacheDataT,
     cache_data_valid: CacheDataT,
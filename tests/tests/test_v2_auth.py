@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import json
 import logging
 import uuid
+from datetime import UTC, datetime as dt, timedelta as td
 from http import HTTPMethod, HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from aioresponses import aioresponses
 from cli.auth import CredentialsManager
 
+from evohome.helpers import obscure_secrets
+from evohome.rate_limit import RateLimiter
+from evohome.retry import RetryPolicy
 from evohomeasync2 import exceptions as exc
+from evohomeasync2.auth import Auth
 from tests.const import HEADERS_CRED_V2, URL_CRED_V2
 
 from .test_v2_urls_cred import POST_CREDS  # HACK, should be in const.py, or a fixture
@@ -25,6 +32,8 @@ if TYPE_CHECKING:
     from cli.auth import CacheDataT
     from freezegun.api import FrozenDateTimeFactory
 
+    from evohomeasync2.schemas.typedefs import EvoAuthTokensDictT
+
 
 async def test_get_auth_token(
     client_session: aiohttp.ClientSession,
@@ -122,6 +131,384 @@ async def test_get_auth_token(
     assert token_manager.is_token_valid() is False
 
 
+async def test_get_auth_token_concurrently(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test concurrent calls to .get_access_token() share a single fetch."""
+
+    async def post_access_token_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0)  # allow the other callers to (try to) fetch a token
+        return {
+            "access_token": str(uuid.uuid4()),
+            "token_type": "bearer",
+            "expires_in": 1800,
+            "refresh_token": str(uuid.uuid4()),
+        }
+
+    token_manager = CredentialsManager(
+        *credentials, client_session, cache_file=cache_file
+    )
+
+    with (
+        patch(
+            "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+            side_effect=post_access_token_request,
+        ) as req,
+        patch("cli.auth.CredentialsManager.save_access_token", new_callable=AsyncMock),
+    ):
+        tokens = await asyncio.gather(
+            *(token_manager.get_access_token() for _ in range(5))
+        )
+
+        req.assert_called_once()
+
+    assert len(set(tokens)) == 1
+    assert token_manager.is_token_valid() is True
+
+
+async def test_refresh_auth_token(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test the access token is refreshed in the background, before it expires."""
+
+    with (
+        patch(
+            "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+            new_callable=AsyncMock,
+        ) as req,
+        patch("cli.auth.CredentialsManager.save_access_token", new_callable=AsyncMock),
+    ):
+        token_manager = CredentialsManager(
+            *credentials,
+            client_session,
+            cache_file=cache_file,
+            refresh_margin=td(minutes=5),
+        )
+
+        req.return_value = {
+            "access_token": "access_token...",
+            "expires_in": 1800,
+            "refresh_token": "refresh_token...",
+            "token_type": "bearer",
+        }
+
+        assert await token_manager.get_access_token() == "access_token..."
+
+        # a refresh is scheduled for 5 minutes before the token expires
+        timer = token_manager._access_token_refresher._timer
+        assert timer is not None
+        delay = timer.when() - asyncio.get_running_loop().time()
+        assert 1800 - 300 - 5 < delay <= 1800 - 300
+
+        req.return_value = req.return_value | {"access_token": "new_access_token..."}
+
+        timer._run()  # as if the timer had expired
+        assert token_manager._access_token_refresher._task is not None
+        await token_manager._access_token_refresher._task
+
+        assert req.call_count == 2  # noqa: PLR2004
+
+    assert token_manager.access_token == "new_access_token..."  # noqa: S105
+    assert token_manager._access_token_refresher._timer is not None  # the next refresh
+
+    token_manager._clear_access_token()
+    assert token_manager._access_token_refresher._timer is None
+
+
+async def test_refresh_auth_token_failures(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test an imported token is refreshed, and a failed refresh is retried."""
+
+    with (
+        patch(
+            "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+            new_callable=AsyncMock,
+        ) as req,
+        patch(
+            "cli.auth.CredentialsManager.save_access_token", new_callable=AsyncMock
+        ) as save,
+    ):
+        token_manager = CredentialsManager(
+            *credentials,
+            client_session,
+            cache_file=cache_file,
+            refresh_margin=td(minutes=5),
+        )
+
+        token_manager._import_access_token(
+            {
+                "access_token": "access_token...",
+                "access_token_expires": (dt.now(tz=UTC) + td(minutes=30)).isoformat(),
+                "refresh_token": "refresh_token...",
+            }
+        )
+
+        # a refresh is scheduled for 5 minutes before the imported token expires
+        timer = token_manager._access_token_refresher._timer
+        assert timer is not None
+        delay = timer.when() - asyncio.get_running_loop().time()
+        assert 1800 - 300 - 5 < delay <= 1800 - 300
+
+        req.side_effect = exc.ApiRequestFailedError("Service unavailable", status=503)
+
+        timer._run()  # as if the timer had expired
+        assert token_manager._access_token_refresher._task is not None
+        await token_manager._access_token_refresher._task
+
+        # the refresh failed, so is retried soon (the token is still valid)
+        timer = token_manager._access_token_refresher._timer
+        assert timer is not None
+        delay = timer.when() - asyncio.get_running_loop().time()
+        assert 55 < delay <= 60  # noqa: PLR2004
+
+        req.side_effect = None
+        req.return_value = {
+            "access_token": "new_access_token...",
+            "expires_in": 1800,
+            "refresh_token": "refresh_token...",
+            "token_type": "bearer",
+        }
+        save.side_effect = OSError("Disk full")
+
+        timer._run()
+        assert token_manager._access_token_refresher._task is not None
+        await token_manager._access_token_refresher._task
+
+        assert req.call_count == 2  # noqa: PLR2004
+        save.assert_awaited_once()
+
+    # the token was refreshed (but not saved), and the next refresh is scheduled
+    assert token_manager.access_token == "new_access_token..."  # noqa: S105
+    assert token_manager._access_token_refresher._timer is not None
+
+    token_manager._clear_access_token()
+
+
+async def test_refresh_auth_token_margin(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_file: Path,
+) -> None:
+    """Test a refresh_margin not less than the token's lifetime, and close()."""
+
+    with pytest.raises(ValueError, match="refresh_margin"):
+        CredentialsManager(*credentials, client_session, refresh_margin=td(minutes=-1))
+
+    token_manager = CredentialsManager(
+        *credentials,
+        client_session,
+        cache_file=cache_file,
+        refresh_margin=td(minutes=30),
+    )
+
+    token: EvoAuthTokensDictT = {
+        "access_token": "access_token...",
+        "access_token_expires": (dt.now(tz=UTC) + td(minutes=30)).isoformat(),
+        "refresh_token": "refresh_token...",
+    }
+
+    # a refresh would be due now (and again, and again...), so is not scheduled
+    token_manager._import_access_token(token)
+    assert token_manager._access_token_refresher._timer is None
+
+    token_manager = CredentialsManager(
+        *credentials,
+        client_session,
+        cache_file=cache_file,
+        refresh_margin=td(minutes=5),
+    )
+
+    token_manager._import_access_token(token)
+    assert (timer := token_manager._access_token_refresher._timer) is not None
+
+    token_manager.close()  # e.g. before the websession is closed
+    assert timer.cancelled()
+
+
+async def test_request_logging(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the payload of a request is only redacted if it is logged."""
+
+    MAX_LOG_LENGTH = 20
+
+    auth = Auth(credentials_manager, client_session)
+    response = {"name": "My Home", "postcode": "AB1 2CD", "locationId": "1234567"}
+
+    with (
+        patch("evohome.auth.AbstractAuth._make_request", return_value=response),
+        patch("evohome.auth.obscure_secrets", wraps=obscure_secrets) as obs,
+    ):
+        with caplog.at_level(logging.INFO):
+            await auth.get("location/1234567")
+
+        obs.assert_not_called()
+
+        with caplog.at_level(logging.DEBUG):
+            await auth.get("location/1234567")
+
+            assert caplog.records[-1].message.endswith(
+                "{'name': 'My*****', 'postcode': '*** ***', 'locationId': '1234567'}"
+            )
+
+            auth.max_log_length = MAX_LOG_LENGTH
+            await auth.get("location/1234567")
+
+            assert caplog.records[-1].message.endswith(
+                "{'name': 'My*****', ... (67 chars)"
+            )
+
+        # once per logged request, however many handlers formatted the record
+        assert obs.call_count == 2  # noqa: PLR2004
+
+
+async def test_request_rate_limit(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test requests spend the budget of the rate limiter, and a 429 spends the rest."""
+
+    limiter = RateLimiter(1, capacity=2)
+
+    auth = Auth(credentials_manager, client_session, rate_limiter=limiter)
+    url = f"{auth.url_base}/location/1234567"
+
+    with (
+        patch("evohomeasync2.auth.Auth._headers", return_value={}),
+        aioresponses() as rsp,
+    ):
+        rsp.get(url, payload={"locationId": "1234567"})
+        rsp.get(url, status=HTTPStatus.TOO_MANY_REQUESTS)
+
+        await auth.get("location/1234567")
+        assert limiter.remaining(auth.hostname) == pytest.approx(1, abs=0.1)
+
+        with pytest.raises(exc.ApiRequestFailedError) as err:
+            await auth.get("location/1234567")
+
+    assert err.value.status == HTTPStatus.TOO_MANY_REQUESTS
+    assert limiter.remaining(auth.hostname) == pytest.approx(0, abs=0.1)
+
+
+async def test_request_retries(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test transient failures are retried (as per the policy), then short-circuited."""
+
+    policy = RetryPolicy(max_attempts=3, breaker_threshold=3)
+
+    auth = Auth(credentials_manager, client_session, retry_policy=policy)
+    url = f"{auth.url_base}/location/1234567"
+
+    with (
+        patch("evohomeasync2.auth.Auth._headers", return_value={}),
+        patch("evohome.auth.asyncio.sleep") as sleep,
+        aioresponses() as rsp,
+    ):
+        # a GET is retried, after the delay asked for by the server
+        rsp.get(
+            url, status=HTTPStatus.SERVICE_UNAVAILABLE, headers={"Retry-After": "2"}
+        )
+        rsp.get(url, payload={"locationId": "1234567"})
+
+        assert await auth.get("location/1234567") == {"location_id": "1234567"}
+        sleep.assert_awaited_once_with(2.0)
+
+        # a PUT is not retried (by default)
+        rsp.put(url, status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        with pytest.raises(exc.ApiRequestFailedError) as err:
+            await auth.put("location/1234567", json={})
+        assert err.value.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+        # after 3 consecutive failures, the circuit is opened (the GET is not sent)
+        rsp.get(url, status=HTTPStatus.BAD_GATEWAY, repeat=True)
+
+        with pytest.raises(exc.ApiRequestFailedError) as err:
+            await auth.get("location/1234567")
+        assert err.value.status is None
+        assert "has failed too many times" in str(err.value)
+
+    assert sum(len(v) for v in rsp.requests.values()) == 5  # noqa: PLR2004
+
+
+async def test_request_coalescing(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test concurrent identical GETs share a single request (and its response)."""
+
+    auth = Auth(credentials_manager, client_session)
+
+    async def make_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0)  # allow the other GETs to start
+        return {"locationId": "1234567"}
+
+    with patch(
+        "evohome.auth.AbstractAuth._make_request", side_effect=make_request
+    ) as req:
+        rsp_1, rsp_2, rsp_3 = await asyncio.gather(
+            auth.get("location/1234567"),
+            auth.get("location/1234567"),
+            auth.get("location/7654321"),
+        )
+
+        assert req.call_count == 2  # noqa: PLR2004
+        assert rsp_1 == rsp_2
+        assert rsp_1 is not rsp_2  # a copy, so it can't be corrupted by the other
+        assert rsp_1 is not rsp_3
+
+        await auth.get("location/1234567")  # is not cached, once completed
+        assert req.call_count == 3  # noqa: PLR2004
+
+
+async def test_request_coalescing_cancelled(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test a failed request is retrieved, even if all its callers are cancelled."""
+
+    auth = Auth(credentials_manager, client_session)
+
+    async def make_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0.01)  # the callers are cancelled before it fails
+        raise exc.ApiRequestFailedError("Not found", status=HTTPStatus.NOT_FOUND)
+
+    loop = asyncio.get_running_loop()
+    errors: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+
+    try:
+        with patch("evohome.auth.AbstractAuth._make_request", side_effect=make_request):
+            callers = [asyncio.create_task(auth.get("location/1234567")) for _ in "12"]
+            await asyncio.sleep(0)  # allow the GETs to start
+
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+
+            await asyncio.sleep(0.02)  # allow the (shielded) request to fail
+            assert not auth._pending_gets
+
+        del callers, caller
+        gc.collect()  # else, the unretrieved exception is logged only when collected
+
+    finally:
+        loop.set_exception_handler(None)
+
+    assert not errors  # i.e. no "Task exception was never retrieved"
+
+
 async def test_token_manager(
     cache_data_expired: CacheDataT,
     cache_data_valid: CacheDataT,
@@ -242,3 +629,50 @@ async def test_token_manager(
         wrt.assert_called_once()
 
     assert token_manager.is_token_valid() is True
+
+
+async def test_token_manager_save_all(
+    client_session: aiohttp.ClientSession,
+    tmp_path: Path,
+) -> None:
+    """Test the tokens of many (non-autosaving) managers are saved in one write."""
+
+    cache_file = tmp_path / ".evo-cache.tst"
+
+    managers = [
+        CredentialsManager(
+            f"user_{i}@gmail.com",
+            "password",
+            client_session,
+            cache_file=cache_file,
+            autosave=False,
+        )
+        for i in range(3)
+    ]
+
+    for i, manager in enumerate(managers[:2]):  # the last failed to authenticate
+        manager._import_access_token(
+            {
+                "access_token": f"access_token_{i}...",
+                "access_token_expires": (dt.now(tz=UTC) + td(minutes=30)).isoformat(),
+                "refresh_token": "refresh_token...",
+            }
+        )
+
+    await managers[0].save_access_token()  # does nothing (autosave is False)
+    assert not cache_file.exists()
+
+    await CredentialsManager.save_all(managers)
+
+    cache = json.loads(cache_file.read_text())
+    assert list(cache) == [m.client_id for m in managers[:2]]
+
+    loaded = [
+        CredentialsManager(
+            m.client_id, "password", client_session, cache_file=cache_file
+        )
+        for m in managers
+    ]
+    await CredentialsManager.load_all(loaded)
+
+    assert [m.access_token for m in loaded] == [m.access_token for m in managers]
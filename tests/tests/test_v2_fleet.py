@@ -0,0 +1,149 @@
+"""Tests for evohome-async - validate the fleet manager (of many clients)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta as td
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from evohome.rate_limit import Priority, RateLimiter, TokenBucket
+from evohomeasync2 import EvohomeClient, FleetManager, exceptions as exc
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from tests.conftest import CredentialsManager
+
+
+ACCOUNT_IDS = ("account_1", "account_2", "account_3")
+
+
+async def test_token_bucket() -> None:
+    """Test the token bucket allows a burst, and then delays at its rate."""
+
+    bucket = TokenBucket(2, capacity=2)  # 2 tokens per second
+
+    with patch("evohome.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert sleep.call_count == 0
+        assert not bucket.try_acquire()
+
+        await bucket.acquire()  # is reserved, so the bucket is now negative
+
+    assert sleep.call_count == 1
+    assert sleep.call_args.args[0] == pytest.approx(0.5, abs=0.05)
+    assert bucket.tokens < 0
+
+    with pytest.raises(ValueError, match="rate must be"):
+        TokenBucket(0)
+
+
+async def test_rate_limiter() -> None:
+    """Test the rate limiter sends waiting requests in order of priority."""
+
+    limiter = RateLimiter(100, capacity=1, budgets={"other.host": 1})
+    order: list[str] = []
+
+    async def request(name: str, priority: Priority) -> None:
+        await limiter.acquire("tcc.host", priority)
+        order.append(name)
+
+    await limiter.acquire("tcc.host")  # spend the budget, so later requests will wait
+    await limiter.acquire("other.host")  # each host has its own budget
+
+    await asyncio.gather(
+        request("poll_1", Priority.POLL),
+        request("poll_2", Priority.POLL),
+        request("write", Priority.WRITE),
+    )
+
+    assert order == ["write", "poll_1", "poll_2"]
+    assert limiter.num_waiting("tcc.host") == 0
+    assert limiter.remaining("other.host") < 1
+
+
+async def test_fleet_accounts(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test the fleet's clients share its ClientSession, and are staggered."""
+
+    fleet = FleetManager(client_session, poll_interval=td(seconds=60))
+
+    for account_id in ACCOUNT_IDS:
+        client = fleet.add_account(account_id, credentials_manager)
+        assert isinstance(client, EvohomeClient)
+        assert client.auth.websession is client_session
+
+    assert list(fleet.clients) == list(ACCOUNT_IDS)
+
+    with pytest.raises(exc.ConfigError):
+        fleet.add_account(ACCOUNT_IDS[0], credentials_manager)
+
+    offsets = {fleet._poll_offset(a) for a in ACCOUNT_IDS}
+    assert len(offsets) == len(ACCOUNT_IDS)
+    assert all(0 <= o < 60 for o in offsets)  # noqa: PLR2004
+
+    await fleet.remove_account(ACCOUNT_IDS[0])
+    assert list(fleet.clients) == list(ACCOUNT_IDS[1:])
+
+    with pytest.raises(exc.ConfigError):
+        await fleet.remove_account(ACCOUNT_IDS[0])
+
+    with pytest.raises(ValueError, match="poll_interval must be"):
+        FleetManager(client_session, poll_interval=td(0))
+
+
+async def test_fleet_polling(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test the fleet polls each of its accounts, and tolerates failed polls."""
+
+    fleet = FleetManager(client_session, poll_interval=td(seconds=0.02))
+
+    for account_id in ACCOUNT_IDS:
+        fleet.add_account(account_id, credentials_manager)
+
+    update = AsyncMock(side_effect=exc.ApiRequestFailedError("Not available"))
+
+    with patch.object(EvohomeClient, "update", new=update):
+        fleet.start()
+        assert fleet.is_polling
+
+        await asyncio.sleep(0.1)
+        await fleet.stop()
+
+    assert fleet._poll_tasks == {}  # i.e. not fleet.is_polling
+    assert update.call_count >= len(ACCOUNT_IDS) * 2
+
+
+async def test_fleet_polling_unexpected_error(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: CredentialsManager,
+) -> None:
+    """Test the fleet keeps polling an account after an unexpected error."""
+
+    fleet = FleetManager(client_session, poll_interval=td(seconds=0.02))
+    fleet.add_account(ACCOUNT_IDS[0], credentials_manager)
+
+    async def update_once(self: EvohomeClient) -> None:
+        if update.call_count == 1:
+            raise TypeError("Bad payload")
+
+    update = AsyncMock(side_effect=update_once, autospec=True)
+
+    with patch.object(EvohomeClient, "update", new=update):
+        fleet.start()
+
+        await asyncio.sleep(0.07)
+        assert not fleet._poll_tasks[ACCOUNT_IDS[0]].done()
+
+        await fleet.stop()
+
+    assert update.call_count >= 2  # noqa: PLR2004
@@ -0,0 +1,411 @@
+"""Tests for evohome-async - validate the status update of the v2 entity hierarchy."""
+
+from __future__ import annotations
+
+import asyncio
+from copy import deepcopy
+from datetime import datetime as dt
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, patch
+
+import pytest
+import voluptuous as vol
+
+from evohome.helpers import convert_keys_and_dtm_strs
+from evohomeasync2 import EntityEvent, EventType, Location, ValidationPolicy
+from evohomeasync2.const import (
+    SZ_GATEWAYS,
+    SZ_LOCATION_ID,
+    SZ_SETPOINT_STATUS,
+    SZ_TARGET_HEAT_TEMPERATURE,
+    SZ_TEMPERATURE_CONTROL_SYSTEMS,
+    SZ_ZONES,
+)
+from evohomeasync2.schemas import TCC_GET_LOC_STATUS
+from evohomeasync2.schemas.status import STATUS_DTM_KEYS
+from tests.conftest import EvohomeClientv2
+
+from .conftest import FIXTURES_V2, auth_get, location_status_fixture
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+
+    from tests.conftest import CredentialsManager
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    folders = [
+        p for p in Path(FIXTURES_V2).glob("*") if p.is_dir() and p.name == "system_004"
+    ]
+    metafunc.parametrize(
+        "fixture_folder", sorted(folders), ids=(p.name for p in sorted(folders))
+    )
+
+
+MAX_CONCURRENCY = 3  # system_004 has 4 locations
+
+NUM_UPDATES = 4  # system_004 has 4 locations, so 16 GETs of the same URL template
+SAMPLE_RATE = 2
+
+NUM_VALIDATIONS = {  # of the location status schema, for the above
+    ValidationPolicy.ALWAYS: 16,
+    ValidationPolicy.FIRST: 1,
+    ValidationPolicy.SAMPLED: 8,
+    ValidationPolicy.NEVER: 0,
+}
+
+
+async def test_update_concurrent(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test EvohomeClient.update() fetches the location statuses concurrently."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    get = auth_get(fixture_folder)
+    in_flight: list[str] = []
+    max_in_flight = 0
+
+    async def concurrent_get(
+        self: Any, url: str, schema: vol.Schema | None = None, **kwargs: Any
+    ) -> Any:
+        nonlocal max_in_flight
+
+        in_flight.append(url)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0)  # allow the other GETs to start
+        in_flight.remove(url)
+
+        return await get(self, url, schema, **kwargs)
+
+    with patch("evohomeasync2.auth.Auth.get", get):
+        evo_serial = EvohomeClientv2(credentials_manager)
+        await evo_serial.update()
+
+    with patch("evohomeasync2.auth.Auth.get", concurrent_get):
+        evo = EvohomeClientv2(credentials_manager, max_concurrency=MAX_CONCURRENCY)
+        await evo.update()
+
+    assert len(evo.locations) > MAX_CONCURRENCY
+    assert max_in_flight == MAX_CONCURRENCY
+
+    for loc, loc_serial in zip(evo.locations, evo_serial.locations, strict=True):
+        assert loc.status == loc_serial.status
+
+
+async def test_update_status_normalised(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test Location.update() returns snake_case keys and TZ-aware datetimes."""
+
+    def dtm_strs(data: Any) -> list[str]:
+        if isinstance(data, list):
+            return [d for i in data for d in dtm_strs(i)]
+        if not isinstance(data, dict):
+            return []
+        return [
+            d
+            for k, v in data.items()
+            for d in ([v] if k in STATUS_DTM_KEYS else dtm_strs(v))
+        ]
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        evo = EvohomeClientv2(credentials_manager)
+        await evo.update(dont_update_status=True)
+
+        dtms: list[str] = []
+
+        for loc in evo.locations:
+            status = await loc.update()
+
+            # the status is not mutated as it is cascaded down the entity hierarchy
+            assert status[SZ_LOCATION_ID] == loc.id
+            assert set(status) - set(loc.status) == {SZ_GATEWAYS}
+
+            dtms.extend(dtm_strs(status))
+
+    assert dtms  # e.g. since, until
+    assert all(dt.fromisoformat(d).tzinfo is not None for d in dtms)
+
+
+async def test_update_status_once(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test each location's status is converted and cascaded once per update."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        evo = EvohomeClientv2(credentials_manager)
+        await evo.update(dont_update_status=True)
+
+        with (
+            patch(
+                "evohomeasync2.location.convert_keys_and_dtm_strs",
+                wraps=convert_keys_and_dtm_strs,
+            ) as cnv,
+            patch.object(
+                Location,
+                "_update_status",
+                autospec=True,
+                side_effect=Location._update_status,
+            ) as upd,
+        ):
+            await evo.update()
+
+    assert cnv.call_count == len(evo.locations)
+    assert upd.call_count == len(evo.locations)
+
+
+async def test_update_status_shared(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the status is shared by the entities (not copied), and never mutated."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        evo = EvohomeClientv2(credentials_manager)
+        await evo.update(dont_update_status=True)
+
+        loc = evo.locations[0]
+        status = await loc.update()
+
+    gwy_status = status[SZ_GATEWAYS][0]
+    tcs_status = gwy_status[SZ_TEMPERATURE_CONTROL_SYSTEMS][0]
+
+    gwy = loc.gateways[0]
+    tcs = gwy.systems[0]
+
+    assert loc.full_status is status
+    assert gwy.full_status is gwy_status
+    assert tcs.full_status is tcs_status
+    assert tcs.zones[0].full_status is tcs_status[SZ_ZONES][0]
+    assert tcs.system_mode_status is tcs_status["system_mode_status"]
+
+    # a later update doesn't mutate the earlier status
+    saved_status = deepcopy(status)
+
+    new_status = deepcopy(status)
+    zon_status = new_status[SZ_GATEWAYS][0][SZ_TEMPERATURE_CONTROL_SYSTEMS][0][SZ_ZONES]
+    zon_status[0][SZ_SETPOINT_STATUS][SZ_TARGET_HEAT_TEMPERATURE] += 1
+
+    loc._update_status(new_status)
+
+    assert status == saved_status
+    assert loc.full_status is new_status
+
+
+async def test_update_status_record(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the parsed status of each DHW/zone agrees with its status dict."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        evo = EvohomeClientv2(credentials_manager)
+        await evo.update()
+
+    children = [
+        c
+        for loc in evo.locations
+        for gwy in loc.gateways
+        for tcs in gwy.systems
+        for c in [*tcs.zones, *([tcs.hotwater] if tcs.hotwater else [])]
+    ]
+    assert any(not c.temperature_status["is_available"] for c in children)
+
+    for child in children:
+        status = child.full_status
+
+        assert child.temperature_status is status["temperature_status"]  # not a copy
+        assert child.temperature == status["temperature_status"].get("temperature")
+        assert child.active_faults == tuple(status["active_faults"])
+
+
+async def test_update_changed_entities(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test only the entities with a changed status are reported as changed."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        evo = EvohomeClientv2(credentials_manager)
+        await evo.update()
+
+        loc = evo.locations[0]
+        tcs = loc.gateways[0].systems[0]
+
+        # the first status update changes every entity
+        assert set(loc.changed_entities) == {
+            loc,
+            *loc.gateways,
+            *(t for g in loc.gateways for t in g.systems),
+            *(z for g in loc.gateways for t in g.systems for z in t.zones),
+            *(t.hotwater for g in loc.gateways for t in g.systems if t.hotwater),
+        }
+
+        # an unchanged status changes no entities
+        status = await loc.update()
+        assert loc.changed_entities == ()
+
+    status = deepcopy(status)
+    zon_status = status[SZ_GATEWAYS][0][SZ_TEMPERATURE_CONTROL_SYSTEMS][0][SZ_ZONES][0]
+    zon_status[SZ_SETPOINT_STATUS][SZ_TARGET_HEAT_TEMPERATURE] += 1
+
+    assert loc._update_status(status) == [tcs.zones[0]]
+    assert (
+        tcs.zones[0].target_heat_temperature
+        == (zon_status[SZ_SETPOINT_STATUS][SZ_TARGET_HEAT_TEMPERATURE])
+    )
+
+
+async def test_update_events(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the change events emitted as the entities' status is updated."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        evo = EvohomeClientv2(credentials_manager)
+        await evo.update(dont_update_status=True)
+
+        loc = evo.locations[0]
+        zone = loc.gateways[0].systems[0].zones[0]
+
+        events: list[EntityEvent] = []
+        remove_listener = zone.add_listener(events.append)
+
+        # the first status update emits an event for every part of the status
+        status = await loc.update()
+        assert [e.type for e in events] == [EventType.TEMPERATURE, EventType.SETPOINT]
+        assert all(e.entity is zone and e.old is None for e in events)
+
+    events.clear()
+
+    status = deepcopy(status)
+    zon_status = status[SZ_GATEWAYS][0][SZ_TEMPERATURE_CONTROL_SYSTEMS][0][SZ_ZONES][0]
+    zon_status[SZ_SETPOINT_STATUS][SZ_TARGET_HEAT_TEMPERATURE] += 1
+    zon_status["active_faults"] = [
+        {"fault_type": "TempZoneActuatorLowBattery", "since": "2025-01-01T00:00:00"}
+    ]
+
+    loc._update_status(status)
+
+    assert [(e.type, e.old, e.new) for e in events] == [
+        (EventType.FAULT_RAISED, None, zon_status["active_faults"][0]),
+        (
+            EventType.SETPOINT,
+            zone.status[SZ_SETPOINT_STATUS]
+            | {SZ_TARGET_HEAT_TEMPERATURE: zone.target_heat_temperature - 1},
+            zon_status[SZ_SETPOINT_STATUS],
+        ),
+    ]
+
+    # a removed listener is no longer called
+    events.clear()
+    remove_listener()
+
+    status = deepcopy(status)
+    zon_status = status[SZ_GATEWAYS][0][SZ_TEMPERATURE_CONTROL_SYSTEMS][0][SZ_ZONES][0]
+    zon_status["active_faults"] = []
+
+    loc._update_status(status)
+
+    assert events == []
+    assert zone.active_faults == ()
+
+
+async def _updated_client(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    schema: Mock,
+    **kwargs: Any,
+) -> EvohomeClientv2:
+    """Return a client after NUM_UPDATES updates of (the status of) its locations."""
+
+    async def request(self: Any, method: str, url: str, /, **kwargs: Any) -> Any:
+        return location_status_fixture(fixture_folder, url.split("/")[1])
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        evo = EvohomeClientv2(credentials_manager, **kwargs)
+        await evo.update(dont_update_status=True)
+
+    with (
+        patch("evohome.auth.AbstractAuth.request", request),
+        patch("evohomeasync2.location.TCC_GET_LOC_STATUS", schema),
+    ):
+        for _ in range(NUM_UPDATES):
+            await evo.update()
+
+    return evo
+
+
+@pytest.mark.parametrize("validation", ValidationPolicy)
+async def test_update_validation(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+    validation: ValidationPolicy,
+) -> None:
+    """Test the client's validation policy for the schema of GET responses."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    schema = Mock(wraps=TCC_GET_LOC_STATUS)
+
+    evo = await _updated_client(
+        credentials_manager,
+        fixture_folder,
+        schema,
+        validation=validation,
+        sample_rate=SAMPLE_RATE,
+    )
+
+    assert schema.call_count == NUM_VALIDATIONS[validation]
+    assert evo.auth.validation_failures == {}
+
+
+async def test_update_validation_failures(
+    credentials_manager: CredentialsManager,
+    fixture_folder: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test validation failures are counted (and don't prevent further validation)."""
+
+    freezer.move_to("2025-01-01T00:00:00+00:00")
+
+    schema = Mock(side_effect=vol.Invalid("invalid"))
+
+    evo = await _updated_client(
+        credentials_manager,
+        fixture_folder,
+        schema,
+        validation=ValidationPolicy.FIRST,
+    )
+
+    # all responses are validated, as none are valid
+    assert schema.call_count == NUM_VALIDATIONS[ValidationPolicy.ALWAYS]
+    assert evo.auth.validation_failures == {
+        "location/{id}/status?includeTemperatureControlSystems=True": schema.call_count
+    }